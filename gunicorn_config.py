@@ -1,5 +1,14 @@
+import os
+
 bind = "0.0.0.0:10000"
 workers = 4
 threads = 4
-worker_class = "sync"
-timeout = 300 
\ No newline at end of file
+# Threads let one worker serve the callbacks fired by a finished simulation side by side
+worker_class = "gthread"
+timeout = 300
+
+
+def post_fork(server, worker):
+    # Monte Carlo trials run in parallel (numba prange) inside each worker; give each
+    # worker an even share of the cores so concurrent simulations don't oversubscribe
+    os.environ.setdefault("NUMBA_NUM_THREADS", str(max(1, (os.cpu_count() or 1) // workers)))
@@ -1,20 +1,152 @@
+import functools
+import hashlib
+import os
+import threading
+import uuid
+from types import MappingProxyType
+from concurrent.futures import Future
+
 import dash
+import flask
 from dash import dcc, html, Input, Output, State, dash_table
-import plotly.express as px
+from dash.exceptions import PreventUpdate
 import plotly.graph_objects as go
-import pandas as pd
+import plotly.io as pio
+from flask.json.provider import DefaultJSONProvider
 import numpy as np
-import time
-import random
-import argparse
+
+# orjson is optional: without it callback payloads go through the standard json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# On-disk caches (background callback results, memoized simulations) live under here
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+
+# Background callback results are cached per inputs for the lifetime of this server launch
+launch_uid = uuid.uuid4()
+
+# diskcache is optional: with it (dash[diskcache]) simulations run as background callbacks
+# in a separate process instead of blocking the request thread
+try:
+    import diskcache
+    from dash import DiskcacheManager
+    background_callback_manager = DiskcacheManager(
+        diskcache.Cache(CACHE_DIR),
+        cache_by=[lambda: launch_uid],
+        expire=3600
+    )
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    background_callback_manager = None
+    DISKCACHE_AVAILABLE = False
+
+# Celery is optional: when REDIS_URL is set (and dash[celery] is installed), background
+# callbacks are queued to Celery workers, which can run on their own cores or machines:
+#   celery -A simple_app:celery_app worker
+# Memoized results and the locks that coalesce identical runs then live in Redis as well,
+# so workers on other machines share them
+REDIS_URL = os.environ.get('REDIS_URL')
+celery_app = None
+redis_client = None
+if REDIS_URL:
+    try:
+        import redis
+        from celery import Celery
+        from dash import CeleryManager
+        redis_client = redis.Redis.from_url(REDIS_URL)
+        celery_app = Celery(__name__, broker=REDIS_URL, backend=REDIS_URL)
+        background_callback_manager = CeleryManager(
+            celery_app,
+            cache_by=[lambda: launch_uid],
+            expire=3600
+        )
+    except ImportError:
+        pass
+
+# Flask-Caching is optional: with it, simulation results are memoized on disk and shared
+# by every gunicorn worker and background job, instead of living in one process's memory
+try:
+    from flask_caching import Cache
+    FLASK_CACHING_AVAILABLE = True
+except ImportError:
+    FLASK_CACHING_AVAILABLE = False
 
 # Import the simplified model
-from simple_isa_model import run_simple_simulation
+from simple_isa_model import run_simple_simulation, run_blended_simulations, warm_up
+
+# Without a background manager simulations run in this process, so compile the kernel now;
+# otherwise background jobs are forked from this process, which must not start Numba's threads
+if background_callback_manager is None:
+    warm_up()
+
+class StaticLayoutDash(dash.Dash):
+    """
+    Dash app that serializes its (static) layout to JSON once instead of on every page load.
+    
+    The layout tree is built once at import; without this, each /_dash-layout request walks
+    and re-encodes all of it. The cached JSON is dropped if app.layout is reassigned.
+    """
+    _layout_json_cache = (None, None)
+    
+    def serve_layout(self):
+        if self._layout_is_function:
+            return super().serve_layout()
+        layout, layout_json = self._layout_json_cache
+        if layout is not self._layout:
+            layout_json = pio.json.to_json_plotly(self._layout_value())
+            self._layout_json_cache = (self._layout, layout_json)
+        return flask.Response(layout_json, mimetype="application/json")
 
 # Initialize the Dash app
-app = dash.Dash(__name__, suppress_callback_exceptions=True)
+app = StaticLayoutDash(
+    __name__,
+    suppress_callback_exceptions=True,
+    background_callback_manager=background_callback_manager
+)
 server = app.server  # Expose the server variable for production
 
+if FLASK_CACHING_AVAILABLE and celery_app is not None:
+    cache = Cache(server, config={
+        'CACHE_TYPE': 'RedisCache',
+        'CACHE_REDIS_URL': REDIS_URL,
+        'CACHE_KEY_PREFIX': 'simulations:',
+        'CACHE_DEFAULT_TIMEOUT': 3600
+    })
+    memoize_simulation = cache.memoize()
+elif FLASK_CACHING_AVAILABLE:
+    cache = Cache(server, config={
+        'CACHE_TYPE': 'FileSystemCache',
+        'CACHE_DIR': os.path.join(CACHE_DIR, 'simulations'),
+        'CACHE_DEFAULT_TIMEOUT': 3600
+    })
+    memoize_simulation = cache.memoize()
+elif DISKCACHE_AVAILABLE:
+    # Without Flask-Caching, keep the on-disk memoization (so results survive worker
+    # restarts) using the diskcache package that background callbacks already need
+    memoize_simulation = diskcache.Cache(os.path.join(CACHE_DIR, 'simulations')).memoize(expire=3600)
+else:
+    memoize_simulation = functools.lru_cache(maxsize=32)
+
+if ORJSON_AVAILABLE:
+    class ORJSONProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson, used to parse callback requests."""
+        
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(
+                obj, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+    
+    server.json_provider_class = ORJSONProvider
+    server.json = ORJSONProvider(server)
+    # Dash encodes callback responses with Plotly's JSON helper; pin it to orjson as well
+    pio.json.config.default_engine = 'orjson'
+
 # Enable the app to be embedded in an iframe
 app.index_string = '''
 <!DOCTYPE html>
@@ -52,6 +184,21 @@ sim_options = [
     {'label': '100 simulations (recommended)', 'value': 100}
 ]
 
+# Dropdown options for the number of blended Monte Carlo simulations
+blended_sim_options = [
+    {'label': '100 simulations (faster)', 'value': 100},
+    {'label': '500 simulations', 'value': 500},
+    {'label': '1000 simulations (recommended)', 'value': 1000}
+]
+
+# Dropdown options for each blended scenario's type (shared by all three scenario dropdowns)
+scenario_type_options = [
+    {'label': 'Baseline', 'value': 'baseline'},
+    {'label': 'Conservative', 'value': 'conservative'},
+    {'label': 'Optimistic', 'value': 'optimistic'},
+    {'label': 'Custom', 'value': 'custom'}
+]
+
 # Define the preset scenarios from the original notebook
 preset_scenarios = {
     'uganda_baseline': {
@@ -110,360 +257,477 @@ preset_scenarios = {
     }
 }
 
+# Presets are read-only: freeze them (degree mixes included) so no callback can mutate them
+preset_scenarios = MappingProxyType({
+    name: MappingProxyType({**preset, 'degrees': MappingProxyType(preset['degrees'])})
+    for name, preset in preset_scenarios.items()
+})
+
+# Dropdown options for the preset scenarios
+preset_options = [{'label': preset['name'], 'value': name} for name, preset in preset_scenarios.items()]
+
+# Rows of the editable degree-params table: degree key, label, and default share (%),
+# average salary, salary standard deviation and experience growth (%)
+_DEGREE_TABLE_DEFAULTS = [
+    {'key': 'BA', 'degree': "Bachelor's (BA)", 'pct': 45, 'salary': 41300, 'std': 6000, 'growth': 3.0},
+    {'key': 'MA', 'degree': "Master's (MA)", 'pct': 24, 'salary': 46709, 'std': 6600, 'growth': 4.0},
+    {'key': 'ASST', 'degree': "Assistant Track (ASST)", 'pct': 0, 'salary': 31500, 'std': 2800, 'growth': 0.5},
+    {'key': 'ASST_SHIFT', 'degree': "Assistant Shift (ASST_SHIFT)", 'pct': 27, 'salary': 31500, 'std': 2800, 'growth': 0.5},
+    {'key': 'NURSE', 'degree': "Nursing (NURSE)", 'pct': 0, 'salary': 40000, 'std': 4000, 'growth': 2.0},
+    {'key': 'TRADE', 'degree': "Trade (TRADE)", 'pct': 0, 'salary': 35000, 'std': 5000, 'growth': 2},
+    {'key': 'NA', 'degree': "No Degree (NA)", 'pct': 4, 'salary': 2200, 'std': 640, 'growth': 1},
+]
+_DEGREE_TABLE_COLUMNS = [{'name': 'Degree Type', 'id': 'degree', 'editable': False}] + [
+    {'name': name, 'id': column_id, 'type': 'numeric', 'on_change': {'action': 'coerce', 'failure': 'reject'}}
+    for name, column_id in [('Percentage (%)', 'pct'), ('Avg Salary ($)', 'salary'),
+                            ('Std Dev ($)', 'std'), ('Growth Rate (%)', 'growth')]
+]
+_DEGREE_TABLE_FIELDS = ('pct', 'salary', 'std', 'growth')
+
+# Degree shares (percentages) of every preset as one (presets x degrees) array: row i is
+# preset _PRESET_NAMES[i], columns follow the degree-params table row order
+_PRESET_NAMES = tuple(preset_scenarios)
+_PRESET_INDEX = MappingProxyType({name: i for i, name in enumerate(_PRESET_NAMES)})
+_PRESET_DEGREE_PCTS = np.array(
+    [[preset_scenarios[name]['degrees'].get(row['key'], 0) for row in _DEGREE_TABLE_DEFAULTS]
+     for name in _PRESET_NAMES],
+    dtype=np.float64
+) * 100
+_PRESET_DEGREE_PCTS.setflags(write=False)
+
+# Default ISA percentage (%), threshold, cap and price per student for each program type
+_PROGRAM_ISA_DEFAULTS = MappingProxyType({
+    'Uganda': (14, 27000, 72500, 29000),
+    'Kenya': (12, 27000, 49950, 16650),
+    'Rwanda': (12, 27000, 45000, 16650),  # Changed from 10% to 12%
+})
+
+# Everything the preset dropdown fills in, shipped once in the presets-store so that
+# selecting a preset is applied in the browser
+_PRESETS_STORE_DATA = {
+    name: {
+        'description': preset['description'],
+        'program_type': preset['program_type'],
+        'degree_pcts': _PRESET_DEGREE_PCTS[_PRESET_INDEX[name]].tolist(),
+        'isa_params': _PROGRAM_ISA_DEFAULTS.get(preset['program_type'], (12, 27000, 50000, 20000)),
+    }
+    for name, preset in preset_scenarios.items()
+}
+
+
+def _degree_table_params(rows, key):
+    """Return the (pct, salary, std, growth) entries of one degree's row of the degree-params table."""
+    row = next((row for row in rows or [] if row.get('key') == key), {})
+    return tuple(row.get(field) for field in _DEGREE_TABLE_FIELDS)
+
+# Layout shared by the result graphs: plain white template with the legend above the plot
+_LEGEND_TOP = dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+_BASE_LAYOUT = dict(template="plotly_white", legend=_LEGEND_TOP)
+
+# Figure skeletons for the result graphs, built (and validated by Plotly) once at import.
+# Clientside callbacks copy them in the browser, filling in only trace data and titles.
+_PAYMENT_DISTRIBUTION_FIGURE = go.Figure(
+    data=[go.Bar(
+        x=[],
+        y=[],
+        name="Average Payment by Year",
+        marker_color='rgb(55, 83, 109)',
+        hovertemplate="Year: %{x}<br>Average Payment: $%{y:,.0f}<extra></extra>"
+    )],
+    layout=go.Layout(
+        title=dict(text="Average Payments by Year"),
+        xaxis_title="Year",
+        yaxis_title="Payment Amount ($)",
+        **_BASE_LAYOUT
+    )
+)
+
+# Bars are ordered: total real, total nominal, investor real, investor nominal
+_IRR_COMPARISON_FIGURE = go.Figure(
+    data=[
+        go.Bar(x=['Total IRR (before fees)'], y=[0], name='Real', marker_color='rgb(55, 83, 109)', textposition='auto'),
+        go.Bar(x=['Total IRR (before fees)'], y=[0], name='Nominal', marker_color='rgb(26, 118, 255)', textposition='auto'),
+        go.Bar(x=['Investor IRR'], y=[0], name='Real', marker_color='rgb(55, 83, 109)', textposition='auto', showlegend=False),
+        go.Bar(x=['Investor IRR'], y=[0], name='Nominal', marker_color='rgb(26, 118, 255)', textposition='auto', showlegend=False)
+    ],
+    layout=go.Layout(
+        title=dict(text='Real vs Nominal IRR Comparison'),
+        xaxis_title='IRR Type',
+        yaxis_title='IRR (%)',
+        barmode='group',
+        **_BASE_LAYOUT
+    )
+)
+
+# Shared styles for the ISA parameter input row
+_QUARTER_CELL_STYLE = {'width': '25%', 'display': 'inline-block'}
+_FULL_WIDTH_STYLE = {'width': '100%'}
+
+
+def _input_cell(input_id, value, **input_props):
+    """Return one quarter-width cell holding a full-width non-negative numeric input."""
+    return html.Div([
+        dcc.Input(id=input_id, type="number", value=value, min=0, style=_FULL_WIDTH_STYLE, **input_props)
+    ], style=_QUARTER_CELL_STYLE)
+
+# Contents of the About tab. They are sent to the browser by load_about_tab() the first
+# time the tab is shown instead of being part of the initial layout
+_ABOUT_TAB_CHILDREN = html.Div([
+    html.H1("ISA Analysis Tool", style={'textAlign': 'center', 'marginBottom': '30px', 'color': '#2c3e50'}),
+    
+    # Background Section
+    html.Div([
+        html.H2("Background", style={'color': '#2c3e50', 'borderBottom': '1px solid #eee', 'paddingBottom': '10px'}),
+        html.P([
+            "Income Share Agreements (ISAs) represent an innovative approach to educational financing where students receive funding for their education in exchange for a percentage of their future income over a defined period. ",
+            "Unlike traditional loans with fixed repayments regardless of outcomes, ISAs align incentives between funders and students—payments scale with a graduate's actual earnings success."
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+        html.P([
+            html.A("Malengo", href="https://www.malengo.org", target="_blank"), 
+            " is a nonprofit organization that connects talented students from developing countries with educational opportunities abroad through ISA financing. ",
+            "The organization's mission focuses on reducing barriers to migration—a strategy with enormous potential impact, as research suggests the estimated global gains from reducing migration barriers dwarf those related to other policy restrictions by one or two orders of magnitude."
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+    
+        html.H3("The Malengo Model", style={'color': '#2c3e50', 'marginTop': '20px'}),
+        html.P([
+            "Malengo currently operates a Uganda–Germany Program that prepares academically talented but financially constrained students from Uganda for admission to English-speaking Bachelor's programs at German universities. The organization:"
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+        html.Ul([
+            html.Li("Provides financial support covering first-year living expenses, semester fees, travel, and application costs", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Selects students through a competitive process based on academic excellence, limited financial means, and motivation", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Supports training in both university programs and Germany's highly-regarded vocational training system (Ausbildung)", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Uses Income Share Agreements to create a sustainable funding model where successful graduates contribute back to support future students", style={'fontSize': '16px', 'lineHeight': '1.6'})
+        ], style={'paddingLeft': '30px'}),
+    
+        html.H3("Economic Impact", style={'color': '#2c3e50', 'marginTop': '20px'}),
+        html.P([
+            "The economic benefits of Malengo's approach are substantial:"
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+        html.Ul([
+            html.Li("Individual participants can access wages up to 19 times higher than they would earn in Uganda", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Remittances flow back to families and communities in the home country", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Research suggests significant spillover effects, with migration contributing to dramatic improvements in GDP growth in developing nations", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("German universities and vocational programs offer tuition-free high-quality education, maximizing the return on investment", style={'fontSize': '16px', 'lineHeight': '1.6'})
+        ], style={'paddingLeft': '30px'}),
+    
+        html.H3("Program Paths", style={'color': '#2c3e50', 'marginTop': '20px'}),
+        html.P([
+            "Malengo supports three primary educational paths in different countries:"
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+        html.Ul([
+            html.Li([html.Strong("Uganda Program: "), "English-language Bachelor's degrees at German universities, with students typically supporting themselves through part-time work after the first year"], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li([html.Strong("Kenya Program: "), "German 'Ausbildung' programs focused on nursing and healthcare fields, combining classroom learning with practical training and providing a modest salary during the training period. Students spend the first year in intensive German language training before traveling to Germany."], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li([html.Strong("Rwanda Program: "), "German 'Ausbildung' programs in trade skills like mechatronics, solar installation, and other technical fields. Like the Kenya program, students complete a year of German language training before beginning their vocational training in Germany."], style={'fontSize': '16px', 'lineHeight': '1.6'})
+        ], style={'paddingLeft': '30px'}),
+    
+        html.H3("Language Training", style={'color': '#2c3e50', 'marginTop': '20px'}),
+        html.P([
+            "For the Kenya and Rwanda programs, Malengo invests in a full year of intensive German language training before students travel to Germany. This essential preparation:"
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+        html.Ul([
+            html.Li("Brings students to the B1/B2 German proficiency level required for vocational training", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Represents a significant portion of the overall program investment", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Extends the timeline for investor returns, as payments begin only after students complete their training and find employment", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Dramatically increases student success rates and long-term employment prospects", style={'fontSize': '16px', 'lineHeight': '1.6'})
+        ], style={'paddingLeft': '30px'}),
+    
+        html.P([
+            "This tool helps model and analyze the financial sustainability of Income Share Agreements across these different program paths, allowing for optimization of support structures while ensuring that both students and funding partners benefit."
+        ], style={'fontSize': '16px', 'lineHeight': '1.6', 'marginTop': '15px'}),
+    ], style={'marginBottom': '30px'}),
+    
+    # Objectives Section
+    html.Div([
+        html.H2("Objectives", style={'color': '#2c3e50', 'borderBottom': '1px solid #eee', 'paddingBottom': '10px'}),
+        html.P([
+            "This simulation tool helps stakeholders understand the financial outcomes of ISA programs across various scenarios and student pathways. The tool specifically aims to:"
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+        html.Ul([
+            html.Li("Model expected returns on educational investments across different program types and student outcomes", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Simulate how various factors (unemployment, wage penalties, international labor mobility) affect student repayment patterns", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Provide investors and educational program designers with data-driven insights for program structure and financial planning", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Create transparency around the financial mechanics of ISAs for all stakeholders", style={'fontSize': '16px', 'lineHeight': '1.6'})
+        ], style={'paddingLeft': '30px'})
+    ], style={'marginBottom': '30px'}),
+    
+    # Methodology Section
+    html.Div([
+        html.H2("Methodology", style={'color': '#2c3e50', 'borderBottom': '1px solid #eee', 'paddingBottom': '10px'}),
+    
+        html.H3("Program Simulation", style={'color': '#2c3e50', 'marginTop': '20px'}),
+        html.P([
+            "This tool simulates Income Share Agreement (ISA) outcomes for students in various educational programs, ",
+            "including university degrees, assistant training, and specific trade or nursing tracks. By modeling student earnings, ",
+            "payment thresholds, and potential dropouts or returns to home countries, it provides a comprehensive view of ",
+            "investor returns and student payment patterns under different scenarios."
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+    
+        html.H3("Economic Modeling", style={'color': '#2c3e50', 'marginTop': '20px'}),
+        html.P([
+            "The simulation incorporates key economic factors including:"
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+        html.Ul([
+            html.Li("Inflation (defaulted to 2% annually)", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Unemployment (variable, with 4-8% defaults)", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Immigrant wage penalties (approximately 20%)", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Career progression with experience-based salary growth", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Labor market exit probability (representing return to home countries)", style={'fontSize': '16px', 'lineHeight': '1.6'})
+        ], style={'paddingLeft': '30px'}),
+    
+        html.H3("Scenario Analysis", style={'color': '#2c3e50', 'marginTop': '20px'}),
+        html.P([
+            "The tool offers three scenario types for each educational pathway:"
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+        html.Ul([
+            html.Li("Baseline: Realistic projections based on current data", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Conservative: Higher dropout rates, lower advanced degree completion", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Optimistic: Better degree completion, fewer dropouts, higher employment retention", style={'fontSize': '16px', 'lineHeight': '1.6'})
+        ], style={'paddingLeft': '30px'})
+    ], style={'marginBottom': '30px'}),
+    
+    
+    # Model Parameters Section
+    html.Div([
+        html.H2("Model Parameters", style={'color': '#2c3e50', 'borderBottom': '1px solid #eee', 'paddingBottom': '10px'}),
+    
+        html.H3("Degree Tracks", style={'color': '#2c3e50', 'marginTop': '20px'}),
+        html.P([
+            "The model uses six distinct tracks, each with mean earnings, variances, and completion times that approximate real-world data:"
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+    
+        html.Div([
+            html.Div([
+                html.H4("1. Bachelor's Degree (BA)", style={'color': '#2c3e50'}),
+                html.Ul([
+                    html.Li("Mean earnings: $41,300/year", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Standard deviation: $6,000", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Annual Experience Growth: 3%", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Years to Complete: 4", style={'fontSize': '16px', 'lineHeight': '1.5'})
+                ], style={'paddingLeft': '20px'})
+            ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'}),
+    
+            html.Div([
+                html.H4("2. Master's Degree (MA)", style={'color': '#2c3e50'}),
+                html.Ul([
+                    html.Li("Mean earnings: $46,709/year", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Standard deviation: $6,600", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Annual Experience Growth: 4%", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Years to Complete: 6", style={'fontSize': '16px', 'lineHeight': '1.5'})
+                ], style={'paddingLeft': '20px'})
+            ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'})
+        ], style={'marginBottom': '20px'}),
+    
+        html.Div([
+            html.Div([
+                html.H4("3. Assistant Track (ASST)", style={'color': '#2c3e50'}),
+                html.Ul([
+                    html.Li("Mean earnings: $31,500/year", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Standard deviation: $2,800", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Annual Experience Growth: 0.5%", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Years to Complete: 3", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Used in Kenya/Rwanda programs for direct-entry students", style={'fontSize': '16px', 'lineHeight': '1.5'})
+                ], style={'paddingLeft': '20px'})
+            ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'}),
+    
+            html.Div([
+                html.H4("4. Assistant Shift Track (ASST_SHIFT)", style={'color': '#2c3e50'}),
+                html.Ul([
+                    html.Li("Mean earnings: $31,500/year", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Standard deviation: $2,800", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Annual Experience Growth: 0.5%", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Years to Complete: 6", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Represents students who begin in another program and then shift to assistant training", style={'fontSize': '16px', 'lineHeight': '1.5'})
+                ], style={'paddingLeft': '20px'})
+            ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'})
+        ], style={'marginBottom': '20px'}),
+    
+        html.Div([
+            html.Div([
+                html.H4("5. Nursing Degree (NURSE)", style={'color': '#2c3e50'}),
+                html.Ul([
+                    html.Li("Mean earnings: $40,000/year", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Standard deviation: $4,000", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Annual Experience Growth: 2%", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Years to Complete: 4", style={'fontSize': '16px', 'lineHeight': '1.5'})
+                ], style={'paddingLeft': '20px'})
+            ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'}),
+    
+            html.Div([
+                html.H4("6. Trade Program (TRADE)", style={'color': '#2c3e50'}),
+                html.Ul([
+                    html.Li("Mean earnings: $35,000/year", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Standard deviation: $3,000", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Annual Experience Growth: 2%", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Years to Complete: 3", style={'fontSize': '16px', 'lineHeight': '1.5'})
+                ], style={'paddingLeft': '20px'})
+            ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'})
+        ], style={'marginBottom': '20px'}),
+    
+        html.Div([
+            html.Div([
+                html.H4("7. No Advancement (NA)", style={'color': '#2c3e50'}),
+                html.Ul([
+                    html.Li("Mean earnings: $2,200/year", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Standard deviation: $640", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Annual Experience Growth: 1%", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("Years to Complete: 4", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                    html.Li("100% Probability of Returning Home", style={'fontSize': '16px', 'lineHeight': '1.5'})
+                ], style={'paddingLeft': '20px'})
+            ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'})
+        ], style={'marginBottom': '20px'}),
+    
+        html.H3("Earnings Profiles", style={'color': '#2c3e50', 'marginTop': '20px'}),
+        html.P([
+            "We derive salary levels from public labor data and research on earnings for new graduates in high-income countries. ",
+            "The baseline is then adjusted for:"
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+        html.Ul([
+            html.Li("Immigrant Wage Penalty (~20%) – Reflects both potential employer bias and the reality that newcomers to a field/country typically earn less early in their careers.", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Career Stage – The model targets entry-level and early-career professionals with realistic wage increases over time.", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Program-specific growth trajectories – Different careers have distinct salary progression patterns.", style={'fontSize': '16px', 'lineHeight': '1.6'})
+        ], style={'paddingLeft': '30px'}),
+    
+        html.H3("ISA Terms", style={'color': '#2c3e50', 'marginTop': '20px'}),
+        html.P([
+            "The ISA terms vary by program type and include:"
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+        html.Ul([
+            html.Li([html.Strong("Payment Thresholds:"), " Students only make payments when their income exceeds $27,000 per year"], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li([html.Strong("Income Percentage:"), 
+                     html.Ul([
+                         html.Li("University: 14% of income above threshold", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                         html.Li("Nursing: 12% of income above threshold", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                         html.Li("Trade: 12% of income above threshold", style={'fontSize': '16px', 'lineHeight': '1.5'})
+                     ], style={'paddingLeft': '20px'})
+                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li([html.Strong("Payment Caps:"), 
+                     html.Ul([
+                         html.Li("University: $72,500 total repayment cap", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                         html.Li("Nursing: $49,950 total repayment cap", style={'fontSize': '16px', 'lineHeight': '1.5'}),
+                         html.Li("Trade: $45,000 total repayment cap", style={'fontSize': '16px', 'lineHeight': '1.5'})
+                     ], style={'paddingLeft': '20px'})
+                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li([html.Strong("Term Limit:"), " All ISAs have a 10-year maximum repayment period"], style={'fontSize': '16px', 'lineHeight': '1.6'})
+        ], style={'paddingLeft': '30px'})
+    ], style={'marginBottom': '30px'}),
+    
+    # Implementation Section
+    html.Div([
+        html.H2("Implementation", style={'color': '#2c3e50', 'borderBottom': '1px solid #eee', 'paddingBottom': '10px'}),
+        html.P([
+            "This interactive dashboard allows users to:"
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+        html.Ul([
+            html.Li("Select program types (University, Nursing, or Trade) with preset or custom degree distributions", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Adjust economic parameters like unemployment, inflation, and labor force participation", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Customize ISA terms including payment percentages, thresholds, and caps", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Run Monte Carlo simulations to test robustness against parameter variation", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Save and compare multiple scenarios to identify optimal program structures", style={'fontSize': '16px', 'lineHeight': '1.6'})
+        ], style={'paddingLeft': '30px'}),
+        html.P([
+            "Users navigate through tabs to access simulations, compare results, and analyze detailed outcomes including IRR distributions, repayment patterns, and student success metrics."
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'})
+    ], style={'marginBottom': '30px'}),
+    
+    # Expected Outcomes Section
+    html.Div([
+        html.H2("Expected Outcomes", style={'color': '#2c3e50', 'borderBottom': '1px solid #eee', 'paddingBottom': '10px'}),
+        html.P([
+            "The ISA Analysis Tool provides stakeholders with:"
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+        html.Ul([
+            html.Li("Data-driven understanding of expected investor returns across different program structures", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Insights into how student outcomes vary by degree type, economic conditions, and program design", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Ability to test the robustness of ISA models across conservative, baseline, and optimistic scenarios", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Quantification of risk-return profiles to support investment decisions", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Transparent assessment of how ISA structures impact student affordability and investor returns", style={'fontSize': '16px', 'lineHeight': '1.6'})
+        ], style={'paddingLeft': '30px'})
+    ], style={'marginBottom': '30px'}),
+    
+    # Future Development Section
+    html.Div([
+        html.H2("Future Development", style={'color': '#2c3e50', 'borderBottom': '1px solid #eee', 'paddingBottom': '10px'}),
+        html.P([
+            "We plan to enhance the ISA Analysis Tool with:"
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+        html.Ul([
+            html.Li("Integration with actual student outcome data as Malengo's programs mature", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("More granular country-specific economic and labor market parameters", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Dynamic ISA term optimization to balance student affordability and investor returns", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Additional educational pathway models as Malengo expands program offerings", style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li("Advanced risk assessment tools for portfolio-level analysis", style={'fontSize': '16px', 'lineHeight': '1.6'})
+        ], style={'paddingLeft': '30px'}),
+        html.P([
+            "These enhancements will make the tool increasingly valuable for educational financing decisions as Malengo grows its impact worldwide."
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'})
+    ], style={'marginBottom': '30px'}),
+    
+    # References Section (preserved from original)
+    html.Div([
+        html.H2("Additional Resources", style={'color': '#2c3e50', 'borderBottom': '1px solid #eee', 'paddingBottom': '10px'}),
+    
+        html.H4("Graduation Rate Data Sources", style={'color': '#2c3e50', 'marginTop': '20px'}),
+        html.P([
+            "Our graduation rate assumptions are based on several key German educational research sources:"
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+        html.Ul([
+            html.Li([
+                html.A("DZHW Brief 05/2022", href="https://www.dzhw.eu/pdf/pub_brief/dzhw_brief_05_2022_anhang.pdf", target="_blank"),
+                " - The table illustrates a baseline dropout rate of 40% for international students; however, Malengo students currently outperform this benchmark with 95% retention rate due to their specialized support system and rigorous selection process."
+            ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li([
+                html.A("BIBB Data Report 2015 (Vocational Training)", href="https://www.bibb.de/datenreport/de/2015/30777.php", target="_blank"),
+                " - The table indicates that 32% of non-German students terminate vocational training prior to completing their exams, compared to 13% of students with previous university experience. Approximately 50% of these early terminations result in transfers to alternative programs rather than complete dropouts, leading to an overall dropout rate of roughly 16%. Malengo currently lacks sufficient data to assess these findings independently."
+            ], style={'fontSize': '16px', 'lineHeight': '1.6'})
+        ], style={'paddingLeft': '30px'}),
+    
+        html.H4("German Profession Names & Salary References", style={'color': '#2c3e50', 'marginTop': '20px'}),
+        html.P([
+            "Below are the German names for the professions mentioned above, along with specific job examples for each degree type:"
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+        html.Ul([
+            html.Li([
+                html.Strong("Bachelor's Degree (BA) - Bachelorabschluss"), html.Br(),
+                "Example professions: Chemieingenieur/in (Chemical Engineer), Jurist/in (Lawyer), Wirtschaftsingenieur/in (Business Engineer), Informatiker/in (Computer Scientist)"
+            ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li([
+                html.Strong("Master's Degree (MA) - Masterabschluss"), html.Br(),
+                "Example professions: Maschinenbauingenieur/in (Mechanical Engineer), Architekt/in (Architect), Betriebswirt/in (Business Administrator), Physiker/in (Physicist)"
+            ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li([
+                html.Strong("Assistant Track (ASST) - Assistenzausbildung"), html.Br(),
+                "Example professions: Pflegehelfer/in (Nurse Assistant), Altenpflegehelfer/in (Geriatric Nurse Care), Solaranlagenmonteur/in (Solar Installer), Technische/r Assistent/in (Technical Assistant)"
+            ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li([
+                html.Strong("Nursing Degree (NURSE) - Krankenpflegeausbildung"), html.Br(),
+                "Example professions: Krankenschwester/Krankenpfleger (Nurse), Gesundheits- und Krankenpfleger/in (Healthcare and Nursing Professional)"
+            ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li([
+                html.Strong("Trade Program (TRADE) - Handwerksausbildung"), html.Br(),
+                "Example professions: Mechatroniker/in (Mechatronics Engineer), Klempner/in (Plumber), Elektriker/in (Electrician), Schreiner/in (Carpenter)"
+            ], style={'fontSize': '16px', 'lineHeight': '1.6'})
+        ], style={'paddingLeft': '30px'}),
+    
+        html.P([
+            "Salary reference resources:"
+        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
+        html.Ul([
+            html.Li(html.A("German Government Earnings Atlas (Entgeltatlas)", href="https://web.arbeitsagentur.de/entgeltatlas/beruf/134712", target="_blank"), style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li(html.A("StepStone Salary Data for Elektroniker", href="https://www.stepstone.de/gehalt/Elektroniker-in.html", target="_blank"), style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li(html.A("JobVector Salary Information", href="https://www.jobvector.de/gehalt/Elektroniker/", target="_blank"), style={'fontSize': '16px', 'lineHeight': '1.6'}),
+            html.Li(html.A("Gehalt.de Profession Data", href="https://www.gehalt.de/beruf/elektroniker-elektronikerin", target="_blank"), style={'fontSize': '16px', 'lineHeight': '1.6'})
+        ], style={'paddingLeft': '30px'}),
+    ], style={'marginBottom': '30px'})
+], style={'padding': '20px', 'maxWidth': '1200px', 'margin': '0 auto'})
+
 # Define the layout of the app
 app.layout = html.Div([
     html.H1("ISA Analysis Tool", style={'textAlign': 'center', 'marginBottom': '30px'}),
     
     # Tabs for different sections
-    dcc.Tabs([
-        dcc.Tab(label='About', children=[
-            html.Div([
-                html.H1("ISA Analysis Tool", style={'textAlign': 'center', 'marginBottom': '30px', 'color': '#2c3e50'}),
-                
-                # Background Section
-                html.Div([
-                    html.H2("Background", style={'color': '#2c3e50', 'borderBottom': '1px solid #eee', 'paddingBottom': '10px'}),
-                    html.P([
-                        "Income Share Agreements (ISAs) represent an innovative approach to educational financing where students receive funding for their education in exchange for a percentage of their future income over a defined period. ",
-                        "Unlike traditional loans with fixed repayments regardless of outcomes, ISAs align incentives between funders and students—payments scale with a graduate's actual earnings success."
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    html.P([
-                        html.A("Malengo", href="https://www.malengo.org", target="_blank"), 
-                        " is a nonprofit organization that connects talented students from developing countries with educational opportunities abroad through ISA financing. ",
-                        "The organization's mission focuses on reducing barriers to migration—a strategy with enormous potential impact, as research suggests the estimated global gains from reducing migration barriers dwarf those related to other policy restrictions by one or two orders of magnitude."
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    
-                    html.H3("The Malengo Model", style={'color': '#2c3e50', 'marginTop': '20px'}),
-                    html.P([
-                        "Malengo currently operates a Uganda–Germany Program that prepares academically talented but financially constrained students from Uganda for admission to English-speaking Bachelor's programs at German universities. The organization:"
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    html.Ul([
-                        html.Li("Provides financial support covering first-year living expenses, semester fees, travel, and application costs", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Selects students through a competitive process based on academic excellence, limited financial means, and motivation", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Supports training in both university programs and Germany's highly-regarded vocational training system (Ausbildung)", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Uses Income Share Agreements to create a sustainable funding model where successful graduates contribute back to support future students", style={'fontSize': '16px', 'lineHeight': '1.6'})
-                    ], style={'paddingLeft': '30px'}),
-                    
-                    html.H3("Economic Impact", style={'color': '#2c3e50', 'marginTop': '20px'}),
-                    html.P([
-                        "The economic benefits of Malengo's approach are substantial:"
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    html.Ul([
-                        html.Li("Individual participants can access wages up to 19 times higher than they would earn in Uganda", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Remittances flow back to families and communities in the home country", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Research suggests significant spillover effects, with migration contributing to dramatic improvements in GDP growth in developing nations", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("German universities and vocational programs offer tuition-free high-quality education, maximizing the return on investment", style={'fontSize': '16px', 'lineHeight': '1.6'})
-                    ], style={'paddingLeft': '30px'}),
-                    
-                    html.H3("Program Paths", style={'color': '#2c3e50', 'marginTop': '20px'}),
-                    html.P([
-                        "Malengo supports three primary educational paths in different countries:"
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    html.Ul([
-                        html.Li([html.Strong("Uganda Program: "), "English-language Bachelor's degrees at German universities, with students typically supporting themselves through part-time work after the first year"], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li([html.Strong("Kenya Program: "), "German 'Ausbildung' programs focused on nursing and healthcare fields, combining classroom learning with practical training and providing a modest salary during the training period. Students spend the first year in intensive German language training before traveling to Germany."], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li([html.Strong("Rwanda Program: "), "German 'Ausbildung' programs in trade skills like mechatronics, solar installation, and other technical fields. Like the Kenya program, students complete a year of German language training before beginning their vocational training in Germany."], style={'fontSize': '16px', 'lineHeight': '1.6'})
-                    ], style={'paddingLeft': '30px'}),
-                    
-                    html.H3("Language Training", style={'color': '#2c3e50', 'marginTop': '20px'}),
-                    html.P([
-                        "For the Kenya and Rwanda programs, Malengo invests in a full year of intensive German language training before students travel to Germany. This essential preparation:"
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    html.Ul([
-                        html.Li("Brings students to the B1/B2 German proficiency level required for vocational training", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Represents a significant portion of the overall program investment", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Extends the timeline for investor returns, as payments begin only after students complete their training and find employment", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Dramatically increases student success rates and long-term employment prospects", style={'fontSize': '16px', 'lineHeight': '1.6'})
-                    ], style={'paddingLeft': '30px'}),
-                    
-                    html.P([
-                        "This tool helps model and analyze the financial sustainability of Income Share Agreements across these different program paths, allowing for optimization of support structures while ensuring that both students and funding partners benefit."
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6', 'marginTop': '15px'}),
-                ], style={'marginBottom': '30px'}),
-                
-                # Objectives Section
-                html.Div([
-                    html.H2("Objectives", style={'color': '#2c3e50', 'borderBottom': '1px solid #eee', 'paddingBottom': '10px'}),
-                    html.P([
-                        "This simulation tool helps stakeholders understand the financial outcomes of ISA programs across various scenarios and student pathways. The tool specifically aims to:"
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    html.Ul([
-                        html.Li("Model expected returns on educational investments across different program types and student outcomes", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Simulate how various factors (unemployment, wage penalties, international labor mobility) affect student repayment patterns", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Provide investors and educational program designers with data-driven insights for program structure and financial planning", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Create transparency around the financial mechanics of ISAs for all stakeholders", style={'fontSize': '16px', 'lineHeight': '1.6'})
-                    ], style={'paddingLeft': '30px'})
-                ], style={'marginBottom': '30px'}),
-                
-                # Methodology Section
-                html.Div([
-                    html.H2("Methodology", style={'color': '#2c3e50', 'borderBottom': '1px solid #eee', 'paddingBottom': '10px'}),
-                    
-                    html.H3("Program Simulation", style={'color': '#2c3e50', 'marginTop': '20px'}),
-                    html.P([
-                        "This tool simulates Income Share Agreement (ISA) outcomes for students in various educational programs, ",
-                        "including university degrees, assistant training, and specific trade or nursing tracks. By modeling student earnings, ",
-                        "payment thresholds, and potential dropouts or returns to home countries, it provides a comprehensive view of ",
-                        "investor returns and student payment patterns under different scenarios."
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    
-                    html.H3("Economic Modeling", style={'color': '#2c3e50', 'marginTop': '20px'}),
-                    html.P([
-                        "The simulation incorporates key economic factors including:"
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    html.Ul([
-                        html.Li("Inflation (defaulted to 2% annually)", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Unemployment (variable, with 4-8% defaults)", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Immigrant wage penalties (approximately 20%)", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Career progression with experience-based salary growth", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Labor market exit probability (representing return to home countries)", style={'fontSize': '16px', 'lineHeight': '1.6'})
-                    ], style={'paddingLeft': '30px'}),
-                    
-                    html.H3("Scenario Analysis", style={'color': '#2c3e50', 'marginTop': '20px'}),
-                    html.P([
-                        "The tool offers three scenario types for each educational pathway:"
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    html.Ul([
-                        html.Li("Baseline: Realistic projections based on current data", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Conservative: Higher dropout rates, lower advanced degree completion", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Optimistic: Better degree completion, fewer dropouts, higher employment retention", style={'fontSize': '16px', 'lineHeight': '1.6'})
-                    ], style={'paddingLeft': '30px'})
-                ], style={'marginBottom': '30px'}),
-                
-                
-                # Model Parameters Section
-                html.Div([
-                    html.H2("Model Parameters", style={'color': '#2c3e50', 'borderBottom': '1px solid #eee', 'paddingBottom': '10px'}),
-                    
-                    html.H3("Degree Tracks", style={'color': '#2c3e50', 'marginTop': '20px'}),
-                    html.P([
-                        "The model uses six distinct tracks, each with mean earnings, variances, and completion times that approximate real-world data:"
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    
-                    html.Div([
-                        html.Div([
-                            html.H4("1. Bachelor's Degree (BA)", style={'color': '#2c3e50'}),
-                            html.Ul([
-                                html.Li("Mean earnings: $41,300/year", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Standard deviation: $6,000", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Annual Experience Growth: 3%", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Years to Complete: 4", style={'fontSize': '16px', 'lineHeight': '1.5'})
-                            ], style={'paddingLeft': '20px'})
-                        ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'}),
-                        
-                        html.Div([
-                            html.H4("2. Master's Degree (MA)", style={'color': '#2c3e50'}),
-                            html.Ul([
-                                html.Li("Mean earnings: $46,709/year", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Standard deviation: $6,600", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Annual Experience Growth: 4%", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Years to Complete: 6", style={'fontSize': '16px', 'lineHeight': '1.5'})
-                            ], style={'paddingLeft': '20px'})
-                        ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'})
-                    ], style={'marginBottom': '20px'}),
-                    
-                    html.Div([
-                        html.Div([
-                            html.H4("3. Assistant Track (ASST)", style={'color': '#2c3e50'}),
-                            html.Ul([
-                                html.Li("Mean earnings: $31,500/year", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Standard deviation: $2,800", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Annual Experience Growth: 0.5%", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Years to Complete: 3", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Used in Kenya/Rwanda programs for direct-entry students", style={'fontSize': '16px', 'lineHeight': '1.5'})
-                            ], style={'paddingLeft': '20px'})
-                        ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'}),
-                        
-                        html.Div([
-                            html.H4("4. Assistant Shift Track (ASST_SHIFT)", style={'color': '#2c3e50'}),
-                            html.Ul([
-                                html.Li("Mean earnings: $31,500/year", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Standard deviation: $2,800", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Annual Experience Growth: 0.5%", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Years to Complete: 6", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Represents students who begin in another program and then shift to assistant training", style={'fontSize': '16px', 'lineHeight': '1.5'})
-                            ], style={'paddingLeft': '20px'})
-                        ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'})
-                    ], style={'marginBottom': '20px'}),
-                    
-                    html.Div([
-                        html.Div([
-                            html.H4("5. Nursing Degree (NURSE)", style={'color': '#2c3e50'}),
-                            html.Ul([
-                                html.Li("Mean earnings: $40,000/year", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Standard deviation: $4,000", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Annual Experience Growth: 2%", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Years to Complete: 4", style={'fontSize': '16px', 'lineHeight': '1.5'})
-                            ], style={'paddingLeft': '20px'})
-                        ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'}),
-                        
-                        html.Div([
-                            html.H4("6. Trade Program (TRADE)", style={'color': '#2c3e50'}),
-                            html.Ul([
-                                html.Li("Mean earnings: $35,000/year", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Standard deviation: $3,000", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Annual Experience Growth: 2%", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Years to Complete: 3", style={'fontSize': '16px', 'lineHeight': '1.5'})
-                            ], style={'paddingLeft': '20px'})
-                        ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'})
-                    ], style={'marginBottom': '20px'}),
-                    
-                    html.Div([
-                        html.Div([
-                            html.H4("7. No Advancement (NA)", style={'color': '#2c3e50'}),
-                            html.Ul([
-                                html.Li("Mean earnings: $2,200/year", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Standard deviation: $640", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Annual Experience Growth: 1%", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("Years to Complete: 4", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                html.Li("100% Probability of Returning Home", style={'fontSize': '16px', 'lineHeight': '1.5'})
-                            ], style={'paddingLeft': '20px'})
-                        ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'})
-                    ], style={'marginBottom': '20px'}),
-                    
-                    html.H3("Earnings Profiles", style={'color': '#2c3e50', 'marginTop': '20px'}),
-                    html.P([
-                        "We derive salary levels from public labor data and research on earnings for new graduates in high-income countries. ",
-                        "The baseline is then adjusted for:"
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    html.Ul([
-                        html.Li("Immigrant Wage Penalty (~20%) – Reflects both potential employer bias and the reality that newcomers to a field/country typically earn less early in their careers.", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Career Stage – The model targets entry-level and early-career professionals with realistic wage increases over time.", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Program-specific growth trajectories – Different careers have distinct salary progression patterns.", style={'fontSize': '16px', 'lineHeight': '1.6'})
-                    ], style={'paddingLeft': '30px'}),
-                    
-                    html.H3("ISA Terms", style={'color': '#2c3e50', 'marginTop': '20px'}),
-                    html.P([
-                        "The ISA terms vary by program type and include:"
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    html.Ul([
-                        html.Li([html.Strong("Payment Thresholds:"), " Students only make payments when their income exceeds $27,000 per year"], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li([html.Strong("Income Percentage:"), 
-                                 html.Ul([
-                                     html.Li("University: 14% of income above threshold", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                     html.Li("Nursing: 12% of income above threshold", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                     html.Li("Trade: 12% of income above threshold", style={'fontSize': '16px', 'lineHeight': '1.5'})
-                                 ], style={'paddingLeft': '20px'})
-                                ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li([html.Strong("Payment Caps:"), 
-                                 html.Ul([
-                                     html.Li("University: $72,500 total repayment cap", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                     html.Li("Nursing: $49,950 total repayment cap", style={'fontSize': '16px', 'lineHeight': '1.5'}),
-                                     html.Li("Trade: $45,000 total repayment cap", style={'fontSize': '16px', 'lineHeight': '1.5'})
-                                 ], style={'paddingLeft': '20px'})
-                                ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li([html.Strong("Term Limit:"), " All ISAs have a 10-year maximum repayment period"], style={'fontSize': '16px', 'lineHeight': '1.6'})
-                    ], style={'paddingLeft': '30px'})
-                ], style={'marginBottom': '30px'}),
-                
-                # Implementation Section
-                html.Div([
-                    html.H2("Implementation", style={'color': '#2c3e50', 'borderBottom': '1px solid #eee', 'paddingBottom': '10px'}),
-                    html.P([
-                        "This interactive dashboard allows users to:"
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    html.Ul([
-                        html.Li("Select program types (University, Nursing, or Trade) with preset or custom degree distributions", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Adjust economic parameters like unemployment, inflation, and labor force participation", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Customize ISA terms including payment percentages, thresholds, and caps", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Run Monte Carlo simulations to test robustness against parameter variation", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Save and compare multiple scenarios to identify optimal program structures", style={'fontSize': '16px', 'lineHeight': '1.6'})
-                    ], style={'paddingLeft': '30px'}),
-                    html.P([
-                        "Users navigate through tabs to access simulations, compare results, and analyze detailed outcomes including IRR distributions, repayment patterns, and student success metrics."
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'})
-                ], style={'marginBottom': '30px'}),
-                
-                # Expected Outcomes Section
-                html.Div([
-                    html.H2("Expected Outcomes", style={'color': '#2c3e50', 'borderBottom': '1px solid #eee', 'paddingBottom': '10px'}),
-                    html.P([
-                        "The ISA Analysis Tool provides stakeholders with:"
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    html.Ul([
-                        html.Li("Data-driven understanding of expected investor returns across different program structures", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Insights into how student outcomes vary by degree type, economic conditions, and program design", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Ability to test the robustness of ISA models across conservative, baseline, and optimistic scenarios", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Quantification of risk-return profiles to support investment decisions", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Transparent assessment of how ISA structures impact student affordability and investor returns", style={'fontSize': '16px', 'lineHeight': '1.6'})
-                    ], style={'paddingLeft': '30px'})
-                ], style={'marginBottom': '30px'}),
-                
-                # Future Development Section
-                html.Div([
-                    html.H2("Future Development", style={'color': '#2c3e50', 'borderBottom': '1px solid #eee', 'paddingBottom': '10px'}),
-                    html.P([
-                        "We plan to enhance the ISA Analysis Tool with:"
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    html.Ul([
-                        html.Li("Integration with actual student outcome data as Malengo's programs mature", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("More granular country-specific economic and labor market parameters", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Dynamic ISA term optimization to balance student affordability and investor returns", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Additional educational pathway models as Malengo expands program offerings", style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li("Advanced risk assessment tools for portfolio-level analysis", style={'fontSize': '16px', 'lineHeight': '1.6'})
-                    ], style={'paddingLeft': '30px'}),
-                    html.P([
-                        "These enhancements will make the tool increasingly valuable for educational financing decisions as Malengo grows its impact worldwide."
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'})
-                ], style={'marginBottom': '30px'}),
-                
-                # References Section (preserved from original)
-                html.Div([
-                    html.H2("Additional Resources", style={'color': '#2c3e50', 'borderBottom': '1px solid #eee', 'paddingBottom': '10px'}),
-                    
-                    html.H4("Graduation Rate Data Sources", style={'color': '#2c3e50', 'marginTop': '20px'}),
-                    html.P([
-                        "Our graduation rate assumptions are based on several key German educational research sources:"
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    html.Ul([
-                        html.Li([
-                            html.A("DZHW Brief 05/2022", href="https://www.dzhw.eu/pdf/pub_brief/dzhw_brief_05_2022_anhang.pdf", target="_blank"),
-                            " - The table illustrates a baseline dropout rate of 40% for international students; however, Malengo students currently outperform this benchmark with 95% retention rate due to their specialized support system and rigorous selection process."
-                        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li([
-                            html.A("BIBB Data Report 2015 (Vocational Training)", href="https://www.bibb.de/datenreport/de/2015/30777.php", target="_blank"),
-                            " - The table indicates that 32% of non-German students terminate vocational training prior to completing their exams, compared to 13% of students with previous university experience. Approximately 50% of these early terminations result in transfers to alternative programs rather than complete dropouts, leading to an overall dropout rate of roughly 16%. Malengo currently lacks sufficient data to assess these findings independently."
-                        ], style={'fontSize': '16px', 'lineHeight': '1.6'})
-                    ], style={'paddingLeft': '30px'}),
-                    
-                    html.H4("German Profession Names & Salary References", style={'color': '#2c3e50', 'marginTop': '20px'}),
-                    html.P([
-                        "Below are the German names for the professions mentioned above, along with specific job examples for each degree type:"
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    html.Ul([
-                        html.Li([
-                            html.Strong("Bachelor's Degree (BA) - Bachelorabschluss"), html.Br(),
-                            "Example professions: Chemieingenieur/in (Chemical Engineer), Jurist/in (Lawyer), Wirtschaftsingenieur/in (Business Engineer), Informatiker/in (Computer Scientist)"
-                        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li([
-                            html.Strong("Master's Degree (MA) - Masterabschluss"), html.Br(),
-                            "Example professions: Maschinenbauingenieur/in (Mechanical Engineer), Architekt/in (Architect), Betriebswirt/in (Business Administrator), Physiker/in (Physicist)"
-                        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li([
-                            html.Strong("Assistant Track (ASST) - Assistenzausbildung"), html.Br(),
-                            "Example professions: Pflegehelfer/in (Nurse Assistant), Altenpflegehelfer/in (Geriatric Nurse Care), Solaranlagenmonteur/in (Solar Installer), Technische/r Assistent/in (Technical Assistant)"
-                        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li([
-                            html.Strong("Nursing Degree (NURSE) - Krankenpflegeausbildung"), html.Br(),
-                            "Example professions: Krankenschwester/Krankenpfleger (Nurse), Gesundheits- und Krankenpfleger/in (Healthcare and Nursing Professional)"
-                        ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li([
-                            html.Strong("Trade Program (TRADE) - Handwerksausbildung"), html.Br(),
-                            "Example professions: Mechatroniker/in (Mechatronics Engineer), Klempner/in (Plumber), Elektriker/in (Electrician), Schreiner/in (Carpenter)"
-                        ], style={'fontSize': '16px', 'lineHeight': '1.6'})
-                    ], style={'paddingLeft': '30px'}),
-                    
-                    html.P([
-                        "Salary reference resources:"
-                    ], style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                    html.Ul([
-                        html.Li(html.A("German Government Earnings Atlas (Entgeltatlas)", href="https://web.arbeitsagentur.de/entgeltatlas/beruf/134712", target="_blank"), style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li(html.A("StepStone Salary Data for Elektroniker", href="https://www.stepstone.de/gehalt/Elektroniker-in.html", target="_blank"), style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li(html.A("JobVector Salary Information", href="https://www.jobvector.de/gehalt/Elektroniker/", target="_blank"), style={'fontSize': '16px', 'lineHeight': '1.6'}),
-                        html.Li(html.A("Gehalt.de Profession Data", href="https://www.gehalt.de/beruf/elektroniker-elektronikerin", target="_blank"), style={'fontSize': '16px', 'lineHeight': '1.6'})
-                    ], style={'paddingLeft': '30px'}),
-                ], style={'marginBottom': '30px'})
-            ], style={'padding': '20px', 'maxWidth': '1200px', 'margin': '0 auto'})
+    dcc.Tabs(id='main-tabs', value='about', children=[
+        dcc.Tab(label='About', value='about', children=[
+            dcc.Loading(html.Div(id='about-content'))
         ]),
         
         dcc.Tab(label='Simulation', children=[
@@ -480,7 +744,7 @@ app.layout = html.Div([
                                  style={'fontSize': '0.85em', 'margin': '2px 0 10px 0'}),
                             dcc.Dropdown(
                                 id="preset-scenario",
-                                options=[{'label': preset_scenarios[k]['name'], 'value': k} for k in preset_scenarios.keys()],
+                                options=preset_options,
                                 value="uganda_baseline",
                                 placeholder="Select a preset scenario",
                                 style={'fontWeight': 'bold'}
@@ -507,343 +771,25 @@ app.layout = html.Div([
                                     html.Label("Degree Parameters", style={'fontWeight': 'bold', 'fontSize': '16px', 'marginBottom': '10px'})
                                 ], style={'textAlign': 'center', 'marginBottom': '15px'}),
                                 
-                                # Table headers
-                                html.Div([
-                                    html.Div([html.Label("Degree Type")], style={'width': '20%', 'display': 'inline-block', 'fontWeight': 'bold'}),
-                                    html.Div([html.Label("Percentage (%)")], style={'width': '20%', 'display': 'inline-block', 'fontWeight': 'bold'}),
-                                    html.Div([html.Label("Avg Salary ($)")], style={'width': '20%', 'display': 'inline-block', 'fontWeight': 'bold'}),
-                                    html.Div([html.Label("Std Dev ($)")], style={'width': '20%', 'display': 'inline-block', 'fontWeight': 'bold'}),
-                                    html.Div([html.Label("Growth Rate (%)")], style={'width': '20%', 'display': 'inline-block', 'fontWeight': 'bold'}),
-                                ], style={'marginBottom': '10px', 'textAlign': 'center'}),
-                                
-                                # Bachelor's row
-                                html.Div([
-                                    html.Div([html.Label("Bachelor's (BA)")], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="ba-pct", 
-                                            type="number", 
-                                            value=45, 
-                                            min=0, 
-                                            max=100, 
-                                            step=1,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="ba-salary", 
-                                            type="number", 
-                                            value=41300, 
-                                            min=0, 
-                                            step=100,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="ba-std", 
-                                            type="number", 
-                                            value=6000, 
-                                            min=0, 
-                                            step=100,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="ba-growth", 
-                                            type="number", 
-                                            value=3.0, 
-                                            min=0, 
-                                            max=20, 
-                                            step=0.1,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                ], style={'marginBottom': '10px'}),
-                                
-                                # Master's row
-                                html.Div([
-                                    html.Div([html.Label("Master's (MA)")], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="ma-pct", 
-                                            type="number", 
-                                            value=24, 
-                                            min=0, 
-                                            max=100, 
-                                            step=1,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="ma-salary", 
-                                            type="number", 
-                                            value=46709, 
-                                            min=0, 
-                                            step=100,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="ma-std", 
-                                            type="number", 
-                                            value=6600, 
-                                            min=0, 
-                                            step=100,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="ma-growth", 
-                                            type="number", 
-                                            value=4.0, 
-                                            min=0, 
-                                            max=20, 
-                                            step=0.1,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                ], style={'marginBottom': '10px'}),
-                                
-                                # Assistant row
-                                html.Div([
-                                    html.Div([html.Label("Assistant Track (ASST)")], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="asst-pct", 
-                                            type="number", 
-                                            value=0, 
-                                            min=0, 
-                                            max=100, 
-                                            step=1,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="asst-salary", 
-                                            type="number", 
-                                            value=31500, 
-                                            min=0, 
-                                            step=100,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="asst-std", 
-                                            type="number", 
-                                            value=2800, 
-                                            min=0, 
-                                            step=100,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="asst-growth", 
-                                            type="number", 
-                                            value=0.5, 
-                                            min=0, 
-                                            max=20, 
-                                            step=0.1,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                ], style={'marginBottom': '10px'}),
-                                
-                                # Assistant Shift row
-                                html.Div([
-                                    html.Div([html.Label("Assistant Shift (ASST_SHIFT)")], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="asst-shift-pct", 
-                                            type="number", 
-                                            value=27, 
-                                            min=0, 
-                                            max=100, 
-                                            step=1,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="asst-shift-salary", 
-                                            type="number", 
-                                            value=31500, 
-                                            min=0, 
-                                            step=100,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="asst-shift-std", 
-                                            type="number", 
-                                            value=2800, 
-                                            min=0, 
-                                            step=100,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="asst-shift-growth", 
-                                            type="number", 
-                                            value=0.5, 
-                                            min=0, 
-                                            max=20, 
-                                            step=0.1,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                ], style={'marginBottom': '10px'}),
-                                
-                                # Nursing row
-                                html.Div([
-                                    html.Div([html.Label("Nursing (NURSE)")], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="nurse-pct", 
-                                            type="number", 
-                                            value=0, 
-                                            min=0, 
-                                            max=100, 
-                                            step=1,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="nurse-salary", 
-                                            type="number", 
-                                            value=40000, 
-                                            min=0, 
-                                            step=100,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="nurse-std", 
-                                            type="number", 
-                                            value=4000, 
-                                            min=0, 
-                                            step=100,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="nurse-growth", 
-                                            type="number", 
-                                            value=2.0, 
-                                            min=0, 
-                                            max=20, 
-                                            step=0.1,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                ], style={'marginBottom': '10px'}),
-                                
-                                # Trade row
-                                html.Div([
-                                    html.Div([html.Label("Trade (TRADE)")], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="trade-pct", 
-                                            type="number", 
-                                            value=0, 
-                                            min=0, 
-                                            max=100, 
-                                            step=1,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="trade-salary", 
-                                            type="number", 
-                                            value=35000, 
-                                            min=0, 
-                                            step=100,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="trade-std", 
-                                            type="number", 
-                                            value=5000, 
-                                            min=0, 
-                                            step=100,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="trade-growth", 
-                                            type="number", 
-                                            value=2, 
-                                            min=0, 
-                                            max=20, 
-                                            step=0.1,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                ], style={'marginBottom': '10px'}),
-                                
-                                # No Degree row
-                                html.Div([
-                                    html.Div([html.Label("No Degree (NA)")], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="na-pct", 
-                                            type="number", 
-                                            value=4, 
-                                            min=0, 
-                                            max=100, 
-                                            step=1,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="na-salary", 
-                                            type="number", 
-                                            value=2200, 
-                                            min=0, 
-                                            step=100,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="na-std", 
-                                            type="number", 
-                                            value=640, 
-                                            min=0, 
-                                            step=100,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                    html.Div([
-                                        dcc.Input(
-                                            id="na-growth", 
-                                            type="number", 
-                                            value=1, 
-                                            min=0, 
-                                            max=20, 
-                                            step=0.1,
-                                            style={'width': '100%'}
-                                        )
-                                    ], style={'width': '20%', 'display': 'inline-block'}),
-                                ], style={'marginBottom': '10px'}),
+                                # One editable table for every degree's share and earnings parameters
+                                dash_table.DataTable(
+                                    id="degree-params",
+                                    columns=_DEGREE_TABLE_COLUMNS,
+                                    data=_DEGREE_TABLE_DEFAULTS,
+                                    editable=True,
+                                    style_cell={'textAlign': 'center', 'padding': '5px'},
+                                    style_header={
+                                        'backgroundColor': 'rgb(230, 230, 230)',
+                                        'fontWeight': 'bold'
+                                    },
+                                    style_data_conditional=[
+                                        {
+                                            'if': {'column_id': 'degree'},
+                                            'textAlign': 'left',
+                                            'backgroundColor': 'rgb(248, 248, 248)'
+                                        }
+                                    ]
+                                ),
                                 
             
                                 
@@ -856,57 +802,15 @@ app.layout = html.Div([
                             html.Label("ISA Parameters", style={'fontWeight': 'bold', 'fontSize': '16px', 'marginBottom': '10px'}),
                             
                             html.Div([
-                                html.Div([html.Label("ISA Percentage (%)")], style={'width': '25%', 'display': 'inline-block'}),
-                                html.Div([html.Label("ISA Threshold ($)")], style={'width': '25%', 'display': 'inline-block'}),
-                                html.Div([html.Label("ISA Cap ($)")], style={'width': '25%', 'display': 'inline-block'}),
-                                html.Div([html.Label("Price per Student ($)")], style={'width': '25%', 'display': 'inline-block'}),
+                                html.Div([html.Label(label)], style=_QUARTER_CELL_STYLE)
+                                for label in ["ISA Percentage (%)", "ISA Threshold ($)", "ISA Cap ($)", "Price per Student ($)"]
                             ], style={'marginBottom': '5px', 'textAlign': 'center'}),
                             
                             html.Div([
-                                html.Div([
-                                    dcc.Input(
-                                        id="isa-percentage-input", 
-                                        type="number", 
-                                        value=14,  # Default to Uganda values
-                                        min=0, 
-                                        max=100, 
-                                        step=0.1,
-                                        style={'width': '100%'}
-                                    )
-                                ], style={'width': '25%', 'display': 'inline-block'}),
-                                
-                                html.Div([
-                                    dcc.Input(
-                                        id="isa-threshold-input", 
-                                        type="number", 
-                                        value=27000,
-                                        min=0, 
-                                        step=1000,
-                                        style={'width': '100%'}
-                                    )
-                                ], style={'width': '25%', 'display': 'inline-block'}),
-                                
-                                html.Div([
-                                    dcc.Input(
-                                        id="isa-cap-input", 
-                                        type="number", 
-                                        value=72500,  # Default to Uganda values
-                                        min=0, 
-                                        step=1000,
-                                        style={'width': '100%'}
-                                    )
-                                ], style={'width': '25%', 'display': 'inline-block'}),
-                                
-                                html.Div([
-                                    dcc.Input(
-                                        id="price-per-student-input", 
-                                        type="number", 
-                                        value=29000,  # Default to Uganda values
-                                        min=0, 
-                                        step=1000,
-                                        style={'width': '100%'}
-                                    )
-                                ], style={'width': '25%', 'display': 'inline-block'}),
+                                _input_cell("isa-percentage-input", 14, step=0.1, max=100),  # Default to Uganda values
+                                _input_cell("isa-threshold-input", 27000, step=1000),
+                                _input_cell("isa-cap-input", 72500, step=1000),  # Default to Uganda values
+                                _input_cell("price-per-student-input", 29000, step=1000),  # Default to Uganda values
                             ], style={'marginBottom': '15px'}),
                             
                             html.P("Price per Student represents the total cost/investment per student that investors will pay to purchase an ISA.", 
@@ -992,14 +896,18 @@ app.layout = html.Div([
                         html.H3("Results"),
                         
                         html.Div([
-                            html.Div(id="summary-stats", style={'marginBottom': '20px'}),
+                            html.Div(
+                                "Click 'Run Simulation' to see results",
+                                id="summary-stats",
+                                style={'marginBottom': '20px'}
+                            ),
                             
                             dcc.Tabs([
                                 dcc.Tab(label='Scenarios', children=[
                                     html.Div(id="scenario-info")
                                 ]),
                                 dcc.Tab(label='Payment Distribution', children=[
-                                    dcc.Graph(id="payment-distribution")
+                                    dcc.Graph(id="payment-distribution", figure=_PAYMENT_DISTRIBUTION_FIGURE)
                                 ]),
                                 dcc.Tab(label='Payment Data Table', children=[
                                     html.Div(id="payment-data-table")
@@ -1008,7 +916,7 @@ app.layout = html.Div([
                                     html.Div(id="degree-info")
                                 ]),
                                 dcc.Tab(label='IRR Comparison', children=[
-                                    dcc.Graph(id="irr-comparison")
+                                    dcc.Graph(id="irr-comparison", figure=_IRR_COMPARISON_FIGURE)
                                 ]),
                                 dcc.Tab(label='Scenario Comparison', children=[
                                     html.Div([
@@ -1092,11 +1000,7 @@ app.layout = html.Div([
                                                 html.Label("Number of Simulations:"),
                                                 dcc.Dropdown(
                                                     id="blended-monte-carlo-sims",
-                                                    options=[
-                                                        {'label': '100 simulations (faster)', 'value': 100},
-                                                        {'label': '500 simulations', 'value': 500},
-                                                        {'label': '1000 simulations (recommended)', 'value': 1000}
-                                                    ],
+                                                    options=blended_sim_options,
                                                     value=500
                                                 )
                                             ], style={'width': '100%', 'marginBottom': '20px'}),
@@ -1107,12 +1011,7 @@ app.layout = html.Div([
                                                     html.Label("Scenario Type:"),
                                                     dcc.Dropdown(
                                                         id="scenario1-type",
-                                                        options=[
-                                                            {'label': 'Baseline', 'value': 'baseline'},
-                                                            {'label': 'Conservative', 'value': 'conservative'},
-                                                            {'label': 'Optimistic', 'value': 'optimistic'},
-                                                            {'label': 'Custom', 'value': 'custom'}
-                                                        ],
+                                                        options=scenario_type_options,
                                                         value='baseline'
                                                     )
                                                 ], style={'width': '48%', 'display': 'inline-block'}),
@@ -1136,12 +1035,7 @@ app.layout = html.Div([
                                                     html.Label("Scenario Type:"),
                                                     dcc.Dropdown(
                                                         id="scenario2-type",
-                                                        options=[
-                                                            {'label': 'Baseline', 'value': 'baseline'},
-                                                            {'label': 'Conservative', 'value': 'conservative'},
-                                                            {'label': 'Optimistic', 'value': 'optimistic'},
-                                                            {'label': 'Custom', 'value': 'custom'}
-                                                        ],
+                                                        options=scenario_type_options,
                                                         value='conservative'
                                                     )
                                                 ], style={'width': '48%', 'display': 'inline-block'}),
@@ -1165,12 +1059,7 @@ app.layout = html.Div([
                                                     html.Label("Scenario Type:"),
                                                     dcc.Dropdown(
                                                         id="scenario3-type",
-                                                        options=[
-                                                            {'label': 'Baseline', 'value': 'baseline'},
-                                                            {'label': 'Conservative', 'value': 'conservative'},
-                                                            {'label': 'Optimistic', 'value': 'optimistic'},
-                                                            {'label': 'Custom', 'value': 'custom'}
-                                                        ],
+                                                        options=scenario_type_options,
                                                         value='optimistic'
                                                     )
                                                 ], style={'width': '48%', 'display': 'inline-block'}),
@@ -1233,7 +1122,10 @@ app.layout = html.Div([
                                         ),
                                         
                                         html.Div(id="blended-monte-carlo-loading", style={'color': '#888', 'textAlign': 'center'}),
-                                        html.Div(id="blended-monte-carlo-results")
+                                        html.Div(
+                                            id="blended-monte-carlo-results",
+                                            children=html.Div("Click 'Run Blended Monte Carlo Simulation' to see results")
+                                        )
                                     ])
                                 ])
                             ], style={'marginTop': '20px'})
@@ -1244,10 +1136,26 @@ app.layout = html.Div([
         ])
     ]),
     
-    dcc.Store(id='simulation-results-store'),
-    dcc.Store(id='saved-scenarios-store', data={})
+    dcc.Store(id='presets-store', data=_PRESETS_STORE_DATA),
+    dcc.Store(id='simulation-results-store', storage_type='memory'),
+    # Key of the parameters behind the current results, so an unchanged re-run can skip them
+    dcc.Store(id='simulation-params-key', storage_type='memory'),
+    dcc.Store(id='saved-scenarios-store', data={}, storage_type='memory')
 ])
 
+# Fill in the About tab the first time it is selected; the 'about-loaded' class marks it as
+# filled so switching back to it doesn't send the contents again
+@app.callback(
+    [Output("about-content", "children"),
+     Output("about-content", "className")],
+    [Input("main-tabs", "value")],
+    [State("about-content", "className")]
+)
+def load_about_tab(tab_value, class_name):
+    if tab_value != 'about' or class_name == 'about-loaded':
+        return dash.no_update, dash.no_update
+    return _ABOUT_TAB_CHILDREN, 'about-loaded'
+
 # Callback to toggle the custom degree section visibility
 @app.callback(
     Output("custom-degree-section", "style"),
@@ -1259,102 +1167,192 @@ def toggle_custom_degree_section(distribution_type):
     else:
         return {'marginBottom': '20px', 'display': 'none'}
 
-# Callback to validate degree distribution percentages
-@app.callback(
+# Validate degree distribution percentages in the browser on every table edit, without a
+# server round-trip; sums within 0.01 of 100 count as valid so float shares aren't flagged
+app.clientside_callback(
+    """
+    function(degreeParams) {
+        const total = (degreeParams || []).reduce((sum, row) => sum + (Number(row.pct) || 0), 0);
+        if (Math.abs(total - 100) < 0.01) {
+            return "";
+        }
+        return {
+            namespace: "dash_html_components",
+            type: "Div",
+            props: {
+                children: `Warning: Degree percentages sum to ${Math.round(total * 100) / 100}%, not 100%`,
+                style: {color: "red"}
+            }
+        };
+    }
+    """,
     Output("degree-sum-warning", "children"),
-    [Input("ba-pct", "value"),
-     Input("ma-pct", "value"),
-     Input("asst-pct", "value"),
-     Input("asst-shift-pct", "value"),
-     Input("nurse-pct", "value"),
-     Input("na-pct", "value"),
-     Input("trade-pct", "value")]
+    [Input("degree-params", "data")]
 )
-def validate_degree_sum(ba_pct, ma_pct, asst_pct, asst_shift_pct, nurse_pct, na_pct, trade_pct):
-    total = sum(filter(None, [ba_pct, ma_pct, asst_pct, asst_shift_pct, nurse_pct, na_pct, trade_pct]))
-    if total != 100:
-        return html.Div(f"Warning: Degree percentages sum to {total}%, not 100%", style={'color': 'red'})
-    return ""
 
 # Callback to update sliders when a preset is selected
-@app.callback(
-    [Output("ba-pct", "value"),
-     Output("ma-pct", "value"),
-     Output("asst-pct", "value"),
-     Output("nurse-pct", "value"),
-     Output("na-pct", "value"),
-     Output("trade-pct", "value"),
-     Output("asst-shift-pct", "value"),
+# Apply a preset in the browser: set each degree's share (keeping any edited salary
+# parameters), switch to custom mode, describe the preset and fill in its ISA parameters.
+# The table and mode are left untouched when they already match, so the warning and the
+# custom-section toggle (a server round-trip) don't re-fire for nothing
+app.clientside_callback(
+    """
+    function(presetName, presets, degreeParams, distributionType) {
+        const noUpdate = window.dash_clientside.no_update;
+        const preset = presets[presetName] || presets["uganda_baseline"];
+        const unchanged = (degreeParams || []).every((row, i) => row.pct === preset.degree_pcts[i]);
+        const rows = unchanged ? noUpdate
+            : (degreeParams || []).map((row, i) => Object.assign({}, row, {pct: preset.degree_pcts[i]}));
+        const component = (type, props) => ({namespace: "dash_html_components", type: type, props: props});
+        const description = component("Div", {children: [
+            component("P", {children: preset.description, style: {marginBottom: "5px"}}),
+            component("P", {children: `Program Type: ${preset.program_type}`, style: {fontWeight: "bold"}})
+        ]});
+        return [rows, distributionType === "custom" ? noUpdate : "custom", description].concat(preset.isa_params);
+    }
+    """,
+    [Output("degree-params", "data"),
      Output("degree-distribution-type", "value"),
-     Output("preset-description", "children")],
-    [Input("preset-scenario", "value")]
+     Output("preset-description", "children"),
+     Output("isa-percentage-input", "value"),
+     Output("isa-threshold-input", "value"),
+     Output("isa-cap-input", "value"),
+     Output("price-per-student-input", "value")],
+    [Input("preset-scenario", "value")],
+    [State("presets-store", "data"),
+     State("degree-params", "data"),
+     State("degree-distribution-type", "value")]
 )
-def update_from_preset(preset_name):
-    ctx = dash.callback_context
-    triggered_id = ctx.triggered[0]['prop_id'].split('.')[0] if ctx.triggered else None
-    
-    # Use different default presets based on program type
-    if preset_name is None or preset_name not in preset_scenarios:
-        preset_name = 'uganda_baseline'
-    
-    # Get the preset
-    preset = preset_scenarios[preset_name]
-    degrees = preset['degrees']
+
+@memoize_simulation
+def _run_simulation_cached(sim_params):
+    """
+    Run the model for a tuple of (keyword, value) pairs and return Store-ready results.
+    
+    Clicking "Run Simulation" again with unchanged inputs (from any worker) returns the
+    cached results instead of re-running the Monte Carlo simulation.
+    """
+    params = dict(sim_params)
+    results = run_simple_simulation(**params)
+    
+    # By-year series stay NumPy arrays (positional by year): the orjson engine encodes them
+    # natively into the Store as plain JSON lists, with no .tolist() pass over them. Dollar
+    # amounts are only shown to the whole dollar, so they are stored as float32, whose
+    # shortest repr is about half as many digits
+    serializable_results = {
+        'program_type': results['program_type'],
+        'total_investment': results['total_investment'],
+        'price_per_student': results['price_per_student'],
+        'isa_percentage': results['isa_percentage'],
+        'isa_threshold': results['isa_threshold'],
+        'isa_cap': results['isa_cap'],
+        'IRR': results['IRR'],
+        'investor_IRR': results['investor_IRR'],
+        'nominal_IRR': results.get('nominal_IRR', results['IRR']),  # Add nominal IRR
+        'nominal_investor_IRR': results.get('nominal_investor_IRR', results['investor_IRR']),  # Add nominal investor IRR
+        'average_total_payment': results['average_total_payment'],
+        'average_investor_payment': results['average_investor_payment'],
+        'average_malengo_payment': results['average_malengo_payment'],
+        'average_nominal_total_payment': results.get('average_nominal_total_payment', results['average_total_payment']),  # Add nominal payment
+        'average_duration': results['average_duration'],
+        'payment_by_year': results['payment_by_year'].astype(np.float32),
+        'investor_payment_by_year': results['investor_payment_by_year'].astype(np.float32),
+        'malengo_payment_by_year': results['malengo_payment_by_year'].astype(np.float32),
+        'active_students_by_year': results['active_students_by_year'],
+        'payment_quantiles': results['payment_quantiles'],
+        'investor_payment_quantiles': results.get('investor_payment_quantiles', {}),
+        'employment_rate': results['employment_rate'],
+        'ever_employed_rate': results.get('ever_employed_rate', 0),
+        'repayment_rate': results['repayment_rate'],
+        'cap_stats': results['cap_stats'],
+        'leave_labor_force_probability': results['leave_labor_force_probability'],
+        'custom_degrees': results['custom_degrees'],
+        'degree_counts': results['degree_counts'],
+        'degree_pcts': results['degree_pcts'],
+        'initial_unemployment_rate': params['initial_unemployment_rate'],
+        'initial_inflation_rate': params['initial_inflation_rate'],
+        'apply_graduation_delay': True  # Store this information for the payment table
+    }
     
-    # Create a more informative description that includes program type
-    description = html.Div([
-        html.P(f"{preset['description']}", style={'marginBottom': '5px'}),
-        html.P(f"Program Type: {preset['program_type']}", style={'fontWeight': 'bold'})
-    ])
+    return serializable_results
+
+def _canonical_sim_params(sim_params):
+    """
+    Return simulation keyword arguments as a cache key, with equal numbers spelled the same way.
+    
+    Inputs arrive as ints or floats depending on how they were typed (27000 vs 27000.0), and
+    percentage conversions can leave float noise (14.000000000000002); both would otherwise
+    miss the cache for what is the same simulation.
+    """
+    canonical = []
+    for key, value in sim_params.items():
+        if isinstance(value, float):
+            value = round(value, 10)
+            if value.is_integer():
+                value = int(value)
+        canonical.append((key, value))
+    return tuple(canonical)
+
+# Background simulations each run in their own job process, so concurrent identical runs
+# are coalesced through a lock in Redis (Celery workers may be on other machines) or on
+# disk (diskcache jobs run on this one); without either they run in this process and wait
+# on its in-flight Future instead. A lock expires on its own if the job holding it dies.
+if celery_app is not None:
+    def _simulation_lock(sim_params):
+        key = hashlib.sha1(repr(sim_params).encode()).hexdigest()
+        return redis_client.lock(f"simulation-lock:{key}", timeout=600)
+elif DISKCACHE_AVAILABLE:
+    _simulation_locks = diskcache.Cache(os.path.join(CACHE_DIR, 'locks'))
+    
+    def _simulation_lock(sim_params):
+        return diskcache.Lock(_simulation_locks, sim_params, expire=600)
+else:
+    _simulation_lock = None
+_inflight_simulations = {}
+_inflight_simulations_lock = threading.Lock()
+
+def _run_simulation_coalesced(sim_params):
+    """
+    Run _run_simulation_cached, sharing one run between concurrent identical requests.
+    
+    The first request for a set of parameters runs the simulation; requests with the same
+    parameters that arrive while it is running wait for it to finish and then read its
+    memoized result instead of starting their own run.
+    """
+    if _simulation_lock is not None:
+        with _simulation_lock(sim_params):
+            return _run_simulation_cached(sim_params)
+    
+    with _inflight_simulations_lock:
+        future = _inflight_simulations.get(sim_params)
+        is_owner = future is None
+        if is_owner:
+            future = _inflight_simulations[sim_params] = Future()
+    
+    if not is_owner:
+        return future.result()
     
-    # Set the sliders to the preset values (multiply by 100 for percentages)
-    return (
-        degrees.get('BA', 0) * 100, 
-        degrees.get('MA', 0) * 100, 
-        degrees.get('ASST', 0) * 100,
-        degrees.get('NURSE', 0) * 100,
-        degrees.get('NA', 0) * 100,
-        degrees.get('TRADE', 0) * 100,
-        degrees.get('ASST_SHIFT', 0) * 100,
-        "custom",  # Switch to custom mode
-        description
-    )
+    try:
+        results = _run_simulation_cached(sim_params)
+        future.set_result(results)
+        return results
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_simulations_lock:
+            del _inflight_simulations[sim_params]
 
 # Define callback for running the simulation
 @app.callback(
     [Output("loading-message", "children"),
-     Output("simulation-results-store", "data")],
+     Output("simulation-results-store", "data"),
+     Output("simulation-params-key", "data")],
     [Input("run-simulation", "n_clicks")],
-    [State("degree-distribution-type", "value"),
+    [State("simulation-params-key", "data"),
+     State("degree-distribution-type", "value"),
      State("preset-scenario", "value"),
-     State("ba-pct", "value"),
-     State("ma-pct", "value"),
-     State("asst-pct", "value"),
-     State("asst-shift-pct", "value"),
-     State("nurse-pct", "value"),
-     State("na-pct", "value"),
-     State("trade-pct", "value"),
-     State("ba-salary", "value"),
-     State("ba-std", "value"),
-     State("ba-growth", "value"),
-     State("ma-salary", "value"),
-     State("ma-std", "value"),
-     State("ma-growth", "value"),
-     State("asst-salary", "value"),
-     State("asst-std", "value"),
-     State("asst-growth", "value"),
-     State("asst-shift-salary", "value"),
-     State("asst-shift-std", "value"),
-     State("asst-shift-growth", "value"),
-     State("nurse-salary", "value"),
-     State("nurse-std", "value"),
-     State("nurse-growth", "value"),
-     State("na-salary", "value"),
-     State("na-std", "value"),
-     State("na-growth", "value"),
-     State("trade-salary", "value"),
-     State("trade-std", "value"),
-     State("trade-growth", "value"),
+     State("degree-params", "data"),
      State("isa-percentage-input", "value"),
      State("isa-threshold-input", "value"),
      State("isa-cap-input", "value"),
@@ -1363,43 +1361,55 @@ def update_from_preset(preset_name):
      State("num-sims", "value"),
      State("unemployment-rate", "value"),
      State("inflation-rate", "value"),
-     State("leave-labor-force-prob", "value")]
+     State("leave-labor-force-prob", "value")],
+    prevent_initial_call=True,
+    # Run in a background process when diskcache is available, with the button disabled
+    # until the results are in so repeated clicks don't queue more simulations
+    background=background_callback_manager is not None,
+    running=[(Output("run-simulation", "disabled"), True, False)]
 )
-def run_simulation(n_clicks, degree_dist_type, preset_scenario, ba_pct, ma_pct, asst_pct, asst_shift_pct, nurse_pct, na_pct, trade_pct,
-                   ba_salary, ba_std, ba_growth, ma_salary, ma_std, ma_growth, 
-                   asst_salary, asst_std, asst_growth, asst_shift_salary, asst_shift_std, asst_shift_growth,
-                   nurse_salary, nurse_std, nurse_growth,
-                   na_salary, na_std, na_growth, trade_salary, trade_std, trade_growth,
+def run_simulation(n_clicks, last_params_key, degree_dist_type, preset_scenario, degree_params,
                    isa_percentage, isa_threshold, isa_cap, price_per_student,
                    num_students, num_sims, unemployment_rate, inflation_rate, 
                    leave_labor_force_prob):
     if n_clicks is None:
         raise PreventUpdate
     
-    # Get program type from preset scenario
-    program_type = preset_scenarios[preset_scenario]['program_type'] if preset_scenario in preset_scenarios else 'Uganda'
-    
-    # Convert percentages to decimals
-    unemployment_rate = unemployment_rate / 100.0
-    inflation_rate = inflation_rate / 100.0
-    leave_labor_force_prob = leave_labor_force_prob / 100.0
-    isa_percentage = isa_percentage / 100.0
-    
-    # Determine scenario based on degree distribution type
-    scenario = 'custom'  # We now always use custom since we removed the default option
-    
-    # Convert percentages to decimals
-    ba_pct_decimal = ba_pct / 100.0
-    ma_pct_decimal = ma_pct / 100.0
-    asst_pct_decimal = asst_pct / 100.0
-    asst_shift_pct_decimal = asst_shift_pct / 100.0 if asst_shift_pct is not None else 0
-    nurse_pct_decimal = nurse_pct / 100.0
-    na_pct_decimal = na_pct / 100.0
-    trade_pct_decimal = trade_pct / 100.0
-    
-    # Run the simulation
+    # Inputs the user has cleared (or typed out of range) arrive as None, which the
+    # conversions below reject along with the simulation itself
     try:
-        results = run_simple_simulation(
+        # Unpack each degree's row of the degree parameters table
+        ba_pct, ba_salary, ba_std, ba_growth = _degree_table_params(degree_params, 'BA')
+        ma_pct, ma_salary, ma_std, ma_growth = _degree_table_params(degree_params, 'MA')
+        asst_pct, asst_salary, asst_std, asst_growth = _degree_table_params(degree_params, 'ASST')
+        asst_shift_pct, asst_shift_salary, asst_shift_std, asst_shift_growth = _degree_table_params(degree_params, 'ASST_SHIFT')
+        nurse_pct, nurse_salary, nurse_std, nurse_growth = _degree_table_params(degree_params, 'NURSE')
+        na_pct, na_salary, na_std, na_growth = _degree_table_params(degree_params, 'NA')
+        trade_pct, trade_salary, trade_std, trade_growth = _degree_table_params(degree_params, 'TRADE')
+        
+        # Get program type from preset scenario
+        program_type = preset_scenarios[preset_scenario]['program_type'] if preset_scenario in preset_scenarios else 'Uganda'
+        
+        # Convert percentages to decimals
+        unemployment_rate = unemployment_rate / 100.0
+        inflation_rate = inflation_rate / 100.0
+        leave_labor_force_prob = leave_labor_force_prob / 100.0
+        isa_percentage = isa_percentage / 100.0
+        
+        # Determine scenario based on degree distribution type
+        scenario = 'custom'  # We now always use custom since we removed the default option
+        
+        # Convert percentages to decimals
+        ba_pct_decimal = ba_pct / 100.0
+        ma_pct_decimal = ma_pct / 100.0
+        asst_pct_decimal = asst_pct / 100.0
+        asst_shift_pct_decimal = asst_shift_pct / 100.0 if asst_shift_pct is not None else 0
+        nurse_pct_decimal = nurse_pct / 100.0
+        na_pct_decimal = na_pct / 100.0
+        trade_pct_decimal = trade_pct / 100.0
+        
+        # Run the simulation
+        sim_params = dict(
             program_type=program_type,
             num_students=num_students,
             num_sims=num_sims,
@@ -1439,443 +1449,83 @@ def run_simulation(n_clicks, degree_dist_type, preset_scenario, ba_pct, ma_pct,
             new_malengo_fee=True,
             apply_graduation_delay=True  # Enable the graduation delay feature
         )
+        canonical_params = _canonical_sim_params(sim_params)
         
-        # Convert DataFrames to JSON for storage
-        serializable_results = {
-            'program_type': results['program_type'],
-            'total_investment': results['total_investment'],
-            'price_per_student': results['price_per_student'],
-            'isa_percentage': results['isa_percentage'],
-            'isa_threshold': results['isa_threshold'],
-            'isa_cap': results['isa_cap'],
-            'IRR': results['IRR'],
-            'investor_IRR': results['investor_IRR'],
-            'nominal_IRR': results.get('nominal_IRR', results['IRR']),  # Add nominal IRR
-            'nominal_investor_IRR': results.get('nominal_investor_IRR', results['investor_IRR']),  # Add nominal investor IRR
-            'average_total_payment': results['average_total_payment'],
-            'average_investor_payment': results['average_investor_payment'],
-            'average_malengo_payment': results['average_malengo_payment'],
-            'average_nominal_total_payment': results.get('average_nominal_total_payment', results['average_total_payment']),  # Add nominal payment
-            'average_duration': results['average_duration'],
-            'payment_by_year': results['payment_by_year'].to_dict(),
-            'investor_payment_by_year': results['investor_payment_by_year'].to_dict(),
-            'malengo_payment_by_year': results['malengo_payment_by_year'].to_dict(),
-            'active_students_by_year': results['active_students_by_year'].to_dict(),
-            'payment_quantiles': results['payment_quantiles'],
-            'investor_payment_quantiles': results.get('investor_payment_quantiles', {}),
-            'employment_rate': results['employment_rate'],
-            'ever_employed_rate': results.get('ever_employed_rate', 0),
-            'repayment_rate': results['repayment_rate'],
-            'cap_stats': results['cap_stats'],
-            'leave_labor_force_probability': results['leave_labor_force_probability'],
-            'custom_degrees': results['custom_degrees'],
-            'degree_counts': results['degree_counts'],
-            'degree_pcts': results['degree_pcts'],
-            'initial_unemployment_rate': unemployment_rate,
-            'initial_inflation_rate': inflation_rate,
-            'apply_graduation_delay': True  # Store this information for the payment table
-        }
+        # The browser already holds these results: leave the Store alone so the result views
+        # aren't re-rendered (and the results aren't sent again)
+        params_key = hashlib.sha1(repr(canonical_params).encode()).hexdigest()
+        if params_key == last_params_key:
+            return "Simulation completed!", dash.no_update, dash.no_update
         
-        return "Simulation completed!", serializable_results
+        serializable_results = _run_simulation_coalesced(canonical_params)
+        
+        return "Simulation completed!", serializable_results, params_key
     
     except Exception as e:
-        return f"Error in simulation: {str(e)}", None
+        return f"Error in simulation: {str(e)}", None, None
 
-# Update summary stats to include degree distribution
-@app.callback(
+# Summary stats are pure formatting, so they are rendered in the browser without a server round-trip
+app.clientside_callback(
+    """
+    function(results) {
+        if (!results) {
+            return "Run a simulation to see results";
+        }
+        
+        // Instead of showing redundant information, just display a message directing users to the tabs
+        const component = (type, props) => ({namespace: "dash_html_components", type: type, props: props});
+        return component("Div", {
+            children: [
+                component("H4", {children: "Simulation Complete", style: {color: "#4CAF50"}}),
+                component("P", {children: "Your simulation has completed successfully. Please explore the tabs below to view detailed results and analysis."}),
+                component("P", {children: "Each tab contains different visualizations and metrics to help you understand the simulation outcomes."})
+            ],
+            style: {padding: "15px", backgroundColor: "#f9f9f9", borderRadius: "5px", marginBottom: "20px"}
+        });
+    }
+    """,
     Output("summary-stats", "children"),
-    [Input("simulation-results-store", "data")]
-)
-def update_summary_stats(results):
-    if not results:
-        return "Run a simulation to see results"
-    
-    # Instead of showing redundant information, just display a message directing users to the tabs
-    return html.Div([
-        html.H4("Simulation Complete", style={'color': '#4CAF50'}),
-        html.P("Your simulation has completed successfully. Please explore the tabs below to view detailed results and analysis."),
-        html.P("Each tab contains different visualizations and metrics to help you understand the simulation outcomes.")
-    ], style={'padding': '15px', 'backgroundColor': '#f9f9f9', 'borderRadius': '5px', 'marginBottom': '20px'})
-
-# Callback for payment distribution graph
-@app.callback(
-    Output("payment-distribution", "figure"),
-    [Input("simulation-results-store", "data")]
+    [Input("simulation-results-store", "data")],
+    prevent_initial_call=True
 )
-def update_payment_distribution(results):
-    if not results:
-        return go.Figure()
-    
-    # Convert stored dict back to pandas Series
-    payment_by_year = pd.Series(results['payment_by_year'])
-    
-    # Create the payment distribution graph
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        x=payment_by_year.index,
-        y=payment_by_year.values,
-        name="Average Payment by Year",
-        marker_color='rgb(55, 83, 109)',
-        hovertemplate="Year: %{x}<br>Average Payment: $%{y:,.0f}<extra></extra>"
-    ))
-    
-    fig.update_layout(
-        title=f"{results['program_type']} Program - Average Payments by Year",
-        xaxis_title="Year",
-        yaxis_title="Payment Amount ($)",
-        template="plotly_white",
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        )
-    )
-    
-    return fig
 
-# Callback for IRR distribution
-@app.callback(
-    Output("irr-distribution", "figure"),
-    [Input("simulation-results-store", "data")]
-)
-def update_irr_distribution(results):
-    if not results:
-        return go.Figure()
-    
-    # Create the IRR distribution graph
-    fig = go.Figure()
-    
-    # Extract quantile values - with fallbacks for missing data
-    quantiles = {}
-    
-    # Prioritize nominal investor payment quantiles
-    if 'nominal_investor_payment_quantiles' in results:
-        quantiles = results['nominal_investor_payment_quantiles']
-    elif 'nominal_payment_quantiles' in results:
-        quantiles = results['nominal_payment_quantiles']
-    elif 'investor_payment_quantiles' in results:
-        quantiles = results['investor_payment_quantiles']
-    elif 'payment_quantiles' in results:
-        quantiles = results['payment_quantiles']
-    else:
-        # Create default quantiles if none are available
-        quantiles = {
-            '0': 0,
-            '0.25': 0.02,
-            '0.5': 0.05,
-            '0.75': 0.08,
-            '1.0': 0.12
+# Payment distribution graph, drawn in the browser: only the bar data and title change, the
+# rest of the figure is the _PAYMENT_DISTRIBUTION_FIGURE already on the page. Stored year
+# lists are positional, so the year is just the list index.
+app.clientside_callback(
+    """
+    function(results, figure) {
+        if (!results) {
+            return window.dash_clientside.no_update;
         }
-    
-    # Create data for quantile plot
-    quantile_labels = ['Minimum', '25th Percentile', 'Median', '75th Percentile', 'Maximum']
-    quantile_values = [
-        float(quantiles.get('0', 0)), 
-        float(quantiles.get('0.25', 0.02)), 
-        float(quantiles.get('0.5', 0.05)), 
-        float(quantiles.get('0.75', 0.08)), 
-        float(quantiles.get('1.0', 0.12))
-    ]
-    
-    # Add a bar chart for quantiles
-    fig.add_trace(go.Bar(
-        x=quantile_labels,
-        y=quantile_values,
-        marker_color='rgb(158,202,225)',
-        name='Investor IRR Quantiles'
-    ))
-    
-    # Add a horizontal line for the overall IRR (less prominent)
-    # Always prioritize nominal_investor_IRR
-    irr_value = results.get('nominal_investor_IRR', results.get('investor_IRR', 0.06))  # Use nominal_investor_IRR as primary source
-    fig.add_trace(go.Scatter(
-        x=quantile_labels,
-        y=[irr_value] * len(quantile_labels),
-        mode='lines',
-        name='Overall Investor IRR',
-        line=dict(color='rgb(55, 83, 109)', dash='dash', width=1.5)
-    ))
-    
-    fig.update_layout(
-        title=f"{results['program_type']} Program - Nominal Investor IRR Distribution",
-        xaxis_title="Percentile",
-        yaxis_title="IRR",
-        yaxis_tickformat='.2%',
-        template="plotly_white",
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        )
-    )
-    
-    return fig
-
-# Callback for student outcome statistics
-@app.callback(
-    Output("student-outcome-stats", "children"),
-    [Input("simulation-results-store", "data")]
-)
-def update_student_outcome_stats(results):
-    if not results:
-        return html.Div("Run a simulation to see student outcome statistics")
-    
-    # Get cap stats with fallback for missing keys
-    cap_stats = results.get('cap_stats', {})
-    
-    # If cap_stats only has percentages but not counts, calculate the counts
-    num_students = 0
-    for degree, count in results.get('degree_counts', {}).items():
-        num_students += count
-    
-    if num_students == 0:
-        num_students = 100  # Default value
-    
-    # Initialize with zeros to ensure we have values
-    if 'payment_cap_count' not in cap_stats and 'payment_cap_pct' in cap_stats:
-        cap_stats['payment_cap_count'] = cap_stats['payment_cap_pct'] * num_students
-    
-    if 'years_cap_count' not in cap_stats and 'years_cap_pct' in cap_stats:
-        cap_stats['years_cap_count'] = cap_stats['years_cap_pct'] * num_students
-    
-    if 'no_cap_count' not in cap_stats and 'no_cap_pct' in cap_stats:
-        cap_stats['no_cap_count'] = cap_stats['no_cap_pct'] * num_students
-    
-    # Ensure all required keys exist with default values
-    for key in ['payment_cap_count', 'years_cap_count', 'no_cap_count',
-                'payment_cap_pct', 'years_cap_pct', 'no_cap_pct',
-                'avg_repayment_cap_hit', 'avg_repayment_years_hit', 'avg_repayment_no_cap']:
-        if key not in cap_stats:
-            cap_stats[key] = 0
-    
-    # Calculate total students in each category
-    total_students = cap_stats['payment_cap_count'] + cap_stats['years_cap_count'] + cap_stats['no_cap_count']
-    
-    # Create a table for cap statistics
-    cap_table = pd.DataFrame({
-        'Category': ['Hit Payment Cap', 'Hit 10-Years Cap', 'Hit No Cap'],
-        'Count': [
-            f"{cap_stats['payment_cap_count']:.1f}",
-            f"{cap_stats['years_cap_count']:.1f}",
-            f"{cap_stats['no_cap_count']:.1f}"
-        ],
-        'Percentage': [
-            f"{cap_stats['payment_cap_pct']*100:.1f}%",
-            f"{cap_stats['years_cap_pct']*100:.1f}%", 
-            f"{cap_stats['no_cap_pct']*100:.1f}%"
-        ],
-        'Avg Repayment': [
-            f"${cap_stats['avg_repayment_cap_hit']:,.0f}",
-            f"${cap_stats['avg_repayment_years_hit']:,.0f}",
-            f"${cap_stats['avg_repayment_no_cap']:,.0f}"
-        ]
-    })
-    
-    # Convert to Dash table
-    table = dash_table.DataTable(
-        data=cap_table.to_dict('records'),
-        columns=[{'name': col, 'id': col} for col in cap_table.columns],
-        style_cell={'textAlign': 'center', 'padding': '10px'},
-        style_header={
-            'backgroundColor': 'rgb(230, 230, 230)',
-            'fontWeight': 'bold'
-        },
-        style_data_conditional=[
-            {
-                'if': {'row_index': 'odd'},
-                'backgroundColor': 'rgb(248, 248, 248)'
-            }
-        ]
-    )
-    
-    # Add summary statistics
-    summary_stats = html.Div([
-        html.H4("Student Payment Categories", style={'marginBottom': '15px', 'textAlign': 'center'}),
-        html.Div([
-            html.P(f"Annual Employment Rate: {results['employment_rate']*100:.1f}%", style={'fontWeight': 'bold'}),
-            html.P(f"Ever Employed Rate: {results.get('ever_employed_rate', 0)*100:.1f}%", style={'fontWeight': 'bold'}),
-            html.P(f"Students Making Payments: {results['repayment_rate']*100:.1f}%", style={'fontWeight': 'bold'}),
-        ], style={'textAlign': 'center', 'marginBottom': '15px'}),
-        table,
-        html.Div([
-            html.P(f"Average Cap Value When Hit: ${cap_stats.get('avg_cap_value', results.get('isa_cap', 0)):,.0f}", 
-                 style={'marginTop': '15px', 'color': '#2a6496', 'fontWeight': 'bold', 'textAlign': 'center'})
-        ])
-    ])
-    
-    return summary_stats
-
-# New callback for repayment caps chart
-@app.callback(
-    Output("repayment-caps-chart", "figure"),
-    [Input("simulation-results-store", "data")]
+        const paymentByYear = results.payment_by_year;
+        const data = figure.data.slice();
+        data[0] = Object.assign({}, data[0], {x: paymentByYear.map((payment, year) => year), y: paymentByYear});
+        const title = Object.assign({}, figure.layout.title, {text: `${results.program_type} Program - Average Payments by Year`});
+        return Object.assign({}, figure, {data: data, layout: Object.assign({}, figure.layout, {title: title})});
+    }
+    """,
+    Output("payment-distribution", "figure"),
+    [Input("simulation-results-store", "data")],
+    [State("payment-distribution", "figure")],
+    prevent_initial_call=True
 )
-def update_repayment_caps_chart(results):
-    if not results:
-        return go.Figure()
-    
-    # Get cap stats with fallback for missing keys
-    cap_stats = results.get('cap_stats', {})
-    
-    # Ensure all required keys exist with default values
-    for key in ['payment_cap_count', 'years_cap_count', 'no_cap_count',
-                'avg_repayment_cap_hit', 'avg_repayment_years_hit', 'avg_repayment_no_cap']:
-        if key not in cap_stats:
-            cap_stats[key] = 0
-    
-    # Create data for the figure
-    categories = ['Hit Payment Cap', 'Hit 10-Years Cap', 'Hit No Cap']
-    counts = [cap_stats['payment_cap_count'], cap_stats['years_cap_count'], cap_stats['no_cap_count']]
-    avg_repayments = [cap_stats['avg_repayment_cap_hit'], cap_stats['avg_repayment_years_hit'], cap_stats['avg_repayment_no_cap']]
-    
-    # Create combined student count and average repayment chart
-    fig = go.Figure()
-    
-    # Add student count bars
-    fig.add_trace(go.Bar(
-        x=categories,
-        y=counts,
-        name='Student Count',
-        marker_color='rgb(55, 83, 109)',
-        yaxis='y'
-    ))
-
-    # Add average repayment line
-    fig.add_trace(go.Scatter(
-        x=categories,
-        y=avg_repayments,
-        name='Avg Repayment ($)',
-        marker_color='rgb(26, 118, 255)',
-        mode='lines+markers',
-        marker=dict(size=12),
-        line=dict(width=4),
-        yaxis='y2'
-    ))
 
-    # Add cost per student line
-    fig.add_trace(go.Scatter(
-        x=categories,
-        y=[results['price_per_student']] * 3,
-        name='Cost Per Student',
-        marker_color='rgb(255, 99, 71)',
-        mode='lines',
-        line=dict(width=2, dash='dash'),
-        yaxis='y2'
-    ))
-    
-    # Update layout with secondary y-axis
-    fig.update_layout(
-        title='Student Outcomes by Repayment Category',
-        xaxis_title='Repayment Category',
-        yaxis=dict(
-            title='Number of Students',
-            side='left'
-        ),
-        yaxis2=dict(
-            title='Amount ($)',
-            side='right',
-            overlaying='y',
-            showgrid=False
-        ),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        ),
-        template='plotly_white'
-    )
-    
-    return fig
+# Scenario and degree info panels (filled by update_result_views)
+def update_scenario_details(results):
+    return update_scenario_info(results), update_degree_info(results)
 
-# Callback for detailed results
-@app.callback(
-    Output("detailed-results", "children"),
-    [Input("simulation-results-store", "data")]
+# Rows of the scenario parameters table: (label, results key, format string)
+_SCENARIO_INFO_FIELDS = (
+    ("Program Type:", 'program_type', "{}"),
+    ("ISA Percentage:", 'isa_percentage', "{:.1%}"),
+    ("ISA Threshold:", 'isa_threshold', "${:.2f}"),
+    ("ISA Cap:", 'isa_cap', "${:.2f}"),
+    ("Initial Unemployment:", 'initial_unemployment_rate', "{:.1%}"),
+    ("Initial Inflation:", 'initial_inflation_rate', "{:.1%}"),
+    ("Leave Labor Force Probability:", 'leave_labor_force_probability', "{:.1%}"),
 )
-def update_detailed_results(results):
-    if not results:
-        return "Run a simulation to see results"
-    
-    # Get cap stats with fallback for missing keys
-    cap_stats = results.get('cap_stats', {})
-    
-    # Ensure all required keys exist with default values
-    for key in ['payment_cap_pct', 'years_cap_pct', 'no_cap_pct',
-                'avg_repayment_cap_hit', 'avg_repayment_years_hit', 'avg_repayment_no_cap']:
-        if key not in cap_stats:
-            cap_stats[key] = 0
-    
-    # Create a list of detailed statistics
-    content_elements = [
-        html.Div([
-            html.H4("Repayment Statistics"),
-            html.Table([
-                html.Tr([html.Th("Metric"), html.Th("Value")]),
-                html.Tr([
-                    html.Td("Students Hitting Payment Cap"),
-                    html.Td(f"{cap_stats['payment_cap_pct']*100:.1f}%")
-                ]),
-                html.Tr([
-                    html.Td("Students Hitting Years Cap"),
-                    html.Td(f"{cap_stats['years_cap_pct']*100:.1f}%")
-                ]),
-                html.Tr([
-                    html.Td("Students Not Hitting Cap"),
-                    html.Td(f"{cap_stats['no_cap_pct']*100:.1f}%")
-                ])
-            ], style={'width': '100%', 'marginBottom': '20px'})
-        ]),
-        
-        html.Div([
-            html.H4("Average Repayment by Cap Type"),
-            html.Table([
-                html.Tr([html.Th("Category"), html.Th("Average Repayment")]),
-                html.Tr([
-                    html.Td("Payment Cap Hit"),
-                    html.Td(f"${cap_stats['avg_repayment_cap_hit']:,.0f}")
-                ]),
-                html.Tr([
-                    html.Td("Years Cap Hit"),
-                    html.Td(f"${cap_stats['avg_repayment_years_hit']:,.0f}")
-                ]),
-                html.Tr([
-                    html.Td("No Cap Hit"),
-                    html.Td(f"${cap_stats['avg_repayment_no_cap']:,.0f}")
-                ]),
-                html.Tr([
-                    html.Td("Average Cap Value When Hit"),
-                    html.Td(f"${cap_stats.get('avg_cap_value', results.get('isa_cap', 0)):,.0f}")
-                ], style={'color': '#2a6496'})
-            ], style={'width': '100%', 'marginBottom': '20px'})
-        ]),
-        
-        html.Div([
-            html.H4("Degree Distribution"),
-            html.Table([
-                html.Tr([html.Th("Degree Type"), html.Th("Percentage"), html.Th("Count")]),
-                *[html.Tr([
-                    html.Td(degree),
-                    html.Td(f"{pct*100:.1f}%"),
-                    html.Td(f"{results['degree_counts'].get(degree, 0):.1f}" if degree in results.get('degree_counts', {}) else "-"),
-                ]) for degree, pct in results['degree_pcts'].items() if pct > 0]
-            ], style={'width': '100%', 'marginBottom': '20px'})
-        ])
-    ]
-    
-    return html.Div(content_elements)
 
-# Add a callback for the scenario info tab
-@app.callback(
-    Output("scenario-info", "children"),
-    [Input("simulation-results-store", "data")]
-)
 def update_scenario_info(results):
     if results is None:
         return html.Div()
@@ -1888,30 +1538,22 @@ def update_scenario_info(results):
                 html.Th("Value")
             ])),
             html.Tbody([
-                html.Tr([html.Td("Program Type:"), html.Td(results['program_type'])]),
-                html.Tr([html.Td("ISA Percentage:"), html.Td(f"{results['isa_percentage']*100:.1f}%")]),
-                html.Tr([html.Td("ISA Threshold:"), html.Td(f"${results['isa_threshold']:.2f}")]),
-                html.Tr([html.Td("ISA Cap:"), html.Td(f"${results['isa_cap']:.2f}")]),
-                html.Tr([html.Td("Initial Unemployment:"), html.Td(f"{results['initial_unemployment_rate']*100:.1f}%")]),
-                html.Tr([html.Td("Initial Inflation:"), html.Td(f"{results['initial_inflation_rate']*100:.1f}%")]),
-                html.Tr([html.Td("Leave Labor Force Probability:"), html.Td(f"{results['leave_labor_force_probability']*100:.1f}%")]),
+                html.Tr([html.Td(label), html.Td(value_format.format(results[key]))])
+                for label, key, value_format in _SCENARIO_INFO_FIELDS
             ])
         ], className="table table-striped table-sm")
     ]
     
     return html.Div(scenario_info)
 
-# Callback for degree info - update to show custom degree distribution if used
-@app.callback(
-    Output("degree-info", "children"),
-    [Input("simulation-results-store", "data")]
-)
+# Degree info - show custom degree distribution if used
 def update_degree_info(results):
     if not results:
         return "Run a simulation to see results"
     
-    # Get degree percentages
+    # Get degree percentages and counts
     degree_pcts = results.get('degree_pcts', {})
+    degree_counts = results.get('degree_counts', {})
     
     # Create a list of degree information
     content_elements = [
@@ -1922,7 +1564,7 @@ def update_degree_info(results):
                 *[html.Tr([
                     html.Td(degree),
                     html.Td(f"{pct*100:.1f}%"),
-                    html.Td(f"{results['degree_counts'].get(degree, 0):.1f}" if degree in results.get('degree_counts', {}) else "-"),
+                    html.Td(f"{degree_counts[degree]:.1f}" if degree in degree_counts else "-"),
                 ]) for degree, pct in degree_pcts.items() if pct > 0]
             ], style={'width': '100%', 'marginBottom': '20px'})
         ])
@@ -1930,29 +1572,18 @@ def update_degree_info(results):
     
     return html.Div(content_elements)
 
-# Add callback to update ISA parameters based on preset scenario
-@app.callback(
-    [Output("isa-percentage-input", "value"),
-     Output("isa-threshold-input", "value"),
-     Output("isa-cap-input", "value"),
-     Output("price-per-student-input", "value")],
-    [Input("preset-scenario", "value")]
+# Result fields used by compare_scenarios; saved scenarios store nothing else
+_SAVED_SCENARIO_FIELDS = (
+    'nominal_IRR',
+    'nominal_investor_IRR',
+    'average_nominal_total_payment',
+    'average_duration',
+    'employment_rate',
+    'ever_employed_rate',
+    'repayment_rate',
+    'cap_stats',
+    'degree_pcts'
 )
-def update_isa_params(preset_scenario):
-    # Get program type from preset scenario
-    if preset_scenario in preset_scenarios:
-        program_type = preset_scenarios[preset_scenario]['program_type']
-    else:
-        program_type = 'Uganda'  # Default
-    
-    if program_type == 'Uganda':
-        return 14, 27000, 72500, 29000
-    elif program_type == 'Kenya':
-        return 12, 27000, 49950, 16650
-    elif program_type == 'Rwanda':
-        return 12, 27000, 45000, 16650  # Changed from 10% to 12%
-    else:
-        return 12, 27000, 50000, 20000  # Default values
 
 # Add callbacks for scenario comparison functionality
 @app.callback(
@@ -1983,8 +1614,11 @@ def manage_saved_scenarios(save_clicks, clear_clicks, scenario_name, current_res
         if not scenario_name or not current_results:
             return saved_scenarios, [html.Div("Please enter a scenario name and run a simulation first.")]
         
-        # Add current results to saved scenarios
-        saved_scenarios[scenario_name] = current_results
+        # Keep only the fields the comparison view reads, so the saved-scenarios
+        # Store doesn't carry every by-year series back and forth through the browser
+        saved_scenarios[scenario_name] = {
+            field: current_results[field] for field in _SAVED_SCENARIO_FIELDS if field in current_results
+        }
         
         # Create list of saved scenarios
         scenario_items = []
@@ -2013,6 +1647,18 @@ def manage_saved_scenarios(save_clicks, clear_clicks, scenario_name, current_res
     # Return current state if no action taken
     return saved_scenarios, dash.no_update
 
+def _comparison_table(rows):
+    """
+    Render a list of same-keyed row dicts of formatted strings as a static html.Table.
+    
+    Header, cell and row-striping styles come from the comparison-table class in
+    assets/comparison_tables.css, so they aren't repeated on every cell.
+    """
+    return html.Table([
+        html.Thead(html.Tr([html.Th(column) for column in rows[0]])),
+        html.Tbody([html.Tr([html.Td(value) for value in row.values()]) for row in rows])
+    ], className="comparison-table")
+
 @app.callback(
     Output("scenario-comparison-results", "children"),
     [Input("compare-scenarios-button", "n_clicks")],
@@ -2049,19 +1695,17 @@ def compare_scenarios(n_clicks, saved_scenarios):
             'Total IRR': scenario['data'].get('nominal_IRR', 0) * 100
         })
     
-    irr_df = pd.DataFrame(irr_data)
-    
     irr_fig = go.Figure()
     irr_fig.add_trace(go.Bar(
-        x=irr_df['Scenario'],
-        y=irr_df['Investor IRR'],
+        x=[row['Scenario'] for row in irr_data],
+        y=[row['Investor IRR'] for row in irr_data],
         name='Investor IRR',
         marker_color='rgb(26, 118, 255)'
     ))
     
     irr_fig.add_trace(go.Bar(
-        x=irr_df['Scenario'],
-        y=irr_df['Total IRR'],
+        x=[row['Scenario'] for row in irr_data],
+        y=[row['Total IRR'] for row in irr_data],
         name='Total IRR (before fees)',
         marker_color='rgb(55, 83, 109)',
         opacity=0.7
@@ -2090,21 +1734,7 @@ def compare_scenarios(n_clicks, saved_scenarios):
             'Duration': f"{scenario['data'].get('average_duration', 0):.1f} years"
         })
     
-    metrics_table = dash_table.DataTable(
-        data=metrics_data,
-        columns=[{"name": col, "id": col} for col in metrics_data[0].keys()],
-        style_cell={'textAlign': 'center', 'padding': '10px'},
-        style_header={
-            'backgroundColor': 'rgb(230, 230, 230)',
-            'fontWeight': 'bold'
-        },
-        style_data_conditional=[
-            {
-                'if': {'row_index': 'odd'},
-                'backgroundColor': 'rgb(248, 248, 248)'
-            }
-        ]
-    )
+    metrics_table = _comparison_table(metrics_data)
     
     comparison_elements.append(html.Div([
         html.H5("Key Metrics by Scenario", style={'marginTop': '30px', 'marginBottom': '15px'}),
@@ -2124,21 +1754,7 @@ def compare_scenarios(n_clicks, saved_scenarios):
             'No Cap %': f"{scenario['data'].get('cap_stats', {}).get('no_cap_pct', 0)*100:.1f}%"
         })
     
-    outcomes_table = dash_table.DataTable(
-        data=outcomes_data,
-        columns=[{"name": col, "id": col} for col in outcomes_data[0].keys()],
-        style_cell={'textAlign': 'center', 'padding': '10px'},
-        style_header={
-            'backgroundColor': 'rgb(230, 230, 230)',
-            'fontWeight': 'bold'
-        },
-        style_data_conditional=[
-            {
-                'if': {'row_index': 'odd'},
-                'backgroundColor': 'rgb(248, 248, 248)'
-            }
-        ]
-    )
+    outcomes_table = _comparison_table(outcomes_data)
     
     comparison_elements.append(html.Div([
         html.H5("Student Outcomes by Scenario", style={'marginTop': '30px', 'marginBottom': '15px'}),
@@ -2159,21 +1775,7 @@ def compare_scenarios(n_clicks, saved_scenarios):
             'TRADE': f"{degree_pcts.get('TRADE', 0)*100:.1f}%"
         })
     
-    degree_table = dash_table.DataTable(
-        data=degree_data,
-        columns=[{"name": col, "id": col} for col in degree_data[0].keys()],
-        style_cell={'textAlign': 'center', 'padding': '10px'},
-        style_header={
-            'backgroundColor': 'rgb(230, 230, 230)',
-            'fontWeight': 'bold'
-        },
-        style_data_conditional=[
-            {
-                'if': {'row_index': 'odd'},
-                'backgroundColor': 'rgb(248, 248, 248)'
-            }
-        ]
-    )
+    degree_table = _comparison_table(degree_data)
     
     comparison_elements.append(html.Div([
         html.H5("Degree Distribution by Scenario", style={'marginTop': '30px', 'marginBottom': '15px'}),
@@ -2188,22 +1790,25 @@ def compare_scenarios(n_clicks, saved_scenarios):
     
     return "", html.Div(viz_elements)
 
-@app.callback(
+# Validate the blended scenario weights in the browser, like the degree-sum warning
+app.clientside_callback(
+    """
+    function(weight1, weight2, weight3) {
+        if (weight1 == null || weight2 == null || weight3 == null) {
+            return "Please enter weights for all scenarios.";
+        }
+        const total = weight1 + weight2 + weight3;
+        if (total !== 100) {
+            return `Warning: Weights sum to ${total}%, not 100%. Please adjust the weights.`;
+        }
+        return "";
+    }
+    """,
     Output("weight-sum-warning", "children"),
     [Input("scenario1-weight", "value"),
      Input("scenario2-weight", "value"),
      Input("scenario3-weight", "value")]
 )
-def validate_weight_sum(weight1, weight2, weight3):
-    if weight1 is None or weight2 is None or weight3 is None:
-        return "Please enter weights for all scenarios."
-    
-    total = weight1 + weight2 + weight3
-    
-    if total != 100:
-        return f"Warning: Weights sum to {total}%, not 100%. Please adjust the weights."
-    
-    return ""
 
 @app.callback(
     [Output("blended-monte-carlo-loading", "children"),
@@ -2219,43 +1824,37 @@ def validate_weight_sum(weight1, weight2, weight3):
      State("blended-leave-labor-force-range", "value"),
      State("blended-wage-penalty-range", "value"),
      State("preset-scenario", "value"),
-     State("ba-pct", "value"),
-     State("ma-pct", "value"),
-     State("asst-pct", "value"),
-     State("nurse-pct", "value"),
-     State("na-pct", "value"),
-     State("trade-pct", "value"),
-     State("ba-salary", "value"),
-     State("ma-salary", "value"),
-     State("asst-salary", "value"),
-     State("nurse-salary", "value"),
-     State("na-salary", "value"),
-     State("trade-salary", "value"),
-     State("ba-growth", "value"),  # Add growth parameters
-     State("ma-growth", "value"),
-     State("asst-growth", "value"),
-     State("nurse-growth", "value"),
-     State("na-growth", "value"),
-     State("trade-growth", "value"),
+     State("degree-params", "data"),
      State("isa-percentage-input", "value"),
      State("isa-threshold-input", "value"),
      State("isa-cap-input", "value"),
      State("price-per-student-input", "value"),
      State("num-students", "value"),
-     State("inflation-rate", "value")]
+     State("inflation-rate", "value")],
+    prevent_initial_call=True,
+    # Like run_simulation, run in a background process when diskcache is available, with
+    # the button disabled until the results are in
+    background=background_callback_manager is not None,
+    running=[(Output("run-blended-monte-carlo-button", "disabled"), True, False)]
 )
 def run_blended_monte_carlo(n_clicks, num_sims, 
                            scenario1_type, scenario2_type, scenario3_type,
                            scenario1_weight, scenario2_weight, scenario3_weight,
                            leave_labor_force_range, wage_penalty_range,
-                           preset_scenario, ba_pct, ma_pct, asst_pct, nurse_pct, na_pct, trade_pct,
-                           ba_salary, ma_salary, asst_salary, nurse_salary, na_salary, trade_salary,
-                           ba_growth, ma_growth, asst_growth, nurse_growth, na_growth, trade_growth,
+                           preset_scenario, degree_params,
                            isa_percentage, isa_threshold, isa_cap, price_per_student,
                            num_students, inflation_rate):
     if n_clicks == 0:
         return "", html.Div("Click 'Run Blended Monte Carlo Simulation' to see results")
     
+    # Unpack the shares, salaries and growth rates from the degree parameters table
+    ba_pct, ba_salary, _, ba_growth = _degree_table_params(degree_params, 'BA')
+    ma_pct, ma_salary, _, ma_growth = _degree_table_params(degree_params, 'MA')
+    asst_pct, asst_salary, _, asst_growth = _degree_table_params(degree_params, 'ASST')
+    nurse_pct, nurse_salary, _, nurse_growth = _degree_table_params(degree_params, 'NURSE')
+    na_pct, na_salary, _, na_growth = _degree_table_params(degree_params, 'NA')
+    trade_pct, trade_salary, _, trade_growth = _degree_table_params(degree_params, 'TRADE')
+    
     # Get program type from preset scenario
     if preset_scenario in preset_scenarios:
         program_type = preset_scenarios[preset_scenario]['program_type']
@@ -2270,28 +1869,15 @@ def run_blended_monte_carlo(n_clicks, num_sims,
         return "", html.Div("Please enter weights for all scenarios.", style={'color': 'red'})
     
     # Set default values for None parameters
+    default_isa_percentage, default_isa_threshold, default_isa_cap, default_price = _PROGRAM_ISA_DEFAULTS[program_type]
     if isa_percentage is None:
-        if program_type == 'Uganda':
-            isa_percentage = 14
-        elif program_type == 'Kenya':
-            isa_percentage = 12
-        elif program_type == 'Rwanda':
-            isa_percentage = 12  # Changed from 10 to 12
-        else:
-            isa_percentage = 12
+        isa_percentage = default_isa_percentage
     
     if isa_threshold is None:
-        isa_threshold = 27000
+        isa_threshold = default_isa_threshold
     
     if isa_cap is None:
-        if program_type == 'Uganda':
-            isa_cap = 72500
-        elif program_type == 'Kenya':
-            isa_cap = 49950
-        elif program_type == 'Rwanda':
-            isa_cap = 45000
-        else:
-            isa_cap = 50000
+        isa_cap = default_isa_cap
     
     if inflation_rate is None:
         inflation_rate = 2
@@ -2355,7 +1941,7 @@ def run_blended_monte_carlo(n_clicks, num_sims,
         'isa_percentage': (isa_percentage or 12) / 100.0,
         'isa_threshold': isa_threshold or 27000,
         'isa_cap': isa_cap or 50000,
-        'price_per_student': price_per_student or (29000 if program_type == 'Uganda' else 16650),
+        'price_per_student': price_per_student or default_price,
         'initial_inflation_rate': (inflation_rate or 2) / 100.0
     }
     
@@ -2363,64 +1949,71 @@ def run_blended_monte_carlo(n_clicks, num_sims,
     min_leave_labor_force, max_leave_labor_force = leave_labor_force_range
     min_wage_penalty, max_wage_penalty = wage_penalty_range
     
-    # Run Monte Carlo simulations
-    results = []
-    np.random.seed(42)
-    
+    # Draw every simulation's scenario and parameters up front from one generator
+    seed_sequence = np.random.SeedSequence(42)
+    rng = np.random.default_rng(seed_sequence)
+    selected_scenarios = rng.choice(scenarios, size=num_sims, p=weights)
+    leave_labor_force_draws = rng.uniform(min_leave_labor_force, max_leave_labor_force, size=num_sims) / 100.0
+    raw_wage_penalties = rng.uniform(min_wage_penalty, max_wage_penalty, size=num_sims) / 100.0
+    # Shift the wage penalty by 20% (e.g., -20% becomes 0%, -40% becomes -20%)
+    adjusted_wage_penalties = raw_wage_penalties + 0.2
+    penalty_factors = 1 + adjusted_wage_penalties
+    # Each simulation draws from its own independent stream (seeds from a small range collide)
+    child_seeds = seed_sequence.spawn(num_sims)
+    
+    # Parameters for every simulation
+    param_sets = []
     for i in range(num_sims):
-        # Randomly select a scenario based on weights
-        selected_scenario = np.random.choice(scenarios, p=weights)
+        penalty_factor = penalty_factors[i]
         
-        # Generate random parameters for this simulation
         sim_params = base_params.copy()
-        sim_params['scenario'] = selected_scenario
-        
-        # Apply leave labor force probability
-        sim_params['leave_labor_force_probability'] = np.random.uniform(min_leave_labor_force, max_leave_labor_force) / 100.0
+        sim_params['scenario'] = str(selected_scenarios[i])
+        sim_params['leave_labor_force_probability'] = leave_labor_force_draws[i]
         
         # Apply wage penalty to all salary parameters
-        # Shift the wage penalty by 20% (e.g., -20% becomes 0%, -40% becomes -20%)
-        raw_wage_penalty = np.random.uniform(min_wage_penalty, max_wage_penalty) / 100.0
-        adjusted_wage_penalty = raw_wage_penalty + 0.2  # Shift by 20%
-        penalty_factor = 1 + adjusted_wage_penalty
-        
         sim_params['ba_salary'] = ba_salary * penalty_factor
         sim_params['ma_salary'] = ma_salary * penalty_factor
         sim_params['asst_salary'] = asst_salary * penalty_factor
         sim_params['nurse_salary'] = nurse_salary * penalty_factor
         sim_params['na_salary'] = na_salary * penalty_factor
         sim_params['trade_salary'] = trade_salary * penalty_factor
-        
-        # Add a random seed for each simulation
-        sim_params['random_seed'] = np.random.randint(1, 10000)
-        
-        try:
-            # Run the simulation with the varied parameters
-            sim_result = run_simple_simulation(**sim_params)
-            
-            # Extract key metrics
-            results.append({
-                'investor_irr': sim_result.get('nominal_investor_IRR', 0) * 100,  # Convert to percentage
-                'total_irr': sim_result.get('nominal_IRR', 0) * 100,
-                'avg_payment': sim_result.get('average_nominal_total_payment', 0),
-                'duration': sim_result.get('average_duration', 0),
-                'repayment_rate': sim_result.get('repayment_rate', 0) * 100,
-                'employment_rate': sim_result.get('employment_rate', 0) * 100,
-                'ever_employed_rate': sim_result.get('ever_employed_rate', 0) * 100,
-                'leave_labor_force': sim_params.get('leave_labor_force_probability', 0) * 100,
-                'wage_penalty': raw_wage_penalty * 100,
-                'adjusted_wage_penalty': adjusted_wage_penalty * 100,
-                'scenario': selected_scenario
-            })
-        except Exception as e:
-            # If simulation fails, skip this iteration
+        sim_params['rng'] = np.random.default_rng(child_seeds[i])
+        param_sets.append(sim_params)
+    
+    # Run Monte Carlo simulations across worker processes
+    results = []
+    for i, metrics in enumerate(run_blended_simulations(param_sets)):
+        # If simulation failed, skip this iteration
+        if metrics is None:
             continue
+        
+        results.append({
+            'investor_irr': metrics['investor_irr'],
+            'total_irr': metrics['total_irr'],
+            'avg_payment': metrics['avg_payment'],
+            'duration': metrics['duration'],
+            'repayment_rate': metrics['repayment_rate'],
+            'employment_rate': metrics['employment_rate'],
+            'ever_employed_rate': metrics['ever_employed_rate'],
+            'leave_labor_force': param_sets[i]['leave_labor_force_probability'] * 100,
+            'wage_penalty': raw_wage_penalties[i] * 100,
+            'adjusted_wage_penalty': adjusted_wage_penalties[i] * 100,
+            'scenario': param_sets[i]['scenario']
+        })
     
     if not results:
         return "", html.Div("No valid simulation results. Try different parameters.")
     
-    # Convert results to DataFrame for analysis
-    results_df = pd.DataFrame(results)
+    # Convert results to one array per metric for analysis, and find each scenario's
+    # simulations (scenarios in order of first appearance)
+    results_columns = {key: np.array([result[key] for result in results]) for key in results[0]}
+    investor_irrs = results_columns['investor_irr']
+    result_scenarios = results_columns['scenario']
+    scenario_names = list(dict.fromkeys(result_scenarios.tolist()))
+    scenario_rows = {scenario: result_scenarios == scenario for scenario in scenario_names}
+    scenario_counts = {scenario: int(rows.sum()) for scenario, rows in scenario_rows.items()}
+    # Color index of each simulation's scenario in the outcome scatter plots
+    scenario_colors = [scenario_names.index(scenario) for scenario in result_scenarios.tolist()]
     
     # Create tabs for different visualizations
     tabs = []
@@ -2442,7 +2035,7 @@ def run_blended_monte_carlo(n_clicks, num_sims,
                 html.Th("Value")
             ])),
             html.Tbody([
-                html.Tr([html.Td("Number of Simulations"), html.Td(f"{len(results_df)}")]),
+                html.Tr([html.Td("Number of Simulations"), html.Td(f"{len(results)}")]),
                 html.Tr([html.Td("Program Type"), html.Td(f"{program_type}")]),
                 html.Tr([html.Td("Scenario 1"), html.Td(f"{scenario_labels.get(scenario1_type, scenario1_type)} ({scenario1_weight}%)")]),
                 html.Tr([html.Td("Scenario 2"), html.Td(f"{scenario_labels.get(scenario2_type, scenario2_type)} ({scenario2_weight}%)")]),
@@ -2456,8 +2049,8 @@ def run_blended_monte_carlo(n_clicks, num_sims,
         # Add scenario distribution pie chart
         html.H4("Scenario Distribution", className="mt-4"),
         dcc.Graph(figure=go.Figure(data=[go.Pie(
-            labels=[scenario_labels.get(s, s) for s in results_df['scenario'].value_counts().index],
-            values=results_df['scenario'].value_counts().values,
+            labels=[scenario_labels.get(s, s) for s in sorted(scenario_counts, key=scenario_counts.get, reverse=True)],
+            values=sorted(scenario_counts.values(), reverse=True),
             hole=.3,
             marker_colors=['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728']
         )]).update_layout(
@@ -2469,21 +2062,20 @@ def run_blended_monte_carlo(n_clicks, num_sims,
     tabs.append(dcc.Tab(label="Simulation Parameters", children=[param_summary]))
     
     # Tab 2: IRR Distribution
-    # Create IRR histogram
+    # Create IRR histogram, binned here so only the 30 bar heights are sent to the browser
+    irr_counts, irr_edges = np.histogram(investor_irrs, bins=30)
     irr_fig = go.Figure()
-    irr_fig.add_trace(go.Histogram(
-        x=results_df['investor_irr'],
+    irr_fig.add_trace(go.Bar(
+        x=(irr_edges[:-1] + irr_edges[1:]) / 2,
+        y=irr_counts,
         name='Investor IRR',
         marker_color='rgb(26, 118, 255)',
-        opacity=0.75,
-        nbinsx=30
+        opacity=0.75
     ))
     
-    # Add vertical lines for key statistics
-    median_irr = results_df['investor_irr'].median()
-    mean_irr = results_df['investor_irr'].mean()
-    p10_irr = results_df['investor_irr'].quantile(0.1)
-    p90_irr = results_df['investor_irr'].quantile(0.9)
+    # Add vertical lines for key statistics (every quantile used below, in one call)
+    p10_irr, p25_irr, median_irr, p75_irr, p90_irr = np.quantile(investor_irrs, [0.1, 0.25, 0.5, 0.75, 0.9])
+    mean_irr = investor_irrs.mean()
     
     irr_fig.add_vline(x=median_irr, line_dash="dash", line_color="black", annotation_text=f"Median: {median_irr:.1f}%")
     irr_fig.add_vline(x=mean_irr, line_dash="solid", line_color="red", annotation_text=f"Mean: {mean_irr:.1f}%")
@@ -2507,18 +2099,18 @@ def run_blended_monte_carlo(n_clicks, num_sims,
                 html.Th("Value")
             ])),
             html.Tbody([
-                html.Tr([html.Td("Mean IRR"), html.Td(f"{results_df['investor_irr'].mean():.2f}%")]),
-                html.Tr([html.Td("Median IRR"), html.Td(f"{results_df['investor_irr'].median():.2f}%")]),
-                html.Tr([html.Td("Standard Deviation"), html.Td(f"{results_df['investor_irr'].std():.2f}%")]),
-                html.Tr([html.Td("10th Percentile"), html.Td(f"{results_df['investor_irr'].quantile(0.1):.2f}%")]),
-                html.Tr([html.Td("25th Percentile"), html.Td(f"{results_df['investor_irr'].quantile(0.25):.2f}%")]),
-                html.Tr([html.Td("75th Percentile"), html.Td(f"{results_df['investor_irr'].quantile(0.75):.2f}%")]),
-                html.Tr([html.Td("90th Percentile"), html.Td(f"{results_df['investor_irr'].quantile(0.9):.2f}%")]),
-                html.Tr([html.Td("Minimum IRR"), html.Td(f"{results_df['investor_irr'].min():.2f}%")]),
-                html.Tr([html.Td("Maximum IRR"), html.Td(f"{results_df['investor_irr'].max():.2f}%")]),
-                html.Tr([html.Td("Probability of IRR > 5%"), html.Td(f"{(results_df['investor_irr'] > 5).mean()*100:.1f}%")]),
-                html.Tr([html.Td("Probability of IRR > 8%"), html.Td(f"{(results_df['investor_irr'] > 8).mean()*100:.1f}%")]),
-                html.Tr([html.Td("Probability of IRR < 0%"), html.Td(f"{(results_df['investor_irr'] < 0).mean()*100:.1f}%")])
+                html.Tr([html.Td("Mean IRR"), html.Td(f"{mean_irr:.2f}%")]),
+                html.Tr([html.Td("Median IRR"), html.Td(f"{median_irr:.2f}%")]),
+                html.Tr([html.Td("Standard Deviation"), html.Td(f"{investor_irrs.std(ddof=1):.2f}%")]),
+                html.Tr([html.Td("10th Percentile"), html.Td(f"{p10_irr:.2f}%")]),
+                html.Tr([html.Td("25th Percentile"), html.Td(f"{p25_irr:.2f}%")]),
+                html.Tr([html.Td("75th Percentile"), html.Td(f"{p75_irr:.2f}%")]),
+                html.Tr([html.Td("90th Percentile"), html.Td(f"{p90_irr:.2f}%")]),
+                html.Tr([html.Td("Minimum IRR"), html.Td(f"{investor_irrs.min():.2f}%")]),
+                html.Tr([html.Td("Maximum IRR"), html.Td(f"{investor_irrs.max():.2f}%")]),
+                html.Tr([html.Td("Probability of IRR > 5%"), html.Td(f"{(investor_irrs > 5).mean()*100:.1f}%")]),
+                html.Tr([html.Td("Probability of IRR > 8%"), html.Td(f"{(investor_irrs > 8).mean()*100:.1f}%")]),
+                html.Tr([html.Td("Probability of IRR < 0%"), html.Td(f"{(investor_irrs < 0).mean()*100:.1f}%")])
             ])
         ], className="table table-striped table-sm")
     ])
@@ -2534,10 +2126,9 @@ def run_blended_monte_carlo(n_clicks, num_sims,
     # IRR by Scenario Box Plot
     scenario_box = go.Figure()
     
-    for scenario in results_df['scenario'].unique():
-        scenario_data = results_df[results_df['scenario'] == scenario]
+    for scenario, rows in scenario_rows.items():
         scenario_box.add_trace(go.Box(
-            y=scenario_data['investor_irr'],
+            y=investor_irrs[rows],
             name=scenario_labels.get(scenario, scenario),
             boxpoints='all',
             jitter=0.3,
@@ -2565,12 +2156,12 @@ def run_blended_monte_carlo(n_clicks, num_sims,
             html.Tbody([
                 html.Tr([
                     html.Td(scenario_labels.get(scenario, scenario)),
-                    html.Td(f"{len(results_df[results_df['scenario'] == scenario])}"),
-                    html.Td(f"{results_df[results_df['scenario'] == scenario]['investor_irr'].mean():.2f}%"),
-                    html.Td(f"{results_df[results_df['scenario'] == scenario]['investor_irr'].median():.2f}%"),
-                    html.Td(f"{results_df[results_df['scenario'] == scenario]['investor_irr'].min():.2f}%"),
-                    html.Td(f"{results_df[results_df['scenario'] == scenario]['investor_irr'].max():.2f}%")
-                ]) for scenario in results_df['scenario'].unique()
+                    html.Td(f"{scenario_counts[scenario]}"),
+                    html.Td(f"{investor_irrs[rows].mean():.2f}%"),
+                    html.Td(f"{np.median(investor_irrs[rows]):.2f}%"),
+                    html.Td(f"{investor_irrs[rows].min():.2f}%"),
+                    html.Td(f"{investor_irrs[rows].max():.2f}%")
+                ]) for scenario, rows in scenario_rows.items()
             ])
         ], className="table table-striped table-sm")
     ])
@@ -2586,19 +2177,14 @@ def run_blended_monte_carlo(n_clicks, num_sims,
     # Scatter Plot of Leave Labor Force vs IRR colored by Scenario
     llf_scatter_fig = go.Figure()
     
-    for scenario in results_df['scenario'].unique():
-        scenario_data = results_df[results_df['scenario'] == scenario]
+    for scenario, rows in scenario_rows.items():
         llf_scatter_fig.add_trace(go.Scatter(
-            x=scenario_data['leave_labor_force'],
-            y=scenario_data['investor_irr'],
+            x=results_columns['leave_labor_force'][rows],
+            y=investor_irrs[rows],
             mode='markers',
             name=scenario_labels.get(scenario, scenario),
-            text=[f"IRR: {irr:.1f}%<br>Leave Labor Force: {llf:.1f}%<br>Scenario: {scenario_labels.get(s, s)}" 
-                  for irr, llf, s in zip(
-                      scenario_data['investor_irr'], 
-                      scenario_data['leave_labor_force'],
-                      scenario_data['scenario']
-                  )],
+            text=[f"IRR: {irr:.1f}%<br>Leave Labor Force: {llf:.1f}%<br>Scenario: {scenario_labels.get(scenario, scenario)}" 
+                  for irr, llf in zip(investor_irrs[rows], results_columns['leave_labor_force'][rows])],
             hoverinfo='text'
         ))
     
@@ -2612,19 +2198,14 @@ def run_blended_monte_carlo(n_clicks, num_sims,
     # Scatter Plot of Wage Penalty vs IRR colored by Scenario
     wp_scatter_fig = go.Figure()
     
-    for scenario in results_df['scenario'].unique():
-        scenario_data = results_df[results_df['scenario'] == scenario]
+    for scenario, rows in scenario_rows.items():
         wp_scatter_fig.add_trace(go.Scatter(
-            x=scenario_data['wage_penalty'],
-            y=scenario_data['investor_irr'],
+            x=results_columns['wage_penalty'][rows],
+            y=investor_irrs[rows],
             mode='markers',
             name=scenario_labels.get(scenario, scenario),
-            text=[f"IRR: {irr:.1f}%<br>Wage Penalty: {wp:.1f}%<br>Scenario: {scenario_labels.get(s, s)}" 
-                  for irr, wp, s in zip(
-                      scenario_data['investor_irr'], 
-                      scenario_data['wage_penalty'],
-                      scenario_data['scenario']
-                  )],
+            text=[f"IRR: {irr:.1f}%<br>Wage Penalty: {wp:.1f}%<br>Scenario: {scenario_labels.get(scenario, scenario)}" 
+                  for irr, wp in zip(investor_irrs[rows], results_columns['wage_penalty'][rows])],
             hoverinfo='text'
         ))
     
@@ -2648,22 +2229,18 @@ def run_blended_monte_carlo(n_clicks, num_sims,
     
     # Add employment rate vs IRR scatter plot
     outcomes_fig.add_trace(go.Scatter(
-        x=results_df['employment_rate'],
-        y=results_df['investor_irr'],
+        x=results_columns['employment_rate'],
+        y=investor_irrs,
         mode='markers',
         marker=dict(
             size=8,
-            color=results_df['scenario'].map({s: i for i, s in enumerate(results_df['scenario'].unique())}),
+            color=scenario_colors,
             colorscale='Viridis',
             showscale=False,
             opacity=0.7
         ),
         text=[f"IRR: {irr:.1f}%<br>Employment Rate: {emp:.1f}%<br>Scenario: {scenario_labels.get(s, s)}" 
-              for irr, emp, s in zip(
-                  results_df['investor_irr'], 
-                  results_df['employment_rate'],
-                  results_df['scenario']
-              )],
+              for irr, emp, s in zip(investor_irrs, results_columns['employment_rate'], result_scenarios)],
         hoverinfo='text',
         name='Employment Rate vs IRR'
     ))
@@ -2679,22 +2256,18 @@ def run_blended_monte_carlo(n_clicks, num_sims,
     repayment_fig = go.Figure()
     
     repayment_fig.add_trace(go.Scatter(
-        x=results_df['repayment_rate'],
-        y=results_df['investor_irr'],
+        x=results_columns['repayment_rate'],
+        y=investor_irrs,
         mode='markers',
         marker=dict(
             size=8,
-            color=results_df['scenario'].map({s: i for i, s in enumerate(results_df['scenario'].unique())}),
+            color=scenario_colors,
             colorscale='Viridis',
             showscale=False,
             opacity=0.7
         ),
         text=[f"IRR: {irr:.1f}%<br>Repayment Rate: {rep:.1f}%<br>Scenario: {scenario_labels.get(s, s)}" 
-              for irr, rep, s in zip(
-                  results_df['investor_irr'], 
-                  results_df['repayment_rate'],
-                  results_df['scenario']
-              )],
+              for irr, rep, s in zip(investor_irrs, results_columns['repayment_rate'], result_scenarios)],
         hoverinfo='text',
         name='Repayment Rate vs IRR'
     ))
@@ -2719,10 +2292,10 @@ def run_blended_monte_carlo(n_clicks, num_sims,
             html.Tbody([
                 html.Tr([
                     html.Td(scenario_labels.get(scenario, scenario)),
-                    html.Td(f"{results_df[results_df['scenario'] == scenario]['employment_rate'].mean():.1f}%"),
-                    html.Td(f"{results_df[results_df['scenario'] == scenario]['ever_employed_rate'].mean():.1f}%"),
-                    html.Td(f"{results_df[results_df['scenario'] == scenario]['repayment_rate'].mean():.1f}%")
-                ]) for scenario in results_df['scenario'].unique()
+                    html.Td(f"{results_columns['employment_rate'][rows].mean():.1f}%"),
+                    html.Td(f"{results_columns['ever_employed_rate'][rows].mean():.1f}%"),
+                    html.Td(f"{results_columns['repayment_rate'][rows].mean():.1f}%")
+                ]) for scenario, rows in scenario_rows.items()
             ])
         ], className="table table-striped table-sm")
     ])
@@ -2742,55 +2315,54 @@ def run_blended_monte_carlo(n_clicks, num_sims,
     
     return "", viz_elements
 
-# Callback for payment data table
-@app.callback(
-    Output("payment-data-table", "children"),
-    [Input("simulation-results-store", "data")]
-)
+# Payment data table (filled by update_result_views)
+# Columns and styles of the payment data table, built once rather than on every simulation
+_PAYMENT_TABLE_COLUMNS = [
+    {'name': 'Year', 'id': 'Year', 'type': 'numeric'},
+    {'name': 'Active Students', 'id': 'Active Students', 'type': 'numeric'},
+    {'name': 'Total Payment ($)', 'id': 'Total Payment ($)', 'type': 'numeric', 'format': dash_table.FormatTemplate.money(0)},
+    {'name': 'Malengo Fee ($)', 'id': 'Malengo Fee ($)', 'type': 'numeric', 'format': dash_table.FormatTemplate.money(0)}
+]
+_PAYMENT_TABLE_STYLE_TABLE = {'overflowX': 'auto'}
+_PAYMENT_TABLE_STYLE_CELL = {'textAlign': 'center', 'padding': '10px'}
+_PAYMENT_TABLE_STYLE_HEADER = {
+    'backgroundColor': 'rgb(230, 230, 230)',
+    'fontWeight': 'bold'
+}
+_PAYMENT_TABLE_STYLE_DATA_CONDITIONAL = [
+    {
+        'if': {'row_index': 'odd'},
+        'backgroundColor': 'rgb(248, 248, 248)'
+    }
+]
+
 def update_payment_data_table(results):
     if not results:
         return html.Div("Run a simulation to see results")
     
-    # Convert stored dict back to pandas Series
-    payment_by_year = pd.Series(results['payment_by_year'])
-    malengo_payment_by_year = pd.Series(results['malengo_payment_by_year'])
-    active_students_data = pd.Series(results['active_students_by_year'])
-    
-    # Get the number of years from payment data
-    num_years = len(payment_by_year)
-    
-    # Create the DataFrame with only the data we have from results
-    payment_df = pd.DataFrame({
-        'Year': range(num_years),
-        'Active Students': [active_students_data.iloc[i] if i < len(active_students_data) else 0 
-                            for i in range(num_years)],
-        'Total Payment ($)': [payment_by_year.iloc[i] if i < len(payment_by_year) else 0 
-                            for i in range(num_years)],
-        'Malengo Fee ($)': [malengo_payment_by_year.iloc[i] if i < len(malengo_payment_by_year) else 0 
-                           for i in range(num_years)]
-    })
+    # The by-year averages are computed once in run_simulation; build rows straight from them
+    payment_records = [
+        {
+            'Year': year,
+            'Active Students': active_students,
+            'Total Payment ($)': total_payment,
+            'Malengo Fee ($)': malengo_fee
+        }
+        for year, (active_students, total_payment, malengo_fee) in enumerate(zip(
+            results['active_students_by_year'],
+            results['payment_by_year'],
+            results['malengo_payment_by_year']
+        ))
+    ]
     
     # Create the DataTable
     table = dash_table.DataTable(
-        data=payment_df.to_dict('records'),
-        columns=[
-            {'name': 'Year', 'id': 'Year', 'type': 'numeric'},
-            {'name': 'Active Students', 'id': 'Active Students', 'type': 'numeric'},
-            {'name': 'Total Payment ($)', 'id': 'Total Payment ($)', 'type': 'numeric', 'format': dash_table.FormatTemplate.money(0)},
-            {'name': 'Malengo Fee ($)', 'id': 'Malengo Fee ($)', 'type': 'numeric', 'format': dash_table.FormatTemplate.money(0)}
-        ],
-        style_table={'overflowX': 'auto'},
-        style_cell={'textAlign': 'center', 'padding': '10px'},
-        style_header={
-            'backgroundColor': 'rgb(230, 230, 230)',
-            'fontWeight': 'bold'
-        },
-        style_data_conditional=[
-            {
-                'if': {'row_index': 'odd'},
-                'backgroundColor': 'rgb(248, 248, 248)'
-            }
-        ],
+        data=payment_records,
+        columns=_PAYMENT_TABLE_COLUMNS,
+        style_table=_PAYMENT_TABLE_STYLE_TABLE,
+        style_cell=_PAYMENT_TABLE_STYLE_CELL,
+        style_header=_PAYMENT_TABLE_STYLE_HEADER,
+        style_data_conditional=_PAYMENT_TABLE_STYLE_DATA_CONDITIONAL,
         sort_action='native',
         filter_action='native',
         page_size=25
@@ -2815,84 +2387,39 @@ def update_payment_data_table(results):
         table
     ])
 
-# Function to create IRR comparison chart
-def create_irr_comparison(results):
-    # Extract IRR values with fallbacks
-    real_irr = results.get('IRR', 0) * 100
-    nominal_irr = results.get('nominal_IRR', 0) * 100
-    real_investor_irr = results.get('investor_IRR', 0) * 100
-    nominal_investor_irr = results.get('nominal_investor_IRR', 0) * 100
-    
-    # Create bar chart comparing real and nominal IRRs
-    fig = go.Figure()
-    
-    # Add Total IRR bars
-    fig.add_trace(go.Bar(
-        x=['Total IRR (before fees)'],
-        y=[real_irr],
-        name='Real',
-        marker_color='rgb(55, 83, 109)',
-        text=[f"{real_irr:.2f}%"],
-        textposition='auto'
-    ))
-    
-    fig.add_trace(go.Bar(
-        x=['Total IRR (before fees)'],
-        y=[nominal_irr],
-        name='Nominal',
-        marker_color='rgb(26, 118, 255)',
-        text=[f"{nominal_irr:.2f}%"],
-        textposition='auto'
-    ))
-    
-    # Add Investor IRR bars
-    fig.add_trace(go.Bar(
-        x=['Investor IRR'],
-        y=[real_investor_irr],
-        name='Real',
-        marker_color='rgb(55, 83, 109)',
-        text=[f"{real_investor_irr:.2f}%"],
-        textposition='auto',
-        showlegend=False
-    ))
-    
-    fig.add_trace(go.Bar(
-        x=['Investor IRR'],
-        y=[nominal_investor_irr],
-        name='Nominal',
-        marker_color='rgb(26, 118, 255)',
-        text=[f"{nominal_investor_irr:.2f}%"],
-        textposition='auto',
-        showlegend=False
-    ))
-    
-    fig.update_layout(
-        title='Real vs Nominal IRR Comparison',
-        xaxis_title='IRR Type',
-        yaxis_title='IRR (%)',
-        barmode='group',
-        template='plotly_white',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        )
-    )
-    
-    return fig
+# IRR comparison chart, drawn in the browser by filling the bars of _IRR_COMPARISON_FIGURE
+# in its trace order: total real, total nominal, investor real, investor nominal
+app.clientside_callback(
+    """
+    function(results, figure) {
+        if (!results) {
+            return window.dash_clientside.no_update;
+        }
+        const irrs = [results.IRR, results.nominal_IRR, results.investor_IRR, results.nominal_investor_IRR]
+            .map(irr => (irr || 0) * 100);
+        const data = figure.data.map((trace, i) => Object.assign({}, trace, {y: [irrs[i]], text: [`${irrs[i].toFixed(2)}%`]}));
+        return Object.assign({}, figure, {data: data});
+    }
+    """,
+    Output("irr-comparison", "figure"),
+    [Input("simulation-results-store", "data")],
+    [State("irr-comparison", "figure")],
+    prevent_initial_call=True
+)
 
-# Callback for IRR comparison
+# The server-rendered result views are filled by one callback, so each finished simulation
+# uploads the results Store to the server once rather than once per view (the graphs are
+# drawn clientside)
 @app.callback(
-    Output("irr-comparison", "figure"),
-    [Input("simulation-results-store", "data")]
+    [Output("scenario-info", "children"),
+     Output("degree-info", "children"),
+     Output("payment-data-table", "children")],
+    [Input("simulation-results-store", "data")],
+    prevent_initial_call=True
 )
-def update_irr_comparison(results):
-    if not results:
-        return go.Figure()
-    
-    return create_irr_comparison(results)
+def update_result_views(results):
+    scenario_info, degree_info = update_scenario_details(results)
+    return scenario_info, degree_info, update_payment_data_table(results)
 
 # Run the app
 if __name__ == "__main__":
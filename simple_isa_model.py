@@ -1,11 +1,23 @@
+import os
+import threading
 import numpy as np
-import pandas as pd
 from typing import List, Dict, Union, Optional, Tuple, Any
 
+# Numba is optional: without it the batch engine falls back to NumPy broadcasts
+try:
+    from numba import njit, prange, threading_layer
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Only import these when needed in main()
 # import matplotlib.pyplot as plt
 # import argparse
 
+# Earnings (mean, standard deviation) of graduates who return to their home country
+_HOME_EARNINGS_MEAN = 2600
+_HOME_EARNINGS_STDEV = 690
+
 class Year:
     """
     Simplified class for tracking economic parameters for each simulation year.
@@ -57,9 +69,10 @@ class Year:
         self.unemployment_rate = max(0.02, min(0.30, self.unemployment_rate))
         
         # Update ISA parameters with inflation
-        self.isa_cap *= (1 + self.inflation_rate)
-        self.isa_threshold *= (1 + self.inflation_rate)
-        self.deflator *= (1 + self.inflation_rate)
+        inflation_factor = 1 + self.inflation_rate
+        self.isa_cap *= inflation_factor
+        self.isa_threshold *= inflation_factor
+        self.deflator *= inflation_factor
 
 
 class Student:
@@ -70,9 +83,11 @@ class Student:
         self.degree = degree
         self.num_years = num_years
         self.earnings_power = 0.0
-        self.earnings = [0.0] * num_years
-        self.payments = [0.0] * num_years
-        self.real_payments = [0.0] * num_years
+        self.earnings = np.zeros(num_years, dtype=np.float32)
+        self.payments = np.zeros(num_years, dtype=np.float32)
+        self.real_payments = np.zeros(num_years, dtype=np.float32)
+        self.cumulative_payment = 0.0  # Running total of payments, kept so it never needs re-summing
+        self.cumulative_real_payment = 0.0  # Running total of real_payments
         self.is_graduated = False
         self.is_employed = False
         self.is_home = False
@@ -114,54 +129,20 @@ class Degree:
                 f"years={self.years_to_complete}, leave_labor_force_probability={self.leave_labor_force_probability:.1%})")
 
 
-def _calculate_graduation_delay(base_years_to_complete: int, degree_name: str = '') -> int:
+def _graduation_delay_table(degrees: List[Degree]) -> np.ndarray:
     """
-    Calculate a realistic graduation delay based on degree-specific distributions.
-    
-    For BA and ASST degrees:
-    - 50% graduate on time (no delay)
-    - 25% graduate 1 year late (50% of remaining)
-    - 12.5% graduate 2 years late (50% of remaining)
-    - 6.25% graduate 3 years late (50% of remaining)
-    - The rest (6.25%) graduate 4 years late
-    
-    For MA, NURSE, and TRADE degrees:
-    - 75% graduate on time (no delay)
-    - 20% graduate 1 year late
-    - 2.5% graduate 2 years late
-    - 2.5% graduate 3 years late
+    Cumulative graduation delay thresholds, one row per degree, padded so every row has four.
     
-    Args:
-        base_years_to_complete: The nominal years to complete the degree
-        degree_name: The type of degree (BA, MA, ASST, NURSE, TRADE, etc.)
-        
-    Returns:
-        Total years to complete including delay
+    A uniform draw's delay in years is the number of thresholds it is >= to:
+    - MA, NURSE and TRADE: 75% on time, 20% one year late, 2.5% two and 2.5% three years late
+    - Other degrees (BA, ASST, NA, ...): 50% on time, then half of the rest each extra year,
+      up to four years late (6.25%)
     """
-    rand = np.random.random()
-    
-    # Apply special distribution for Masters, Nurse, and Trade degrees
-    if degree_name in ['MA', 'NURSE', 'TRADE']:
-        if rand < 0.75:
-            return base_years_to_complete  # Graduate on time
-        elif rand < 0.95:
-            return base_years_to_complete + 1  # 1 year late
-        elif rand < 0.975:
-            return base_years_to_complete + 2  # 2 years late
-        else:
-            return base_years_to_complete + 3  # 3 years late
-    else:
-        # Default distribution for other degrees (BA, ASST, NA, etc.)
-        if rand < 0.5:
-            return base_years_to_complete  # Graduate on time
-        elif rand < 0.75:
-            return base_years_to_complete + 1  # 1 year late
-        elif rand < 0.875:
-            return base_years_to_complete + 2  # 2 years late
-        elif rand < 0.9375:
-            return base_years_to_complete + 3  # 3 years late
-        else:
-            return base_years_to_complete + 4  # 4 years late
+    return np.array([
+        [0.75, 0.95, 0.975, np.inf] if d.name in ['MA', 'NURSE', 'TRADE']
+        else [0.5, 0.75, 0.875, 0.9375]
+        for d in degrees
+    ])
 
 
 def simulate_simple(
@@ -175,16 +156,26 @@ def simulate_simple(
     price_per_student: float = 30000, 
     new_malengo_fee: bool = False,
     annual_fee_per_student: float = 300,  # $300 base annual fee per active student
-    apply_graduation_delay: bool = False
+    apply_graduation_delay: bool = False,
+    rng: Optional[np.random.Generator] = None
 ) -> Dict[str, Any]:
     """
     Run a single simulation for the given students over the specified number of years
     with a simple repayment structure.
     
+    Student state is held as arrays with one entry per student (structure of arrays), so
+    each year is a handful of vectorized operations; the Student objects are read once at
+    the start and updated with the final state at the end, their earnings and payment
+    histories becoming row views of the shared (num_students, num_years) arrays. All student-level random draws
+    are made up front from rng; if it is not given, a generator is seeded from the global
+    NumPy random state so np.random.seed() still makes runs reproducible.
+    
     The Malengo fee structure consists of:
     1. Annual fee per active student ($300 base, adjusted for inflation)
     2. Performance fee (2.5%) on all student repayments
     """
+    num_students = len(students)
+    
     # Initialize arrays to track payments
     total_payments = np.zeros(num_years)
     total_real_payments = np.zeros(num_years)
@@ -194,85 +185,88 @@ def simulate_simple(
     investor_real_payments = np.zeros(num_years)
     
     # Track active students for each year
-    active_students_count = np.zeros(num_years, dtype=int)
-    
-    # Track student status for fee calculations
-    student_graduated = np.zeros(len(students), dtype=bool)
-    student_hit_cap = np.zeros(len(students), dtype=bool)
-    student_is_na = np.zeros(len(students), dtype=bool)
-    
-    # Store the limit_years in each student object
-    for student in students:
-        student.limit_years = limit_years
+    active_students_count = np.zeros(num_years, dtype=np.int64)
+    
+    # Degree parameters for each student
+    mean_earnings = np.array([student.degree.mean_earnings for student in students], dtype=float)
+    stdev = np.array([student.degree.stdev for student in students], dtype=float)
+    experience_growth = np.array([student.degree.experience_growth for student in students], dtype=float)
+    leave_probability = np.array([student.degree.leave_labor_force_probability for student in students], dtype=float)
+    is_na = np.array([student.degree.name == 'NA' for student in students], dtype=bool)
+    graduation_year = np.array([student.graduation_year for student in students], dtype=np.int64)
+    
+    # Student state, one entry (or row) per student. Histories are float32 like the batch
+    # engine's (cents-level precision for dollar amounts); running totals stay float64
+    earnings = np.array([student.earnings for student in students], dtype=np.float32).reshape(num_students, num_years)
+    payments = np.array([student.payments for student in students], dtype=np.float32).reshape(num_students, num_years)
+    real_payments = np.array([student.real_payments for student in students], dtype=np.float32).reshape(num_students, num_years)
+    earnings_power = np.array([student.earnings_power for student in students], dtype=float)
+    is_graduated = np.array([student.is_graduated for student in students], dtype=bool)
+    is_employed = np.array([student.is_employed for student in students], dtype=bool)
+    is_home = np.array([student.is_home for student in students], dtype=bool)
+    years_paid = np.array([student.years_paid for student in students], dtype=np.int64)
+    hit_cap = np.array([student.hit_cap for student in students], dtype=bool)
+    cap_value_when_hit = np.array([student.cap_value_when_hit for student in students], dtype=float)
+    years_experience = np.array([student.years_experience for student in students], dtype=np.int64)
+    last_payment_year = np.array([student.last_payment_year for student in students], dtype=np.int64)
+    
+    # Running totals of each student's payments, so the cap check doesn't re-sum the history
+    cumulative_paid = np.array([student.cumulative_payment for student in students], dtype=float)
+    cumulative_real_paid = np.array([student.cumulative_real_payment for student in students], dtype=float)
+    
+    # One row of (1 + growth) ** years_experience per distinct growth rate, which each
+    # student indexes by growth_idx
+    growth_rates, growth_idx = np.unique(experience_growth, return_inverse=True)
+    experience_factors = _experience_factor_table(growth_rates, num_years)
+    
+    # Draw everything random about the students in bulk: home status and earnings power
+    # (used at graduation) and an employment draw for every student-year
+    if rng is None:
+        # Seed from the global state so np.random.seed() still applies; uint64 because the
+        # default int is 32-bit on Windows under NumPy 1.x, where 2**32 is out of bounds
+        rng = np.random.default_rng(np.random.randint(0, 2**32, dtype=np.uint64))
+    home_draws = rng.random(num_students) < leave_probability
+    if gamma:
+        degree_power = rng.gamma(mean_earnings, stdev)
+        home_power = rng.gamma(
+            (_HOME_EARNINGS_MEAN / _HOME_EARNINGS_STDEV) ** 2, _HOME_EARNINGS_STDEV ** 2 / _HOME_EARNINGS_MEAN,
+            size=num_students
+        )
+    else:
+        degree_power = rng.normal(mean_earnings, stdev)
+        home_power = rng.normal(_HOME_EARNINGS_MEAN, _HOME_EARNINGS_STDEV, size=num_students)
+    # Students who return home earn home-country wages
+    graduation_power = np.maximum(0, np.where(home_draws, home_power, degree_power))
+    employment_draws = rng.random((num_years, num_students), dtype=np.float32)
     
     # Simulation loop
     for i in range(num_years):
-        # Process each student
-        for student_idx, student in enumerate(students):
-            # Reset active status at start of year
-            student.is_active = False
-            
-            # Skip if student hasn't completed degree yet
-            if i < student.graduation_year:
-                continue
-                
-            # Handle graduation year
-            if i == student.graduation_year:
-                _process_graduation(student, student_idx, student_graduated, student_is_na, gamma)
-                
-            # Determine employment status
-            _update_employment_status(student, year)
-            
-            # Process employed students
-            if student.is_employed:
-                # Update earnings based on experience
-                student.earnings[i] = student.earnings_power * year.deflator * (1 + student.degree.experience_growth) ** student.years_experience
-                student.years_experience += 1
-                
-                # Process payments if earnings exceed threshold
-                if student.earnings[i] > year.isa_threshold:
-                    student.years_paid += 1
-                    
-                    # Check if student has reached payment year limit
-                    if student.years_paid > limit_years:
-                        student_hit_cap[student_idx] = True
-                        continue
-                        
-                    # Skip if student already hit payment cap
-                    if student.hit_cap:
-                        continue
-                    
-                    # Calculate payment
-                    potential_payment = isa_percentage * student.earnings[i]
-                    
-                    # Check if payment would exceed cap
-                    if (np.sum(student.payments) + potential_payment) > year.isa_cap:
-                        student.payments[i] = year.isa_cap - np.sum(student.payments)
-                        student.real_payments[i] = student.payments[i] / year.deflator
-                        student.hit_cap = True
-                        student_hit_cap[student_idx] = True
-                        student.cap_value_when_hit = year.isa_cap
-                    else:
-                        student.payments[i] = potential_payment
-                        student.real_payments[i] = potential_payment / year.deflator
-                        student.last_payment_year = i
-                    
-                    # Add to total payments
-                    total_payments[i] += student.payments[i]
-                    total_real_payments[i] += student.real_payments[i]
-            else:
-                # Reduce experience for unemployed students
-                student.years_experience = max(0, student.years_experience - 3)
-            
-            # Update active status based on payment history and graduation
-            if student.is_graduated and not student.hit_cap and not student_is_na[student_idx]:
-                # Student is active if they made a payment in the last 3 years or graduated recently
-                recent_payment = (i - student.last_payment_year <= 3) if student.last_payment_year >= 0 else False
-                recent_graduate = (i - student.graduation_year <= 3) if student.is_graduated else False
-                student.is_active = recent_payment or recent_graduate
+        # Handle graduation year: set home status and initial earnings power
+        just_graduated = graduation_year == i
+        is_graduated |= just_graduated
+        is_home[just_graduated] = home_draws[just_graduated]
+        earnings_power[just_graduated] = graduation_power[just_graduated]
+        
+        # Employment, earnings, payments, cap tracking and the active count for this year,
+        # run through the same compiled kernel as the batch engine (as a single trial)
+        unemployment_rate = year.unemployment_rate
+        year_threshold = year.isa_threshold
+        _simulate_year(
+            i, employment_draws[i][np.newaxis], graduation_year[np.newaxis], is_na[np.newaxis],
+            earnings_power[np.newaxis], growth_idx[np.newaxis], experience_factors,
+            np.array([unemployment_rate], dtype=float), np.array([year.deflator], dtype=float),
+            np.array([year_threshold], dtype=float), np.array([year.isa_cap], dtype=float),
+            isa_percentage, limit_years,
+            years_experience[np.newaxis], years_paid[np.newaxis], hit_cap[np.newaxis],
+            cap_value_when_hit[np.newaxis], cumulative_paid[np.newaxis], last_payment_year[np.newaxis],
+            earnings[np.newaxis, :, i], payments[np.newaxis, :, i], active_students_count[i:i + 1]
+        )
+        real_payments[:, i] = payments[:, i] / year.deflator
+        cumulative_real_paid += real_payments[:, i]
         
-        # Count active students for this year
-        active_students_count[i] = sum(1 for student in students if student.is_active)
+        # Add to total payments (accumulated in float64)
+        total_payments[i] = payments[:, i].sum(dtype=np.float64)
+        total_real_payments[i] = total_payments[i] / year.deflator
         
         # Calculate Malengo's fees using new structure:
         # 1. Annual fee per active student (adjusted for inflation)
@@ -293,14 +287,45 @@ def simulate_simple(
 
         # Advance to next year
         year.next_year()
+    
+    # Final-year employment and active status, for the Student objects
+    if num_years:
+        i = num_years - 1
+        graduated = graduation_year <= i
+        is_employed[graduated] = (~is_na & (employment_draws[i] < 1 - unemployment_rate))[graduated]
+        over_year_limit = (earnings[:, i] > year_threshold) & (years_paid > limit_years)
+        recent_payment = (last_payment_year >= 0) & (i - last_payment_year <= 3)
+        recent_graduate = i - graduation_year <= 3
+        is_active = graduated & ~hit_cap & ~is_na & ~over_year_limit & (recent_payment | recent_graduate)
+    else:
+        is_active = np.zeros(num_students, dtype=bool)
+    
+    # Write the final state back to the Student objects (histories as rows, not copies)
+    for idx, student in enumerate(students):
+        student.limit_years = limit_years
+        student.earnings = earnings[idx]
+        student.payments = payments[idx]
+        student.real_payments = real_payments[idx]
+        student.cumulative_payment = float(cumulative_paid[idx])
+        student.cumulative_real_payment = float(cumulative_real_paid[idx])
+        student.earnings_power = float(earnings_power[idx])
+        student.is_graduated = bool(is_graduated[idx])
+        student.is_employed = bool(is_employed[idx])
+        student.is_home = bool(is_home[idx])
+        student.is_active = bool(is_active[idx])
+        student.years_paid = int(years_paid[idx])
+        student.hit_cap = bool(hit_cap[idx])
+        student.cap_value_when_hit = float(cap_value_when_hit[idx])
+        student.years_experience = int(years_experience[idx])
+        student.last_payment_year = int(last_payment_year[idx])
 
     # Prepare and return results
     data = {
         'Student': students,
         'Degree': [student.degree for student in students],
-        'Earnings': [student.earnings for student in students],
-        'Payments': [student.payments for student in students],
-        'Real_Payments': [student.real_payments for student in students],
+        'Earnings': earnings,
+        'Payments': payments,
+        'Real_Payments': real_payments,
         'Total_Payments': total_payments,
         'Total_Real_Payments': total_real_payments,
         'Malengo_Payments': malengo_payments,
@@ -313,112 +338,32 @@ def simulate_simple(
     return data
 
 
-def _process_graduation(student: Student, student_idx: int, 
-                       student_graduated: np.ndarray, student_is_na: np.ndarray,
-                       gamma: bool) -> None:
-    """Helper function to process a student's graduation."""
-    student.is_graduated = True
-    student_graduated[student_idx] = True
-    student_is_na[student_idx] = (student.degree.name == 'NA')
-    
-    # Determine if student returns home
-    student.is_home = np.random.binomial(1, student.degree.leave_labor_force_probability) == 1
-    
-    # Set initial earnings power based on degree
-    if gamma:
-        student.earnings_power = max(0, np.random.gamma(student.degree.mean_earnings, student.degree.stdev))
-    else:
-        student.earnings_power = max(0, np.random.normal(student.degree.mean_earnings, student.degree.stdev))
-        
-    # Adjust earnings for students who return home
-    if student.is_home:
-        if gamma:
-            student.earnings_power = max(0, np.random.gamma(67600/4761, 4761/26))
-        else:
-            student.earnings_power = max(0, np.random.normal(2600, 690))
-
+# Default ISA percentage, ISA cap and price per student of each program type
+_PROGRAM_DEFAULTS = {
+    'Uganda': (0.14, 72500, 29000),
+    'Kenya': (0.12, 49950, 16650),
+    'Rwanda': (0.12, 45000, 16650),
+}
 
-def _update_employment_status(student: Student, year: Year) -> None:
-    """Helper function to update a student's employment status."""
-    # NA degree holders are always unemployed
-    if student.degree.name == 'NA':
-        student.is_employed = False
-    elif year.unemployment_rate < 1:
-        student.is_employed = np.random.binomial(1, 1 - year.unemployment_rate) == 1
-    else:
-        student.is_employed = False
-
-
-def _calculate_malengo_fees(
-    students: List[Student], 
-    student_idx: int,
-    student_graduated: np.ndarray, 
-    student_hit_cap: np.ndarray,
-    student_is_na: np.ndarray, 
-    price_per_student: float, 
-    year: Year, 
-    current_year: int,
-    malengo_payments: np.ndarray, 
-    malengo_real_payments: np.ndarray,
-    annual_fee_per_student: float = 300,
-    last_payment_year: List[int] = None
-) -> int:
-    """
-    Helper function to calculate Malengo's fees under the new structure.
-    
-    Args:
-        students: List of all students
-        student_idx: Current student index
-        student_graduated: Boolean array indicating if each student has graduated
-        student_hit_cap: Boolean array indicating if each student has hit a payment cap
-        student_is_na: Boolean array indicating if each student has an NA degree
-        price_per_student: Cost per student
-        year: Current Year object
-        current_year: Current year index
-        malengo_payments: Array to store Malengo payments
-        malengo_real_payments: Array to store real Malengo payments
-        annual_fee_per_student: Annual fee charged per active student (default: $300)
-        last_payment_year: List tracking the last year each student made a payment
-        
-    Returns:
-        Number of active students in the current year
-    """
-    # Initialize last_payment_year if None
-    if last_payment_year is None:
-        last_payment_year = [-1] * len(students)
-    
-    # Count active students
-    active_student_count = 0
-    
-    for student_idx, student in enumerate(students):
-        # Update last payment year if student made a payment in this year
-        if student.payments[current_year] > 0:
-            last_payment_year[student_idx] = current_year
-            
-        # Check if the student is active
-        # A student is active if:
-        # 1. They have graduated
-        # 2. They made a payment in the last 3 years OR graduated within the last 3 years
-        # 3. They have not hit a payment cap
-        # 4. They have not hit a years cap
-        # 5. They do not have an NA degree (high income country)
-        
-        is_recent_payment = (current_year - last_payment_year[student_idx] <= 3) if last_payment_year[student_idx] >= 0 else False
-        is_recent_graduate = (current_year - student.graduation_year <= 3) if student.is_graduated else False
-        
-        if (student_graduated[student_idx] and 
-            (is_recent_payment or is_recent_graduate) and
-            not student_hit_cap[student_idx] and
-            student.years_paid < student.limit_years and  # Check for years cap
-            not student_is_na[student_idx]):
-            
-            # Student is active, count them and apply fee
-            active_student_count += 1
-            fee = annual_fee_per_student * year.deflator
-            malengo_payments[current_year] += fee
-            malengo_real_payments[current_year] += fee / year.deflator
-    
-    return active_student_count
+# Degree mix of each preset scenario, by program type. Probabilities are stored as
+# float64 arrays once at import so the sampler receives them ready to use.
+# Kenya and Rwanda split ASST into ASST and ASST_SHIFT (33% of ASST becomes ASST_SHIFT).
+_SCENARIO_DEGREE_DISTRIBUTIONS = {
+    scenario_key: (degree_keys, np.asarray(degree_probs, dtype=np.float64))
+    for scenario_key, (degree_keys, degree_probs) in {
+        ('baseline', 'Uganda'): (('BA', 'MA', 'ASST_SHIFT', 'NA'), [0.45, 0.24, 0.27, 0.04]),
+        ('baseline', 'Kenya'): (('NURSE', 'ASST', 'ASST_SHIFT', 'NA'), [0.25, 0.60 * 0.67, 0.60 * 0.33, 0.15]),
+        ('baseline', 'Rwanda'): (('TRADE', 'ASST', 'ASST_SHIFT', 'NA'), [0.40, 0.40 * 0.67, 0.40 * 0.33, 0.20]),
+        # Uganda conservative: 32% BA, 11% MA, 42% ASST, 15% NA
+        ('conservative', 'Uganda'): (('BA', 'MA', 'ASST_SHIFT', 'NA'), [0.32, 0.11, 0.42, 0.15]),
+        ('conservative', 'Kenya'): (('NURSE', 'ASST', 'ASST_SHIFT', 'NA'), [0.20, 0.50 * 0.67, 0.50 * 0.33, 0.30]),
+        ('conservative', 'Rwanda'): (('TRADE', 'ASST', 'ASST_SHIFT', 'NA'), [0.2, 0.40 * 0.67, 0.40 * 0.33, 0.4]),
+        # Uganda optimistic: 63% BA, 33% MA, 2.5% ASST, 1.5% NA
+        ('optimistic', 'Uganda'): (('BA', 'MA', 'ASST_SHIFT', 'NA'), [0.63, 0.33, 0.025, 0.015]),
+        ('optimistic', 'Kenya'): (('NURSE', 'ASST', 'ASST_SHIFT'), [0.60, 0.40 * 0.67, 0.40 * 0.33]),
+        ('optimistic', 'Rwanda'): (('TRADE', 'ASST', 'ASST_SHIFT', 'NA'), [0.60, 0.35 * 0.67, 0.35 * 0.33, 0.05]),
+    }.items()
+}
 
 
 def _setup_degree_distribution(
@@ -433,11 +378,8 @@ def _setup_degree_distribution(
     na_pct: float,
     trade_pct: float,
     asst_shift_pct: float = 0
-) -> Tuple[List[Degree], List[float]]:
+) -> Tuple[List[Degree], np.ndarray]:
     """Helper function to set up degree distribution based on scenario."""
-    degrees = []
-    probs = []
-    
     # Create a copy of base_degrees to modify
     modified_degrees = {k: v.copy() for k, v in base_degrees.items()}
     
@@ -446,436 +388,34 @@ def _setup_degree_distribution(
         for degree_type in modified_degrees:
             modified_degrees[degree_type]['years_to_complete'] += 1
     
-    if scenario == 'baseline':
-        if program_type == 'Uganda':
-            degrees = [
-                Degree(
-                    name=modified_degrees['BA']['name'],
-                    mean_earnings=modified_degrees['BA']['mean_earnings'],
-                    stdev=modified_degrees['BA']['stdev'],
-                    experience_growth=modified_degrees['BA']['experience_growth'],
-                    years_to_complete=modified_degrees['BA']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['MA']['name'],
-                    mean_earnings=modified_degrees['MA']['mean_earnings'],
-                    stdev=modified_degrees['MA']['stdev'],
-                    experience_growth=modified_degrees['MA']['experience_growth'],
-                    years_to_complete=modified_degrees['MA']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['ASST_SHIFT']['name'],
-                    mean_earnings=modified_degrees['ASST_SHIFT']['mean_earnings'],
-                    stdev=modified_degrees['ASST_SHIFT']['stdev'],
-                    experience_growth=modified_degrees['ASST_SHIFT']['experience_growth'],
-                    years_to_complete=modified_degrees['ASST_SHIFT']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['NA']['name'],
-                    mean_earnings=modified_degrees['NA']['mean_earnings'],
-                    stdev=modified_degrees['NA']['stdev'],
-                    experience_growth=modified_degrees['NA']['experience_growth'],
-                    years_to_complete=modified_degrees['NA']['years_to_complete'],
-                    leave_labor_force_probability=1  
-                )
-            ]
-            probs = [0.45, 0.24, 0.27, 0.04]  
-        elif program_type == 'Kenya':
-            # Split ASST into ASST and ASST_SHIFT (33% of ASST becomes ASST_SHIFT)
-            asst_regular_pct = 0.60 * 0.67  # 67% of original ASST percentage
-            asst_shift_pct = 0.60 * 0.33    # 33% of original ASST percentage
-            
-            degrees = [
-                Degree(
-                    name=modified_degrees['NURSE']['name'],
-                    mean_earnings=modified_degrees['NURSE']['mean_earnings'],
-                    stdev=modified_degrees['NURSE']['stdev'],
-                    experience_growth=modified_degrees['NURSE']['experience_growth'],
-                    years_to_complete=modified_degrees['NURSE']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['ASST']['name'],
-                    mean_earnings=modified_degrees['ASST']['mean_earnings'],
-                    stdev=modified_degrees['ASST']['stdev'],
-                    experience_growth=modified_degrees['ASST']['experience_growth'],
-                    years_to_complete=modified_degrees['ASST']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['ASST_SHIFT']['name'],
-                    mean_earnings=modified_degrees['ASST_SHIFT']['mean_earnings'],
-                    stdev=modified_degrees['ASST_SHIFT']['stdev'],
-                    experience_growth=modified_degrees['ASST_SHIFT']['experience_growth'],
-                    years_to_complete=modified_degrees['ASST_SHIFT']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['NA']['name'],
-                    mean_earnings=modified_degrees['NA']['mean_earnings'],
-                    stdev=modified_degrees['NA']['stdev'],
-                    experience_growth=modified_degrees['NA']['experience_growth'],
-                    years_to_complete=modified_degrees['NA']['years_to_complete'],
-                    leave_labor_force_probability=1  
-                )
-            ]
-            probs = [0.25, asst_regular_pct, asst_shift_pct, 0.15]
-        elif program_type == 'Rwanda':
-            # Split ASST into ASST and ASST_SHIFT (33% of ASST becomes ASST_SHIFT)
-            asst_regular_pct = 0.40 * 0.67  # 67% of original ASST percentage
-            asst_shift_pct = 0.40 * 0.33    # 33% of original ASST percentage
-           
-            degrees = [
-                Degree(
-                    name=modified_degrees['TRADE']['name'],
-                    mean_earnings=modified_degrees['TRADE']['mean_earnings'],
-                    stdev=modified_degrees['TRADE']['stdev'],
-                    experience_growth=modified_degrees['TRADE']['experience_growth'],
-                    years_to_complete=modified_degrees['TRADE']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['ASST']['name'],
-                    mean_earnings=modified_degrees['ASST']['mean_earnings'],
-                    stdev=modified_degrees['ASST']['stdev'],
-                    experience_growth=modified_degrees['ASST']['experience_growth'],
-                    years_to_complete=modified_degrees['ASST']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['ASST_SHIFT']['name'],
-                    mean_earnings=modified_degrees['ASST_SHIFT']['mean_earnings'],
-                    stdev=modified_degrees['ASST_SHIFT']['stdev'],
-                    experience_growth=modified_degrees['ASST_SHIFT']['experience_growth'],
-                    years_to_complete=modified_degrees['ASST_SHIFT']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['NA']['name'],
-                    mean_earnings=modified_degrees['NA']['mean_earnings'],
-                    stdev=modified_degrees['NA']['stdev'],
-                    experience_growth=modified_degrees['NA']['experience_growth'],
-                    years_to_complete=modified_degrees['NA']['years_to_complete'],
-                    leave_labor_force_probability=1  
-                )
-            ]
-            probs = [0.40, asst_regular_pct, asst_shift_pct, 0.20]
-    
-    elif scenario == 'conservative':
-        if program_type == 'Uganda':
-            # Uganda conservative: Updated (32% BA, 11% MA, 42% ASST, 15% NA)
-            degrees = [
-                Degree(
-                    name=modified_degrees['BA']['name'],
-                    mean_earnings=modified_degrees['BA']['mean_earnings'],
-                    stdev=modified_degrees['BA']['stdev'],
-                    experience_growth=modified_degrees['BA']['experience_growth'],
-                    years_to_complete=modified_degrees['BA']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['MA']['name'],
-                    mean_earnings=modified_degrees['MA']['mean_earnings'],
-                    stdev=modified_degrees['MA']['stdev'],
-                    experience_growth=modified_degrees['MA']['experience_growth'],
-                    years_to_complete=modified_degrees['MA']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['ASST_SHIFT']['name'],
-                    mean_earnings=modified_degrees['ASST_SHIFT']['mean_earnings'],
-                    stdev=modified_degrees['ASST_SHIFT']['stdev'],
-                    experience_growth=modified_degrees['ASST_SHIFT']['experience_growth'],
-                    years_to_complete=modified_degrees['ASST_SHIFT']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['NA']['name'],
-                    mean_earnings=modified_degrees['NA']['mean_earnings'],
-                    stdev=modified_degrees['NA']['stdev'],
-                    experience_growth=modified_degrees['NA']['experience_growth'],
-                    years_to_complete=modified_degrees['NA']['years_to_complete'],
-                    leave_labor_force_probability=1  
-                )
-            ]
-            probs = [0.32, 0.11, 0.42, 0.15]
-        elif program_type == 'Kenya':
-            # Split ASST into ASST and ASST_SHIFT (33% of ASST becomes ASST_SHIFT)
-            asst_regular_pct = 0.50 * 0.67  # 67% of original ASST percentage
-            asst_shift_pct = 0.50 * 0.33    # 33% of original ASST percentage
-            
-            degrees = [
-                Degree(
-                    name=modified_degrees['NURSE']['name'],
-                    mean_earnings=modified_degrees['NURSE']['mean_earnings'],
-                    stdev=modified_degrees['NURSE']['stdev'],
-                    experience_growth=modified_degrees['NURSE']['experience_growth'],
-                    years_to_complete=modified_degrees['NURSE']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['ASST']['name'],
-                    mean_earnings=modified_degrees['ASST']['mean_earnings'],
-                    stdev=modified_degrees['ASST']['stdev'],
-                    experience_growth=modified_degrees['ASST']['experience_growth'],
-                    years_to_complete=modified_degrees['ASST']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['ASST_SHIFT']['name'],
-                    mean_earnings=modified_degrees['ASST_SHIFT']['mean_earnings'],
-                    stdev=modified_degrees['ASST_SHIFT']['stdev'],
-                    experience_growth=modified_degrees['ASST_SHIFT']['experience_growth'],
-                    years_to_complete=modified_degrees['ASST_SHIFT']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['NA']['name'],
-                    mean_earnings=modified_degrees['NA']['mean_earnings'],
-                    stdev=modified_degrees['NA']['stdev'],
-                    experience_growth=modified_degrees['NA']['experience_growth'],
-                    years_to_complete=modified_degrees['NA']['years_to_complete'],
-                    leave_labor_force_probability=1  
-                )
-            ]
-            probs = [0.20, asst_regular_pct, asst_shift_pct, 0.30]
-        elif program_type == 'Rwanda':
-            # Split ASST into ASST and ASST_SHIFT (33% of ASST becomes ASST_SHIFT)
-            asst_regular_pct = 0.40 * 0.67  # 67% of original ASST percentage
-            asst_shift_pct = 0.40 * 0.33    # 33% of original ASST percentage
-
-            degrees = [
-                Degree(
-                    name=modified_degrees['TRADE']['name'],
-                    mean_earnings=modified_degrees['TRADE']['mean_earnings'],
-                    stdev=modified_degrees['TRADE']['stdev'],
-                    experience_growth=modified_degrees['TRADE']['experience_growth'],
-                    years_to_complete=modified_degrees['TRADE']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['ASST']['name'],
-                    mean_earnings=modified_degrees['ASST']['mean_earnings'],
-                    stdev=modified_degrees['ASST']['stdev'],
-                    experience_growth=modified_degrees['ASST']['experience_growth'],
-                    years_to_complete=modified_degrees['ASST']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['ASST_SHIFT']['name'],
-                    mean_earnings=modified_degrees['ASST_SHIFT']['mean_earnings'],
-                    stdev=modified_degrees['ASST_SHIFT']['stdev'],
-                    experience_growth=modified_degrees['ASST_SHIFT']['experience_growth'],
-                    years_to_complete=modified_degrees['ASST_SHIFT']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['NA']['name'],
-                    mean_earnings=modified_degrees['NA']['mean_earnings'],
-                    stdev=modified_degrees['NA']['stdev'],
-                    experience_growth=modified_degrees['NA']['experience_growth'],
-                    years_to_complete=modified_degrees['NA']['years_to_complete'],
-                    leave_labor_force_probability=1  
-                )
-            ]
-            probs = [0.2, asst_regular_pct, asst_shift_pct, 0.4]
-    
-    elif scenario == 'optimistic':
-        if program_type == 'Uganda':
-            # Uganda optimistic scenario (63% BA, 33% MA, 2.5% ASST, 1.5% NA) - reduced NA by 1%
-            degrees = [
-                Degree(
-                    name=modified_degrees['BA']['name'],
-                    mean_earnings=modified_degrees['BA']['mean_earnings'],
-                    stdev=modified_degrees['BA']['stdev'],
-                    experience_growth=modified_degrees['BA']['experience_growth'],
-                    years_to_complete=modified_degrees['BA']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['MA']['name'],
-                    mean_earnings=modified_degrees['MA']['mean_earnings'],
-                    stdev=modified_degrees['MA']['stdev'],
-                    experience_growth=modified_degrees['MA']['experience_growth'],
-                    years_to_complete=modified_degrees['MA']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['ASST_SHIFT']['name'],
-                    mean_earnings=modified_degrees['ASST_SHIFT']['mean_earnings'],
-                    stdev=modified_degrees['ASST_SHIFT']['stdev'],
-                    experience_growth=modified_degrees['ASST_SHIFT']['experience_growth'],
-                    years_to_complete=modified_degrees['ASST_SHIFT']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['NA']['name'],
-                    mean_earnings=modified_degrees['NA']['mean_earnings'],
-                    stdev=modified_degrees['NA']['stdev'],
-                    experience_growth=modified_degrees['NA']['experience_growth'],
-                    years_to_complete=modified_degrees['NA']['years_to_complete'],
-                    leave_labor_force_probability=1  
-                )
-            ]
-            probs = [0.63, 0.33, 0.025, 0.015]
-        elif program_type == 'Kenya':
-            # Split ASST into ASST and ASST_SHIFT (33% of ASST becomes ASST_SHIFT)
-            asst_regular_pct = 0.40 * 0.67  # 67% of original ASST percentage
-            asst_shift_pct = 0.40 * 0.33    # 33% of original ASST percentage
-            
-            degrees = [
-                Degree(
-                    name=modified_degrees['NURSE']['name'],
-                    mean_earnings=modified_degrees['NURSE']['mean_earnings'],
-                    stdev=modified_degrees['NURSE']['stdev'],
-                    experience_growth=modified_degrees['NURSE']['experience_growth'],
-                    years_to_complete=modified_degrees['NURSE']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['ASST']['name'],
-                    mean_earnings=modified_degrees['ASST']['mean_earnings'],
-                    stdev=modified_degrees['ASST']['stdev'],
-                    experience_growth=modified_degrees['ASST']['experience_growth'],
-                    years_to_complete=modified_degrees['ASST']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['ASST_SHIFT']['name'],
-                    mean_earnings=modified_degrees['ASST_SHIFT']['mean_earnings'],
-                    stdev=modified_degrees['ASST_SHIFT']['stdev'],
-                    experience_growth=modified_degrees['ASST_SHIFT']['experience_growth'],
-                    years_to_complete=modified_degrees['ASST_SHIFT']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                )
-            ]
-            probs = [0.60, asst_regular_pct, asst_shift_pct]
-        elif program_type == 'Rwanda':
-            # Trade optimistic scenario - Split ASST into ASST and ASST_SHIFT (33% of ASST becomes ASST_SHIFT)
-            asst_regular_pct = 0.35 * 0.67  # 67% of original ASST percentage
-            asst_shift_pct = 0.35 * 0.33    # 33% of original ASST percentage
-            
-            degrees = [
-                Degree(
-                    name=modified_degrees['TRADE']['name'],
-                    mean_earnings=modified_degrees['TRADE']['mean_earnings'],
-                    stdev=modified_degrees['TRADE']['stdev'],
-                    experience_growth=modified_degrees['TRADE']['experience_growth'],
-                    years_to_complete=modified_degrees['TRADE']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['ASST']['name'],
-                    mean_earnings=modified_degrees['ASST']['mean_earnings'],
-                    stdev=modified_degrees['ASST']['stdev'],
-                    experience_growth=modified_degrees['ASST']['experience_growth'],
-                    years_to_complete=modified_degrees['ASST']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['ASST_SHIFT']['name'],
-                    mean_earnings=modified_degrees['ASST_SHIFT']['mean_earnings'],
-                    stdev=modified_degrees['ASST_SHIFT']['stdev'],
-                    experience_growth=modified_degrees['ASST_SHIFT']['experience_growth'],
-                    years_to_complete=modified_degrees['ASST_SHIFT']['years_to_complete'],
-                    leave_labor_force_probability=leave_labor_force_probability
-                ),
-                Degree(
-                    name=modified_degrees['NA']['name'],
-                    mean_earnings=modified_degrees['NA']['mean_earnings'],
-                    stdev=modified_degrees['NA']['stdev'],
-                    experience_growth=modified_degrees['NA']['experience_growth'],
-                    years_to_complete=modified_degrees['NA']['years_to_complete'],
-                    leave_labor_force_probability=1  
-                )
-            ]
-            probs = [0.60, asst_regular_pct, asst_shift_pct, 0.05]
+    def make_degree(degree_type: str) -> Degree:
+        params = modified_degrees[degree_type]
+        return Degree(
+            name=params['name'],
+            mean_earnings=params['mean_earnings'],
+            stdev=params['stdev'],
+            experience_growth=params['experience_growth'],
+            years_to_complete=params['years_to_complete'],
+            # NA degree has fixed high leave labor force probability
+            leave_labor_force_probability=1 if degree_type == 'NA' else leave_labor_force_probability
+        )
+    
+    if scenario in ('baseline', 'conservative', 'optimistic'):
+        degree_keys, probs = _SCENARIO_DEGREE_DISTRIBUTIONS.get((scenario, program_type), ((), np.empty(0)))
+        degrees = [make_degree(degree_type) for degree_type in degree_keys]
     
     elif scenario == 'custom':
         # Use user-provided degree distribution
-        if ba_pct > 0:
-            degrees.append(Degree(
-                name=modified_degrees['BA']['name'],
-                mean_earnings=modified_degrees['BA']['mean_earnings'],
-                stdev=modified_degrees['BA']['stdev'],
-                experience_growth=modified_degrees['BA']['experience_growth'],
-                years_to_complete=modified_degrees['BA']['years_to_complete'],
-                leave_labor_force_probability=leave_labor_force_probability
-            ))
-            probs.append(ba_pct)
-        
-        if ma_pct > 0:
-            degrees.append(Degree(
-                name=modified_degrees['MA']['name'],
-                mean_earnings=modified_degrees['MA']['mean_earnings'],
-                stdev=modified_degrees['MA']['stdev'],
-                experience_growth=modified_degrees['MA']['experience_growth'],
-                years_to_complete=modified_degrees['MA']['years_to_complete'],
-                leave_labor_force_probability=leave_labor_force_probability
-            ))
-            probs.append(ma_pct)
-        
-        if asst_pct > 0:
-            degrees.append(Degree(
-                name=modified_degrees['ASST']['name'],
-                mean_earnings=modified_degrees['ASST']['mean_earnings'],
-                stdev=modified_degrees['ASST']['stdev'],
-                experience_growth=modified_degrees['ASST']['experience_growth'],
-                years_to_complete=modified_degrees['ASST']['years_to_complete'],
-                leave_labor_force_probability=leave_labor_force_probability
-            ))
-            probs.append(asst_pct)
-            
-        if asst_shift_pct > 0:
-            degrees.append(Degree(
-                name=modified_degrees['ASST_SHIFT']['name'],
-                mean_earnings=modified_degrees['ASST_SHIFT']['mean_earnings'],
-                stdev=modified_degrees['ASST_SHIFT']['stdev'],
-                experience_growth=modified_degrees['ASST_SHIFT']['experience_growth'],
-                years_to_complete=modified_degrees['ASST_SHIFT']['years_to_complete'],
-                leave_labor_force_probability=leave_labor_force_probability
-            ))
-            probs.append(asst_shift_pct)
-
-        if nurse_pct > 0:
-            degrees.append(Degree(
-                name=modified_degrees['NURSE']['name'],
-                mean_earnings=modified_degrees['NURSE']['mean_earnings'],
-                stdev=modified_degrees['NURSE']['stdev'],
-                experience_growth=modified_degrees['NURSE']['experience_growth'],
-                years_to_complete=modified_degrees['NURSE']['years_to_complete'],
-                leave_labor_force_probability=leave_labor_force_probability
-            ))
-            probs.append(nurse_pct)
-        
-        if na_pct > 0:
-            degrees.append(Degree(
-                name=modified_degrees['NA']['name'],
-                mean_earnings=modified_degrees['NA']['mean_earnings'],
-                stdev=modified_degrees['NA']['stdev'],
-                experience_growth=modified_degrees['NA']['experience_growth'],
-                years_to_complete=modified_degrees['NA']['years_to_complete'],
-                leave_labor_force_probability=1  # NA degree has fixed high leave labor force probability
-            ))
-            probs.append(na_pct)
-        
-        if trade_pct > 0:
-            degrees.append(Degree(
-                name=modified_degrees['TRADE']['name'],
-                mean_earnings=modified_degrees['TRADE']['mean_earnings'],
-                stdev=modified_degrees['TRADE']['stdev'],
-                experience_growth=modified_degrees['TRADE']['experience_growth'],
-                years_to_complete=modified_degrees['TRADE']['years_to_complete'],
-                leave_labor_force_probability=leave_labor_force_probability  # Use the user-provided leave_labor_force_probability, not a fixed value
-            ))
-            probs.append(trade_pct)
+        custom_pcts = [
+            ('BA', ba_pct), ('MA', ma_pct), ('ASST', asst_pct), ('ASST_SHIFT', asst_shift_pct),
+            ('NURSE', nurse_pct), ('NA', na_pct), ('TRADE', trade_pct)
+        ]
+        degrees = [make_degree(degree_type) for degree_type, pct in custom_pcts if pct > 0]
+        probs = np.array([pct for _, pct in custom_pcts if pct > 0], dtype=np.float64)
         
         # Normalize probabilities to ensure they sum to 1
-        if sum(probs) > 0:
-            probs = [p/sum(probs) for p in probs]
+        if probs.sum() > 0:
+            probs = probs / probs.sum()
         else:
             raise ValueError("At least one degree type must have a non-zero percentage")
     else:
@@ -884,6 +424,372 @@ def _setup_degree_distribution(
     return degrees, probs
 
 
+def _experience_factor_table(experience_growth: np.ndarray, num_years: int) -> np.ndarray:
+    """
+    Tabulate (1 + growth) ** years for each growth rate and every 0 <= years < num_years.
+    
+    Built as a running product, one multiply per entry rather than a pow; the kernels look
+    up each student's factor as experience_factors[degree_idx, years_experience].
+    """
+    growth_factors = np.empty((len(experience_growth), num_years))
+    growth_factors[:, 0] = 1.0
+    growth_factors[:, 1:] = 1 + np.asarray(experience_growth, dtype=float)[:, np.newaxis]
+    return np.cumprod(growth_factors, axis=1)
+
+
+def _simulate_year_numpy(
+    i: int,
+    employment_draws: np.ndarray,
+    graduation_year: np.ndarray,
+    is_na: np.ndarray,
+    earnings_power: np.ndarray,
+    degree_idx: np.ndarray,
+    experience_factors: np.ndarray,
+    unemployment: np.ndarray,
+    deflator: np.ndarray,
+    threshold: np.ndarray,
+    cap: np.ndarray,
+    isa_percentage: float,
+    limit_years: int,
+    years_experience: np.ndarray,
+    years_paid: np.ndarray,
+    hit_cap: np.ndarray,
+    cap_value_when_hit: np.ndarray,
+    cumulative_paid: np.ndarray,
+    last_payment_year: np.ndarray,
+    year_earnings: np.ndarray,
+    year_payments: np.ndarray,
+    active_count: np.ndarray
+) -> None:
+    """
+    Advance every student of every trial through year i, in place.
+    
+    Args:
+        i: Year index
+        employment_draws: Uniform employment draws this year, shape (num_sims, num_students)
+        graduation_year: Year each student graduates, shape (num_sims, num_students)
+        is_na: Whether each student has no degree (never employed), shape (num_sims, num_students)
+        earnings_power: Real earnings at graduation, shape (num_sims, num_students)
+        degree_idx: Degree of each student, shape (num_sims, num_students)
+        experience_factors: Experience growth multiplier by degree and years of experience,
+            shape (num_degrees, num_years)
+        unemployment: Unemployment rate this year for each trial, shape (num_sims,)
+        deflator: Price level this year for each trial, shape (num_sims,)
+        threshold: ISA threshold this year for each trial, shape (num_sims,)
+        cap: ISA cap this year for each trial, shape (num_sims,)
+        isa_percentage: Share of earnings paid above the threshold
+        limit_years: Maximum number of years a student pays
+        years_experience, years_paid, hit_cap, cap_value_when_hit, cumulative_paid, last_payment_year:
+            Per-student state carried from year to year (updated in place)
+        year_earnings: Output array for this year's earnings (overwritten)
+        year_payments: Output array for this year's payments (overwritten)
+        active_count: Output array for the number of active students in each trial (overwritten)
+    """
+    graduated = graduation_year <= i
+    employed = graduated & ~is_na & (employment_draws < 1 - unemployment[:, np.newaxis])
+    
+    # Earnings grow with experience; unemployment costs up to three years of it
+    earnings = np.where(
+        employed,
+        earnings_power * deflator[:, np.newaxis] * experience_factors[degree_idx, years_experience],
+        0.0
+    )
+    years_experience[:] = np.where(employed, years_experience + 1, np.maximum(0, years_experience - 3))
+    
+    # Payments and cap tracking for students earning above the threshold
+    above_threshold = earnings > threshold[:, np.newaxis]
+    years_paid += above_threshold
+    over_year_limit = above_threshold & (years_paid > limit_years)
+    paying = above_threshold & ~over_year_limit & ~hit_cap
+    
+    potential_payment = isa_percentage * earnings
+    cap_i = cap[:, np.newaxis]
+    reaches_cap = paying & (cumulative_paid + potential_payment > cap_i)
+    payments = np.where(reaches_cap, cap_i - cumulative_paid, np.where(paying, potential_payment, 0.0))
+    
+    hit_cap |= reaches_cap
+    cap_value_when_hit[:] = np.where(reaches_cap, cap_i, cap_value_when_hit)
+    last_payment_year[:] = np.where(paying & ~reaches_cap, i, last_payment_year)
+    # The capping payment is exactly what was left, so a capped total is the cap itself
+    cumulative_paid[:] = np.where(reaches_cap, cap_i, cumulative_paid + payments)
+    
+    year_earnings[:] = earnings
+    year_payments[:] = payments
+    
+    # Active students: graduated, still paying, and paid or graduated in the last 3 years
+    recent_payment = (last_payment_year >= 0) & (i - last_payment_year <= 3)
+    recent_graduate = i - graduation_year <= 3
+    active = graduated & ~hit_cap & ~is_na & ~over_year_limit & (recent_payment | recent_graduate)
+    active_count[:] = active.sum(axis=1)
+
+
+if NUMBA_AVAILABLE:
+    # nogil lets other server threads run Python code while a kernel call is in flight
+    @njit(parallel=True, nogil=True, fastmath=True, cache=True)
+    def _simulate_year_kernel(i, employment_draws, graduation_year, is_na, earnings_power, degree_idx,
+                       experience_factors, unemployment, deflator, threshold, cap, isa_percentage, limit_years,
+                       years_experience, years_paid, hit_cap, cap_value_when_hit, cumulative_paid,
+                       last_payment_year, year_earnings, year_payments, active_count):
+        """Compiled version of _simulate_year_numpy: one pass per student, parallel over trials."""
+        num_sims, num_students = employment_draws.shape
+        for sim in prange(num_sims):
+            num_active = 0
+            for s in range(num_students):
+                # Branch-free per student: every condition is a mask feeding a select or a
+                # multiply, so the inner loop has no data-dependent jumps to mispredict
+                graduated = graduation_year[sim, s] <= i
+                employed = graduated & ~is_na[sim, s] & (employment_draws[sim, s] < 1 - unemployment[sim])
+                experience = years_experience[sim, s]
+                earnings = employed * (earnings_power[sim, s] * deflator[sim]
+                                       * experience_factors[degree_idx[sim, s], experience])
+                years_experience[sim, s] = experience + 1 if employed else max(0, experience - 3)
+                
+                # Past the payment year limit, or already capped: no payment
+                above_threshold = earnings > threshold[sim]
+                years_paid[sim, s] += above_threshold
+                over_year_limit = above_threshold & (years_paid[sim, s] > limit_years)
+                paying = above_threshold & ~over_year_limit & ~hit_cap[sim, s]
+                
+                paid = cumulative_paid[sim, s]
+                potential_payment = isa_percentage * earnings
+                reaches_cap = paying & (paid + potential_payment > cap[sim])
+                payment = paying * (cap[sim] - paid if reaches_cap else potential_payment)
+                
+                hit_cap[sim, s] |= reaches_cap
+                cap_value_when_hit[sim, s] = cap[sim] if reaches_cap else cap_value_when_hit[sim, s]
+                last_payment_year[sim, s] = i if paying & ~reaches_cap else last_payment_year[sim, s]
+                cumulative_paid[sim, s] = cap[sim] if reaches_cap else paid + payment
+                
+                year_earnings[sim, s] = earnings
+                year_payments[sim, s] = payment
+                
+                # Active students: graduated, still paying, and paid or graduated in the last 3 years
+                last_paid = last_payment_year[sim, s]
+                recent_payment = (last_paid >= 0) & (i - last_paid <= 3)
+                recent_graduate = i - graduation_year[sim, s] <= 3
+                num_active += (graduated & ~hit_cap[sim, s] & ~is_na[sim, s] & ~over_year_limit
+                               & (recent_payment | recent_graduate))
+            active_count[sim] = num_active
+
+    # Numba's parallel regions release the GIL, and its workqueue threading layer aborts if
+    # two threads (e.g. gunicorn's) enter one at the same time, so under workqueue kernel
+    # calls take turns. The layer is only known once the first call has started it, so
+    # calls are locked until then; omp and tbb then run concurrent calls side by side.
+    _KERNEL_LOCK = threading.Lock()
+    _kernel_needs_lock = True
+    
+    def _simulate_year(*args):
+        global _kernel_needs_lock
+        if not _kernel_needs_lock:
+            _simulate_year_kernel(*args)
+            return
+        with _KERNEL_LOCK:
+            _simulate_year_kernel(*args)
+            _kernel_needs_lock = threading_layer() == 'workqueue'
+else:
+    _simulate_year = _simulate_year_numpy
+
+
+def _warm_up_simulate_year() -> None:
+    """Helper function to compile _simulate_year once so the first simulation doesn't pay for it."""
+    shape = (2, 2)
+    # Batch engine: per-year inputs and outputs are (non-contiguous) slices of the full histories
+    draws = np.zeros(shape + (2,), dtype=np.float32)
+    year_path = np.zeros(shape)
+    history = np.zeros(shape + (2,), dtype=np.float32)
+    counts = np.zeros(shape, dtype=int)
+    _simulate_year(
+        0, draws[:, :, 0], np.zeros(shape, dtype=int), np.zeros(shape, dtype=np.bool_),
+        np.zeros(shape), np.zeros(shape, dtype=np.int64), np.ones(shape),
+        year_path[:, 0], year_path[:, 0], year_path[:, 0], year_path[:, 0], 0.0, 1,
+        np.zeros(shape, dtype=np.int64), np.zeros(shape, dtype=np.int64), np.zeros(shape, dtype=np.bool_),
+        np.zeros(shape), np.zeros(shape), np.full(shape, -1, dtype=np.int64),
+        history[:, :, 0], history[:, :, 1], counts[:, 0]
+    )
+    
+    # simulate_simple: a single trial of contiguous per-student arrays and 1-element year values
+    shape = (1, 2)
+    year_value = np.zeros(1)
+    history = np.zeros(shape + (2,), dtype=np.float32)
+    counts = np.zeros(2, dtype=np.int64)
+    _simulate_year(
+        0, np.zeros(shape, dtype=np.float32), np.zeros(shape, dtype=np.int64), np.zeros(shape, dtype=np.bool_),
+        np.zeros(shape), np.zeros(shape, dtype=np.int64), np.ones(shape),
+        year_value, year_value, year_value, year_value, 0.0, 1,
+        np.zeros(shape, dtype=np.int64), np.zeros(shape, dtype=np.int64), np.zeros(shape, dtype=np.bool_),
+        np.zeros(shape), np.zeros(shape), np.full(shape, -1, dtype=np.int64),
+        history[:, :, 0], history[:, :, 1], counts[0:1]
+    )
+
+
+def warm_up() -> None:
+    """
+    Compile (or load from Numba's on-disk cache) the simulation kernel before the first run.
+    
+    Only call this in a process that runs simulations itself: the kernel starts Numba's
+    thread pool, and forking workers from a process using the OpenMP threading layer (as
+    Dash background jobs do) kills them.
+    """
+    if NUMBA_AVAILABLE:
+        _warm_up_simulate_year()
+
+
+def _simulate_batch(
+    degrees: List[Degree],
+    probs: np.ndarray,
+    num_students: int,
+    num_sims: int,
+    num_years: int,
+    isa_percentage: float,
+    isa_threshold: float,
+    isa_cap: float,
+    limit_years: int,
+    initial_inflation_rate: float,
+    initial_unemployment_rate: float,
+    performance_fee_pct: float = 0.025,
+    annual_fee_per_student: float = 300,
+    apply_graduation_delay: bool = False,
+    rng: Optional[np.random.Generator] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Run all Monte Carlo trials at once on pre-allocated (num_sims, num_students, num_years) arrays.
+    
+    This follows the same rules as simulate_simple, but every trial and every student is
+    advanced together: the only Python loop left is over years, which is a true time
+    dependence (experience, running cap totals and active status carry forward).
+    
+    Args:
+        degrees: Degree objects students can be assigned to
+        probs: Probability of each degree
+        num_students: Number of students per trial
+        num_sims: Number of trials
+        num_years: Number of years to simulate
+        isa_percentage: Share of earnings paid above the threshold
+        isa_threshold: Initial (year 0) income threshold
+        isa_cap: Initial (year 0) payment cap
+        limit_years: Maximum number of years a student pays
+        initial_inflation_rate: Starting (and stable) inflation rate
+        initial_unemployment_rate: Starting (and stable) unemployment rate
+        performance_fee_pct: Malengo performance fee on repayments
+        annual_fee_per_student: Malengo annual fee per active student
+        apply_graduation_delay: Whether to apply degree-specific graduation delays
+        rng: Random generator to draw from (a fresh one is created if not given)
+    
+    Returns:
+        Dictionary of per-student arrays with shape (num_sims, num_students, num_years) and
+        per-trial arrays with shape (num_sims, num_years)
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    shape = (num_sims, num_students)
+    
+    # Economic paths for every trial (same AR(1) process as Year.next_year)
+    inflation = np.empty((num_sims, num_years))
+    unemployment = np.empty((num_sims, num_years))
+    inflation[:, 0] = initial_inflation_rate
+    unemployment[:, 0] = initial_unemployment_rate
+    inflation_shocks = rng.normal(0, 0.01, size=(num_sims, num_years))
+    unemployment_shocks = rng.lognormal(0, 1, size=(num_sims, num_years)) / 100
+    for i in range(1, num_years):
+        inflation[:, i] = np.clip(
+            initial_inflation_rate * 0.45 + inflation[:, i - 1] * 0.5 + inflation_shocks[:, i],
+            -0.02, 0.15
+        )
+        unemployment[:, i] = np.clip(
+            initial_unemployment_rate * 0.33 + unemployment[:, i - 1] * 0.25 + unemployment_shocks[:, i],
+            0.02, 0.30
+        )
+    growth_factors = 1 + inflation
+    growth_factors[:, 0] = 1.0
+    deflator = np.cumprod(growth_factors, axis=1)
+    year_cap = isa_cap * deflator
+    year_threshold = isa_threshold * deflator
+    
+    # Degree parameters as arrays, indexed by each student's degree
+    mean_earnings = np.array([d.mean_earnings for d in degrees], dtype=float)
+    stdev = np.array([d.stdev for d in degrees], dtype=float)
+    experience_growth = np.array([d.experience_growth for d in degrees], dtype=float)
+    years_to_complete = np.array([d.years_to_complete for d in degrees], dtype=int)
+    leave_probability = np.array([d.leave_labor_force_probability for d in degrees], dtype=float)
+    degree_is_na = np.array([d.name == 'NA' for d in degrees])
+    
+    # Assign degrees to every student of every trial in one draw
+    degree_idx = rng.choice(len(degrees), size=shape, p=probs)
+    base_years = years_to_complete[degree_idx]
+    is_na = degree_is_na[degree_idx]
+    
+    if apply_graduation_delay:
+        delay_table = _graduation_delay_table(degrees)
+        delay_draws = rng.random(shape)
+        graduation_year = base_years + (delay_draws[..., np.newaxis] >= delay_table[degree_idx]).sum(axis=-1)
+    else:
+        graduation_year = base_years
+    
+    # Earnings power at graduation, replaced by home-country earnings for leavers
+    degree_earnings = rng.normal(mean_earnings[degree_idx], stdev[degree_idx])
+    is_home = rng.random(shape) < leave_probability[degree_idx]
+    home_earnings = rng.normal(_HOME_EARNINGS_MEAN, _HOME_EARNINGS_STDEV, size=shape)
+    earnings_power = np.maximum(0, np.where(is_home, home_earnings, degree_earnings))
+    
+    # (1 + growth) ** years_experience for every degree, tabulated once instead of a pow
+    # per student-year; experience never exceeds the year index
+    experience_factors = _experience_factor_table(experience_growth, num_years)
+    
+    # Employment draws for every student-year; this is the largest input array, so it is
+    # drawn in float32 like the histories (a uniform draw needs no more precision)
+    employment_draws = rng.random((num_sims, num_students, num_years), dtype=np.float32)
+    
+    # Pre-allocated outputs; per-student histories are float32 (cents-level precision is
+    # plenty for dollar amounts) while per-trial totals below are accumulated in float64
+    earnings = np.zeros((num_sims, num_students, num_years), dtype=np.float32)
+    payments = np.zeros((num_sims, num_students, num_years), dtype=np.float32)
+    active_students_count = np.zeros((num_sims, num_years), dtype=int)
+    
+    # Per-student state carried from year to year
+    years_experience = np.zeros(shape, dtype=np.int64)
+    years_paid = np.zeros(shape, dtype=np.int64)
+    hit_cap = np.zeros(shape, dtype=np.bool_)
+    cap_value_when_hit = np.zeros(shape)
+    cumulative_paid = np.zeros(shape)
+    last_payment_year = np.full(shape, -1, dtype=np.int64)
+    
+    # Employment, earnings, payments, cap tracking and active status for each year are
+    # fused into one pass per student, written straight into this year's output slices
+    for i in range(num_years):
+        _simulate_year(
+            i, employment_draws[:, :, i], graduation_year, is_na, earnings_power, degree_idx,
+            experience_factors, unemployment[:, i], deflator[:, i], year_threshold[:, i], year_cap[:, i],
+            isa_percentage, limit_years,
+            years_experience, years_paid, hit_cap, cap_value_when_hit, cumulative_paid,
+            last_payment_year, earnings[:, :, i], payments[:, :, i], active_students_count[:, i]
+        )
+    
+    # Per-trial totals and the Malengo / investor split
+    total_payments = payments.sum(axis=1, dtype=np.float64)
+    total_real_payments = total_payments / deflator
+    malengo_payments = active_students_count * annual_fee_per_student * deflator + total_payments * performance_fee_pct
+    malengo_real_payments = malengo_payments / deflator
+    
+    return {
+        'Degree_Index': degree_idx,
+        'Years_To_Complete': base_years,
+        'Earnings': earnings,
+        'Payments': payments,
+        'Real_Payments': np.divide(payments, deflator[:, np.newaxis, :], dtype=np.float32),
+        'Years_Paid': years_paid,
+        'Hit_Cap': hit_cap,
+        'Cap_Value_When_Hit': cap_value_when_hit,
+        'Total_Payments': total_payments,
+        'Total_Real_Payments': total_real_payments,
+        'Malengo_Payments': malengo_payments,
+        'Malengo_Real_Payments': malengo_real_payments,
+        'Investor_Payments': total_payments - malengo_payments,
+        'Investor_Real_Payments': total_real_payments - malengo_real_payments,
+        'Active_Students_Count': active_students_count
+    }
+
+
 def run_simple_simulation(
     program_type: str,
     num_students: int,
@@ -935,7 +841,8 @@ def run_simple_simulation(
     random_seed: Optional[int] = None,
     num_years: int = 25,
     limit_years: int = 10,
-    apply_graduation_delay: bool = False
+    apply_graduation_delay: bool = False,
+    rng: Optional[np.random.Generator] = None
 ) -> Dict[str, Any]:
     """
     Run multiple simulations for Uganda, Kenya, or Rwanda program with simplified parameters.
@@ -969,6 +876,7 @@ def run_simple_simulation(
         num_years: Total number of years to simulate
         limit_years: Maximum number of years to pay the ISA
         apply_graduation_delay: Whether to apply realistic graduation delays
+        rng: Random generator to draw from; if not given, one is seeded with random_seed
     
     Returns:
         Dictionary of aggregated results from multiple simulations
@@ -977,41 +885,21 @@ def run_simple_simulation(
         All growth rates should be provided in decimal form (e.g., 0.03 for 3% growth)
         rather than as percentages.
     """
-    # Set random seed if provided
-    if random_seed is not None:
-        np.random.seed(random_seed)
+    # All draws for this run come from a single generator
+    if rng is None:
+        rng = np.random.default_rng(random_seed)
     
     # Set default ISA parameters based on program type if not provided
+    # Set default ISA parameters and price per student based on program type if not provided
+    default_isa_percentage, default_isa_cap, default_price = _PROGRAM_DEFAULTS.get(program_type, (0.12, 50000, None))
     if isa_percentage is None:
-        if program_type == 'Uganda':
-            isa_percentage = 0.14
-        elif program_type == 'Kenya':
-            isa_percentage = 0.12
-        elif program_type == 'Rwanda':
-            isa_percentage = 0.12  
-        else:
-            isa_percentage = 0.12  # Default
-    
+        isa_percentage = default_isa_percentage
     if isa_cap is None:
-        if program_type == 'Uganda':
-            isa_cap = 72500
-        elif program_type == 'Kenya':
-            isa_cap = 49950
-        elif program_type == 'Rwanda':
-            isa_cap = 45000  
-        else:
-            isa_cap = 50000  # Default
-    
-    # Set default price_per_student based on program type if not provided
+        isa_cap = default_isa_cap
     if price_per_student is None:
-        if program_type == 'Uganda':
-            price_per_student = 29000
-        elif program_type == 'Kenya':
-            price_per_student = 16650
-        elif program_type == 'Rwanda':
-            price_per_student = 16650  
-        else:
+        if default_price is None:
             raise ValueError("Program type must be 'Uganda', 'Kenya', or 'Rwanda'")
+        price_per_student = default_price
     
     # Set default values for asst_shift if not provided
     if asst_shift_salary is None:
@@ -1038,89 +926,40 @@ def run_simple_simulation(
         ba_pct, ma_pct, asst_pct, nurse_pct, na_pct, trade_pct, asst_shift_pct
     )
     
-    # Prepare containers for results
-    total_payment = {}
-    investor_payment = {}
-    malengo_payment = {}
-    
-    # Add containers for nominal (non-inflation-adjusted) payments
-    nominal_total_payment = {}
-    nominal_investor_payment = {}
-    nominal_malengo_payment = {}
-    
-    # Add container for active students count
-    active_students = {}
-    
-    df_list = []
-    
-    # Track statistics across simulations
-    employment_stats = []
-    ever_employed_stats = []  # Add this line to track ever employed rates
-    repayment_stats = []
-    cap_stats = []
-    
     # Calculate total investment
     total_investment = num_students * price_per_student
     
-    # Run multiple simulations
-    for trial in range(num_sims):
-        # Initialize year class with a unique seed for each trial if random_seed is provided
-        trial_seed = random_seed + trial if random_seed is not None else None
-        year = Year(
-            initial_inflation_rate=initial_inflation_rate,
-            initial_unemployment_rate=initial_unemployment_rate,
-            initial_isa_cap=isa_cap,
-            initial_isa_threshold=isa_threshold,
-            num_years=num_years
-        )
-        
-        # Assign degrees to each student
-        students = _create_students(num_students, degrees, probs, num_years, apply_graduation_delay)
-        
-        # Run the simulation and store results
-        sim_results = simulate_simple(
-            students=students,
-            year=year,
-            num_years=num_years,
-            limit_years=limit_years,
-            isa_percentage=isa_percentage,
-            performance_fee_pct=performance_fee_pct,
-            gamma=False,
-            price_per_student=price_per_student,
-            new_malengo_fee=new_malengo_fee,
-            annual_fee_per_student=annual_fee_per_student,
-            apply_graduation_delay=apply_graduation_delay
-        )
-        df_list.append(sim_results)
-        
-        # Calculate and store statistics for this simulation
-        stats = _calculate_simulation_statistics(
-            students, num_students, num_years, limit_years
-        )
-        
-        employment_stats.append(stats['employment_rate'])
-        ever_employed_stats.append(stats['ever_employed_rate'])  # Add this line to collect ever employed rates
-        repayment_stats.append(stats['repayment_rate'])
-        cap_stats.append(stats['cap_stats'])
-        
-        # Extract and store real payments (inflation-adjusted)
-        total_payment[trial] = np.sum(pd.DataFrame([student.real_payments for student in students]), axis=0)
-        investor_payment[trial] = df_list[trial]['Investor_Real_Payments']
-        malengo_payment[trial] = df_list[trial]['Malengo_Real_Payments']
-        
-        # Extract and store nominal payments (not adjusted for inflation)
-        nominal_total_payment[trial] = np.sum(pd.DataFrame([student.payments for student in students]), axis=0)
-        nominal_investor_payment[trial] = df_list[trial]['Investor_Payments']
-        nominal_malengo_payment[trial] = df_list[trial]['Malengo_Payments']
-        
-        # Extract and store active students count
-        active_students[trial] = df_list[trial]['Active_Students_Count']
+    # Run every trial at once
+    batch = _simulate_batch(
+        degrees=degrees,
+        probs=probs,
+        num_students=num_students,
+        num_sims=num_sims,
+        num_years=num_years,
+        isa_percentage=isa_percentage,
+        isa_threshold=isa_threshold,
+        isa_cap=isa_cap,
+        limit_years=limit_years,
+        initial_inflation_rate=initial_inflation_rate,
+        initial_unemployment_rate=initial_unemployment_rate,
+        performance_fee_pct=performance_fee_pct,
+        annual_fee_per_student=annual_fee_per_student,
+        apply_graduation_delay=apply_graduation_delay,
+        rng=rng
+    )
     
-    # Calculate summary statistics
+    # Calculate statistics for each simulation
+    trial_stats = _calculate_batch_statistics(batch, num_students, num_years, limit_years)
+    employment_stats = [stats['employment_rate'] for stats in trial_stats]
+    ever_employed_stats = [stats['ever_employed_rate'] for stats in trial_stats]
+    repayment_stats = [stats['repayment_rate'] for stats in trial_stats]
+    cap_stats = [stats['cap_stats'] for stats in trial_stats]
+    
+    # Calculate summary statistics straight from the per-trial (num_sims, num_years) arrays
     summary_stats = _calculate_summary_statistics(
-        total_payment, investor_payment, malengo_payment,
-        nominal_total_payment, nominal_investor_payment, nominal_malengo_payment,
-        active_students,
+        batch['Total_Real_Payments'], batch['Investor_Real_Payments'], batch['Malengo_Real_Payments'],
+        batch['Total_Payments'], batch['Investor_Payments'], batch['Malengo_Payments'],
+        batch['Active_Students_Count'],
         total_investment, degrees, probs, num_students,
         employment_stats, ever_employed_stats, repayment_stats, cap_stats,
         annual_fee_per_student
@@ -1143,17 +982,129 @@ def run_simple_simulation(
     return summary_stats
 
 
+def _run_blended_chunk(param_sets: List[Dict[str, Any]]) -> List[Optional[Dict[str, float]]]:
+    """Run a chunk of blended Monte Carlo simulations, returning key metrics (None for failed runs)."""
+    chunk_metrics = []
+    for sim_params in param_sets:
+        try:
+            sim_result = run_simple_simulation(**sim_params)
+        except Exception:
+            chunk_metrics.append(None)
+            continue
+        
+        chunk_metrics.append({
+            'investor_irr': sim_result.get('nominal_investor_IRR', 0) * 100,  # Convert to percentage
+            'total_irr': sim_result.get('nominal_IRR', 0) * 100,
+            'avg_payment': sim_result.get('average_nominal_total_payment', 0),
+            'duration': sim_result.get('average_duration', 0),
+            'repayment_rate': sim_result.get('repayment_rate', 0) * 100,
+            'employment_rate': sim_result.get('employment_rate', 0) * 100,
+            'ever_employed_rate': sim_result.get('ever_employed_rate', 0) * 100
+        })
+    
+    return chunk_metrics
+
+
+def _init_blended_worker() -> None:
+    """Run the Numba kernel single-threaded in each pool worker, since the pool already has a worker per core."""
+    if NUMBA_AVAILABLE:
+        import numba
+        numba.set_num_threads(1)
+
+
+# Starting the worker pool takes about as long as running 500 blended simulations
+# serially, so each worker needs at least that many to make up for it
+_MIN_BLENDED_SIMS_PER_WORKER = 500
+
+
+def run_blended_simulations(param_sets: List[Dict[str, Any]]) -> List[Optional[Dict[str, float]]]:
+    """
+    Run independent blended Monte Carlo simulations, fanned out over worker processes.
+    
+    Each worker gets a contiguous chunk of parameter sets and returns only the key metrics,
+    so results come back in the original order. Every parameter set carries its own random
+    generator, so the output doesn't depend on how the work is split.
+    
+    Args:
+        param_sets: Keyword arguments for run_simple_simulation, one dict per simulation
+        
+    Returns:
+        Key metrics of each simulation (None where it failed), in the order of param_sets
+    """
+    # Use this process's share of the cores (gunicorn_config sets NUMBA_NUM_THREADS for
+    # each server worker), so concurrent jobs across server workers don't oversubscribe
+    num_cores = int(os.environ.get('NUMBA_NUM_THREADS', os.cpu_count() or 1))
+    num_workers = min(num_cores, len(param_sets) // _MIN_BLENDED_SIMS_PER_WORKER)
+    if num_workers <= 1:
+        return _run_blended_chunk(param_sets)
+    
+    # Only import the process pool (and the multiprocessing machinery behind it) when needed
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    
+    chunk_size = -(-len(param_sets) // num_workers)
+    chunks = [param_sets[i:i + chunk_size] for i in range(0, len(param_sets), chunk_size)]
+    # Workers come from a forkserver rather than a fork of this process (a background job
+    # or a server worker), which may already be running Numba's OpenMP threads. The
+    # forkserver imports this module once, so workers start without importing anything else.
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload([__name__])
+    with ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=context,
+        initializer=_init_blended_worker
+    ) as executor:
+        return [metrics for chunk_metrics in executor.map(_run_blended_chunk, chunks) for metrics in chunk_metrics]
+
+
+# Quantiles reported for payment-based IRR distributions
+_PAYMENT_QUANTILES = [0, 0.25, 0.5, 0.75, 1.0]
+
+
+def _calculate_irr(
+    total_payments: Union[float, np.ndarray],
+    total_investment: float,
+    average_duration: float,
+    default: Union[float, np.ndarray] = -0.1
+) -> np.ndarray:
+    """
+    Helper function to turn total payments into an annualized return, vectorized.
+    
+    Accepts a scalar or an array of totals (e.g. one per quantile) and evaluates
+    log(max(1, payment) / total_investment) / average_duration for all of them at once,
+    using the default wherever the payment or the duration is not positive.
+    """
+    total_payments = np.asarray(total_payments, dtype=float)
+    valid = (total_payments > 0) & (average_duration > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        irr = np.log(np.maximum(1, total_payments) / total_investment) / average_duration
+    return np.where(valid, irr, default)
+
+
+def _calculate_quantile_irrs(
+    payment_sums: np.ndarray,
+    total_investment: float,
+    average_duration: float
+) -> Dict[float, float]:
+    """Helper function to calculate the IRR at each quantile of per-trial total payments in one pass."""
+    quantiles = np.array(_PAYMENT_QUANTILES, dtype=float)
+    quantile_payments = np.quantile(payment_sums, quantiles)
+    # Lower default for lower quantiles
+    irrs = _calculate_irr(quantile_payments, total_investment, average_duration, default=-0.1 - (0.1 * (1 - quantiles)))
+    return dict(zip(_PAYMENT_QUANTILES, irrs.tolist()))
+
+
 def _calculate_summary_statistics(
-    total_payment: Dict[int, np.ndarray],
-    investor_payment: Dict[int, np.ndarray],
-    malengo_payment: Dict[int, np.ndarray],
-    nominal_total_payment: Dict[int, np.ndarray],
-    nominal_investor_payment: Dict[int, np.ndarray],
-    nominal_malengo_payment: Dict[int, np.ndarray],
-    active_students: Dict[int, np.ndarray],
+    total_payment: np.ndarray,
+    investor_payment: np.ndarray,
+    malengo_payment: np.ndarray,
+    nominal_total_payment: np.ndarray,
+    nominal_investor_payment: np.ndarray,
+    nominal_malengo_payment: np.ndarray,
+    active_students: np.ndarray,
     total_investment: float,
     degrees: List[Degree],
-    probs: List[float],
+    probs: np.ndarray,
     num_students: int,
     employment_stats: List[float],
     ever_employed_stats: List[float],
@@ -1161,54 +1112,41 @@ def _calculate_summary_statistics(
     cap_stats: List[Dict[str, Any]],
     annual_fee_per_student: float = 300
 ) -> Dict[str, Any]:
-    """Helper function to calculate summary statistics across all simulations."""
+    """
+    Helper function to calculate summary statistics across all simulations.
+    
+    Payment and active-student inputs are (num_sims, num_years) arrays, one row per trial.
+    """
     # Calculate summary statistics for real (inflation-adjusted) payments
-    payments_df = pd.DataFrame(total_payment)
-    average_total_payment = np.sum(payments_df, axis=0).mean()
-    
-    # Calculate weighted average duration (avoiding division by zero)
-    payment_sums = np.sum(payments_df, axis=0)
-    if np.any(payment_sums > 0):
-        # Convert to numpy arrays to avoid pandas indexing issues
-        payments_np = payments_df.to_numpy()
-        payment_sums_np = payment_sums.to_numpy()
-        
-        # Create weights matrix
-        weights = np.zeros_like(payments_np)
-        for i in range(len(payment_sums_np)):
-            if payment_sums_np[i] > 0:
-                weights[:, i] = payments_np[:, i] / payment_sums_np[i]
-        
-        # Calculate weighted average
-        years = np.arange(1, len(payments_df) + 1)
-        weighted_durations = np.sum(years[:, np.newaxis] * weights, axis=0)
+    payment_sums = total_payment.sum(axis=1)
+    average_total_payment = payment_sums.mean()
+    
+    # Calculate weighted average duration (avoiding division by zero): each trial's
+    # payment-weighted mean year, with trials that paid nothing counting as zero
+    paid_trials = payment_sums > 0
+    if np.any(paid_trials):
+        years = np.arange(1, total_payment.shape[1] + 1)
+        weighted_year_sums = np.einsum('st,t->s', total_payment, years)
+        weighted_durations = np.where(paid_trials, weighted_year_sums / np.where(paid_trials, payment_sums, 1), 0)
         average_duration = np.mean(weighted_durations)
     else:
         average_duration = 0
     
     # Calculate real IRR (safely handle negative values)
-    if average_total_payment > 0 and average_duration > 0:
-        IRR = np.log(max(1, average_total_payment) / total_investment) / average_duration
-    else:
-        IRR = -0.1  # Default negative return
+    IRR = float(_calculate_irr(average_total_payment, total_investment, average_duration))
     
     # Calculate real investor payments
-    investor_payments_df = pd.DataFrame(investor_payment)
-    average_investor_payment = np.sum(investor_payments_df, axis=0).mean()
+    investor_payment_sums = investor_payment.sum(axis=1)
+    average_investor_payment = investor_payment_sums.mean()
     
     # Calculate real Malengo payments
-    malengo_payments_df = pd.DataFrame(malengo_payment)
-    average_malengo_payment = np.sum(malengo_payments_df, axis=0).mean()
+    average_malengo_payment = malengo_payment.sum(axis=1).mean()
     
     # Calculate real investor IRR using total investment as base
-    if average_investor_payment > 0 and average_duration > 0:
-        investor_IRR = np.log(max(1, average_investor_payment) / total_investment) / average_duration
-    else:
-        investor_IRR = -0.1
+    investor_IRR = float(_calculate_irr(average_investor_payment, total_investment, average_duration))
     
     # Calculate active students statistics
-    active_students_df = pd.DataFrame(active_students)
-    active_students_by_year = active_students_df.mean(axis=1)
+    active_students_by_year = active_students.mean(axis=0)
     max_active_students = active_students_by_year.max()
     avg_active_students = active_students_by_year.mean()
     active_students_pct = avg_active_students / num_students
@@ -1218,27 +1156,15 @@ def _calculate_summary_statistics(
     total_malengo_revenue = annual_malengo_revenue * len(active_students_by_year)
     
     # Calculate real payment quantiles
-    payment_quantiles = {}
-    for quantile in [0, 0.25, 0.5, 0.75, 1.0]:
-        quantile_payment = np.sum(payments_df, axis=0).quantile(quantile)
-        if quantile_payment > 0 and average_duration > 0:
-            payment_quantiles[quantile] = np.log(max(1, quantile_payment) / total_investment) / average_duration
-        else:
-            payment_quantiles[quantile] = -0.1 - (0.1 * (1-quantile))  # Lower default for lower quantiles
+    payment_quantiles = _calculate_quantile_irrs(payment_sums, total_investment, average_duration)
     
     # Calculate real investor payment quantiles
-    investor_payment_quantiles = {}
-    for quantile in [0, 0.25, 0.5, 0.75, 1.0]:
-        investor_quantile_payment = np.sum(investor_payments_df, axis=0).quantile(quantile)
-        if investor_quantile_payment > 0 and average_duration > 0:
-            investor_payment_quantiles[quantile] = np.log(max(1, investor_quantile_payment) / total_investment) / average_duration
-        else:
-            investor_payment_quantiles[quantile] = -0.1 - (0.1 * (1-quantile))  # Lower default for lower quantiles
+    investor_payment_quantiles = _calculate_quantile_irrs(investor_payment_sums, total_investment, average_duration)
     
-    # Prepare real payment data for plotting
-    payment_by_year = payments_df.mean(axis=1)
-    investor_payment_by_year = investor_payments_df.mean(axis=1)
-    malengo_payment_by_year = malengo_payments_df.mean(axis=1)
+    # Prepare real payment data for plotting (plain arrays, ready for .tolist())
+    payment_by_year = total_payment.mean(axis=0)
+    investor_payment_by_year = investor_payment.mean(axis=0)
+    malengo_payment_by_year = malengo_payment.mean(axis=0)
     
     # Calculate average employment and repayment statistics
     avg_employment_rate = np.mean(employment_stats)
@@ -1258,50 +1184,30 @@ def _calculate_summary_statistics(
     degree_pcts = {degree.name: probs[i] for i, degree in enumerate(degrees)}
     
     # Calculate summary statistics for nominal (non-inflation-adjusted) payments
-    nominal_payments_df = pd.DataFrame(nominal_total_payment)
-    avg_nominal_total_payment = np.sum(nominal_payments_df, axis=0).mean()
+    nominal_payment_sums = nominal_total_payment.sum(axis=1)
+    avg_nominal_total_payment = nominal_payment_sums.mean()
     
     # Calculate nominal investor payments
-    nominal_investor_payments_df = pd.DataFrame(nominal_investor_payment)
-    avg_nominal_investor_payment = np.sum(nominal_investor_payments_df, axis=0).mean()
+    nominal_investor_payment_sums = nominal_investor_payment.sum(axis=1)
+    avg_nominal_investor_payment = nominal_investor_payment_sums.mean()
     
     # Calculate nominal Malengo payments
-    nominal_malengo_payments_df = pd.DataFrame(nominal_malengo_payment)
-    avg_nominal_malengo_payment = np.sum(nominal_malengo_payments_df, axis=0).mean()
+    avg_nominal_malengo_payment = nominal_malengo_payment.sum(axis=1).mean()
     
     # Calculate nominal IRR values using the same duration as real IRR
-    if avg_nominal_total_payment > 0 and average_duration > 0:
-        nominal_IRR = np.log(max(1, avg_nominal_total_payment) / total_investment) / average_duration
-    else:
-        nominal_IRR = -0.1
-        
-    if avg_nominal_investor_payment > 0 and average_duration > 0:
-        nominal_investor_IRR = np.log(max(1, avg_nominal_investor_payment) / total_investment) / average_duration
-    else:
-        nominal_investor_IRR = -0.1
+    nominal_IRR = float(_calculate_irr(avg_nominal_total_payment, total_investment, average_duration))
+    nominal_investor_IRR = float(_calculate_irr(avg_nominal_investor_payment, total_investment, average_duration))
     
     # Calculate nominal payment quantiles
-    nominal_payment_quantiles = {}
-    for quantile in [0, 0.25, 0.5, 0.75, 1.0]:
-        nominal_quantile_payment = np.sum(nominal_payments_df, axis=0).quantile(quantile)
-        if nominal_quantile_payment > 0 and average_duration > 0:
-            nominal_payment_quantiles[quantile] = np.log(max(1, nominal_quantile_payment) / total_investment) / average_duration
-        else:
-            nominal_payment_quantiles[quantile] = -0.1 - (0.1 * (1-quantile))
+    nominal_payment_quantiles = _calculate_quantile_irrs(nominal_payment_sums, total_investment, average_duration)
     
     # Calculate nominal investor payment quantiles
-    nominal_investor_payment_quantiles = {}
-    for quantile in [0, 0.25, 0.5, 0.75, 1.0]:
-        nominal_investor_quantile_payment = np.sum(nominal_investor_payments_df, axis=0).quantile(quantile)
-        if nominal_investor_quantile_payment > 0 and average_duration > 0:
-            nominal_investor_payment_quantiles[quantile] = np.log(max(1, nominal_investor_quantile_payment) / total_investment) / average_duration
-        else:
-            nominal_investor_payment_quantiles[quantile] = -0.1 - (0.1 * (1-quantile))
+    nominal_investor_payment_quantiles = _calculate_quantile_irrs(nominal_investor_payment_sums, total_investment, average_duration)
     
     # Prepare nominal payment data for plotting
-    nominal_payment_by_year = nominal_payments_df.mean(axis=1)
-    nominal_investor_payment_by_year = nominal_investor_payments_df.mean(axis=1)
-    nominal_malengo_payment_by_year = nominal_malengo_payments_df.mean(axis=1)
+    nominal_payment_by_year = nominal_total_payment.mean(axis=0)
+    nominal_investor_payment_by_year = nominal_investor_payment.mean(axis=0)
+    nominal_malengo_payment_by_year = nominal_malengo_payment.mean(axis=0)
     
     return {
         # Real (inflation-adjusted) IRR values
@@ -1314,9 +1220,9 @@ def _calculate_summary_statistics(
         'payment_by_year': payment_by_year,
         'investor_payment_by_year': investor_payment_by_year,
         'malengo_payment_by_year': malengo_payment_by_year,
-        'payments_df': payments_df,
-        'investor_payments_df': investor_payments_df,
-        'malengo_payments_df': malengo_payments_df,
+        'payments_by_trial': total_payment,
+        'investor_payments_by_trial': investor_payment,
+        'malengo_payments_by_trial': malengo_payment,
         'payment_quantiles': payment_quantiles,
         'investor_payment_quantiles': investor_payment_quantiles,
         
@@ -1337,9 +1243,9 @@ def _calculate_summary_statistics(
         'nominal_payment_by_year': nominal_payment_by_year,
         'nominal_investor_payment_by_year': nominal_investor_payment_by_year,
         'nominal_malengo_payment_by_year': nominal_malengo_payment_by_year,
-        'nominal_payments_df': nominal_payments_df,
-        'nominal_investor_payments_df': nominal_investor_payments_df,
-        'nominal_malengo_payments_df': nominal_malengo_payments_df,
+        'nominal_payments_by_trial': nominal_total_payment,
+        'nominal_investor_payments_by_trial': nominal_investor_payment,
+        'nominal_malengo_payments_by_trial': nominal_malengo_payment,
         'nominal_payment_quantiles': nominal_payment_quantiles,
         'nominal_investor_payment_quantiles': nominal_investor_payment_quantiles,
         
@@ -1355,107 +1261,63 @@ def _calculate_summary_statistics(
     }
 
 
-def _calculate_simulation_statistics(
-    students: List[Student], 
-    num_students: int, 
-    num_years: int, 
+def _calculate_batch_statistics(
+    batch: Dict[str, np.ndarray],
+    num_students: int,
+    num_years: int,
     limit_years: int
-) -> Dict[str, Any]:
-    """Helper function to calculate statistics for a single simulation."""
-    # Track statistics for this simulation
-    students_employed = 0
-    students_made_payments = 0
-    students_hit_payment_cap = 0
-    students_hit_years_cap = 0
-    students_hit_no_cap = 0
-    
-    # Track repayments by category
-    total_repayment_cap_hit = 0
-    total_years_cap_hit = 0
-    total_no_cap_hit = 0
-    
-    # Track annual employment rates
-    annual_employment_rates = []
-    post_graduation_years = 0
-    
-    # For tracking the actual cap values 
-    cap_values = []
-    
-    # Count students in different categories
-    for student in students:
-        # Check if student was ever employed
-        was_employed = False
-        employment_periods = 0
-        post_grad_periods = 0
-        
-        for i in range(num_years):
-            if i >= student.degree.years_to_complete:
-                post_grad_periods += 1
-                if student.earnings[i] > 0:
-                    was_employed = True
-                    employment_periods += 1
-        
-        # Calculate this student's employment rate
-        if post_grad_periods > 0:
-            student_employment_rate = employment_periods / post_grad_periods
-        else:
-            student_employment_rate = 0
-            
-        # Add to total employment rate calculation
-        if post_grad_periods > 0:
-            annual_employment_rates.append(student_employment_rate)
-            post_graduation_years += post_grad_periods
-        
-        if was_employed:
-            students_employed += 1
-            
-        # Check if student made any payments
-        made_payment = sum(student.payments) > 0
-        if made_payment:
-            students_made_payments += 1
-            
-        # Check which cap (if any) the student hit
-        if student.hit_cap:
-            students_hit_payment_cap += 1
-            total_repayment_cap_hit += sum(student.real_payments)
-            cap_values.append(student.cap_value_when_hit)  # Store the cap value when hit
-        elif student.years_paid >= limit_years:
-            students_hit_years_cap += 1
-            total_years_cap_hit += sum(student.real_payments)
-        else:
-            if made_payment:  # Only count students who made payments
-                students_hit_no_cap += 1
-                total_no_cap_hit += sum(student.real_payments)
-    
-    # Calculate averages (with safe division)
-    avg_repayment_cap_hit = total_repayment_cap_hit / max(1, students_hit_payment_cap)
-    avg_repayment_years_hit = total_years_cap_hit / max(1, students_hit_years_cap)
-    avg_repayment_no_cap = total_no_cap_hit / max(1, students_hit_no_cap)
-    
-    # Calculate average annual employment rate
-    avg_annual_employment_rate = sum(annual_employment_rates) / max(1, len(annual_employment_rates))
-    
-    # Calculate average cap value (if any students hit it)
-    avg_cap_value = sum(cap_values) / max(1, len(cap_values)) if cap_values else 0
-    
-    # Return statistics
-    return {
-        'employment_rate': avg_annual_employment_rate,  # Changed to average annual employment rate
-        'ever_employed_rate': students_employed / num_students,  # Keep track of ever employed rate
-        'repayment_rate': students_made_payments / num_students,
-        'cap_stats': {
-            'payment_cap_count': students_hit_payment_cap,
-            'years_cap_count': students_hit_years_cap,
-            'no_cap_count': students_hit_no_cap,
-            'payment_cap_pct': students_hit_payment_cap / num_students,
-            'years_cap_pct': students_hit_years_cap / num_students,
-            'no_cap_pct': students_hit_no_cap / num_students,
-            'avg_repayment_cap_hit': avg_repayment_cap_hit,
-            'avg_repayment_years_hit': avg_repayment_years_hit,
-            'avg_repayment_no_cap': avg_repayment_no_cap,
-            'avg_cap_value': avg_cap_value
-        }
-    }
+) -> List[Dict[str, Any]]:
+    """Helper function to calculate employment, repayment and cap statistics for every trial of a batch."""
+    earnings = batch['Earnings']
+    payments = batch['Payments']
+    years_to_complete = batch['Years_To_Complete']
+    hit_cap = batch['Hit_Cap']
+    
+    # Employment is measured from the nominal completion year
+    post_grad_periods = np.maximum(0, num_years - years_to_complete)
+    after_completion = np.arange(num_years) >= years_to_complete[..., np.newaxis]
+    employment_periods = ((earnings > 0) & after_completion).sum(axis=-1)
+    has_post_grad = post_grad_periods > 0
+    student_employment_rate = np.where(has_post_grad, employment_periods / np.maximum(1, post_grad_periods), 0)
+    
+    made_payment = payments.sum(axis=-1, dtype=np.float64) > 0
+    real_payment_totals = batch['Real_Payments'].sum(axis=-1, dtype=np.float64)
+    hit_years_cap = ~hit_cap & (batch['Years_Paid'] >= limit_years)
+    hit_no_cap = ~hit_cap & ~hit_years_cap & made_payment
+    
+    # Per-trial counts and sums
+    employment_rate = student_employment_rate.sum(axis=1) / np.maximum(1, has_post_grad.sum(axis=1))
+    students_employed = (employment_periods > 0).sum(axis=1)
+    students_made_payments = made_payment.sum(axis=1)
+    payment_cap_count = hit_cap.sum(axis=1)
+    years_cap_count = hit_years_cap.sum(axis=1)
+    no_cap_count = hit_no_cap.sum(axis=1)
+    total_repayment_cap_hit = np.where(hit_cap, real_payment_totals, 0).sum(axis=1)
+    total_years_cap_hit = np.where(hit_years_cap, real_payment_totals, 0).sum(axis=1)
+    total_no_cap_hit = np.where(hit_no_cap, real_payment_totals, 0).sum(axis=1)
+    total_cap_value = np.where(hit_cap, batch['Cap_Value_When_Hit'], 0).sum(axis=1)
+    
+    stats = []
+    for trial in range(payments.shape[0]):
+        stats.append({
+            'employment_rate': employment_rate[trial],
+            'ever_employed_rate': students_employed[trial] / num_students,
+            'repayment_rate': students_made_payments[trial] / num_students,
+            'cap_stats': {
+                'payment_cap_count': payment_cap_count[trial],
+                'years_cap_count': years_cap_count[trial],
+                'no_cap_count': no_cap_count[trial],
+                'payment_cap_pct': payment_cap_count[trial] / num_students,
+                'years_cap_pct': years_cap_count[trial] / num_students,
+                'no_cap_pct': no_cap_count[trial] / num_students,
+                'avg_repayment_cap_hit': total_repayment_cap_hit[trial] / max(1, payment_cap_count[trial]),
+                'avg_repayment_years_hit': total_years_cap_hit[trial] / max(1, years_cap_count[trial]),
+                'avg_repayment_no_cap': total_no_cap_hit[trial] / max(1, no_cap_count[trial]),
+                'avg_cap_value': total_cap_value[trial] / max(1, payment_cap_count[trial])
+            }
+        })
+    
+    return stats
 
 
 def _create_degree_definitions(
@@ -1527,33 +1389,6 @@ def _create_degree_definitions(
     }
 
 
-def _create_students(
-    num_students: int, 
-    degrees: List[Degree], 
-    probs: List[float], 
-    num_years: int,
-    apply_graduation_delay: bool = False
-) -> List[Student]:
-    """Helper function to create and assign degrees to students."""
-    # Assign degrees to each student
-    test_array = np.array([np.random.multinomial(1, probs) for _ in range(num_students)])
-    degree_labels = np.array(degrees)[test_array.argmax(axis=1)]
-    
-    # Create student objects
-    students = []
-    for i in range(num_students):
-        student = Student(degree_labels[i], num_years)
-        if apply_graduation_delay:
-            # Apply graduation delay based on degree type
-            student.graduation_year = _calculate_graduation_delay(
-                student.degree.years_to_complete,
-                student.degree.name
-            )
-        students.append(student)
-    
-    return students
-
-
 def main():
     """
     Command-line entrypoint for running simulations.